@@ -0,0 +1,222 @@
+"""
+숙소 유형/지역/시설 태그 추출 (오프라인)
+
+콘텐츠명에서 숙소 유형을, 주소(없으면 좌표, 그것도 없으면 콘텐츠명의 지명)에서 지역을,
+부대시설기타 자유 입력에서 정규화된 시설 태그를 뽑습니다.
+파이프라인 accommodation 스테이지가 결과를 '숙소유형' / '지역' / '시설태그' 컬럼('|' 구분)으로
+게시하고, accommodation_index 가 이 컬럼으로 태그 -> 숙소 번호 역색인을 만듭니다.
+pandas 없이 동작하므로 기존 CSV에 컬럼만 덧붙일 때도 쓸 수 있습니다.
+
+    python accommodation_features.py data/golden_compass_accommodation_clean.csv
+"""
+import csv
+import re
+import sys
+from bisect import bisect_left
+
+TAG_SEPARATOR = '|'
+FEATURE_COLUMNS = ['숙소유형', '지역', '시설태그']
+
+# 먼저 나온 규칙이 우선합니다. 한 숙소가 여러 유형일 수 있습니다 (예: 풀빌라펜션).
+TYPE_RULES = [
+    ('풀빌라', ['풀빌라', '풀 빌라', 'pool villa']),
+    ('글램핑', ['글램핑', 'glamping']),
+    ('캠핑', ['캠핑', '캠프', '카라반', 'camp']),
+    ('모텔', ['모텔', 'motel']),
+    ('호텔', ['호텔', '리조트', '콘도', 'hotel', 'resort']),
+    ('펜션', ['펜션', 'pension']),
+]
+OTHER_TYPE = '기타'
+TYPE_OPTIONS = [name for name, _ in TYPE_RULES] + [OTHER_TYPE]
+
+# 주소의 행정구역 토큰('애월읍', '노형동', '일도2동' 등)에서 숫자와 읍/면/동을 뗀 이름 -> 시
+ADMIN_DISTRICTS = {
+    '제주시': ['한림', '애월', '구좌', '조천', '한경', '추자', '우도',
+             '일도', '이도', '삼도', '용담', '건입', '화북', '삼양', '봉개', '아라', '오라', '연동', '노형', '외도',
+             '이호', '도두'],
+    '서귀포시': ['대정', '남원', '성산', '안덕', '표선',
+              '송산', '정방', '중앙', '천지', '효돈', '영천', '동홍', '서홍', '대륜', '대천', '중문', '예래'],
+}
+_DISTRICT_REGION = {district: region for region, districts in ADMIN_DISTRICTS.items() for district in districts}
+
+# 주소도 좌표도 없을 때 숙소 이름에서 찾을 지명 (마을/명소). 두 시의 지명이 함께 나오면 판단하지 않습니다.
+# ('제주시'는 '제주시드니', '제주시티' 같은 이름과 겹치지 않게 뒤에 공백이 있을 때만 봅니다)
+REGION_RULES = [
+    ('서귀포시', ['서귀포', '중문', '성산', '표선', '남원', '안덕', '대정', '위미', '모슬포', '산방', '섭지',
+              '강정', '법환', '온평', '일출봉', '가파도', '마라도', '태흥', '신례', '하효', '쇠소깍', '화순', '대평',
+              '난드르', '색달', '송악', '신화월드', '월드컵']),
+    ('제주시', ['제주시 ', '애월', '한림', '협재', '금능', '조천', '함덕', '구좌', '월정', '세화', '한경', '추자', '우도',
+             '노형', '연동', '탑동', '하도', '종달', '북촌', '동복', '김녕', '평대', '귀덕', '곽지', '한담', '고산',
+             '차귀도', '월령', '판포', '유수암', '하귀', '용두암', '내도', '도두', '공항', '에코랜드', '비양도']),
+]
+REGION_OPTIONS = [name for name, _ in REGION_RULES]
+# 지역을 알 수 없는 숙소 ('지역' 컬럼은 비워 두고, 인덱스에서만 이 이름으로 묶습니다)
+UNKNOWN_REGION = '위치 미상'
+
+# 주소가 없을 때 좌표로 나누는 제주시/서귀포시 경계. 한라산 능선을 따라가는 대략적인 선 (경도, 위도)으로,
+# 선보다 북쪽(우도/추자도 포함)이면 제주시, 남쪽이면 서귀포시입니다.
+REGION_BOUNDARY = [
+    (126.10, 33.26), (126.20, 33.28), (126.30, 33.32), (126.45, 33.35), (126.53, 33.36),
+    (126.62, 33.38), (126.72, 33.41), (126.82, 33.44), (126.90, 33.47), (127.00, 33.49),
+]
+# 이 범위 밖 좌표는 잘못 찾은 결과로 보고 쓰지 않습니다. (위도 최소/최대, 경도 최소/최대)
+JEJU_BOUNDS = (33.0, 34.1, 126.0, 127.1)
+
+# 정규화 태그 -> 부대시설기타에서 찾을 표현
+FACILITY_SYNONYMS = {
+    '주차': ['주차'],
+    '스파': ['스파', '사우나', '노천탕', '월풀', '자쿠지', '온천', '히노끼'],
+    'OTT': ['ott', '넷플릭스', '티빙', '웨이브', '디즈니', '유튜브', '기가지니'],
+    '반려동물': ['반려', '애견', '애완', '펫'],
+    '수영장': ['수영장'],
+    '바베큐': ['바베큐', '바비큐', '뱌베큐', 'bbq'],
+    '취사': ['취사', '주방', '키친', '쿡탑'],
+    '카페': ['카페'],
+    '식당': ['식당', '레스토랑', '한식당'],
+    '노래방': ['노래방', '노래연습장'],
+    '키즈': ['키즈', '놀이터', '어린이'],
+    '세탁': ['세탁'],
+    '전기차 충전': ['전기차', '충전소'],
+}
+
+# 페이지 '시설/서비스' 선택지 -> 정규화 태그
+FACILITY_OPTIONS = {
+    '주차 가능': '주차',
+    '반려동물 동반': '반려동물',
+    '스파': '스파',
+    'OTT 제공': 'OTT',
+}
+
+_EMPTY_FACILITY = {'', '정보 없음', 'nan'}
+
+
+def _matches(text, needles):
+    text = text.lower()
+    return any(needle in text for needle in needles)
+
+
+def classify_types(name):
+    types = [type_name for type_name, needles in TYPE_RULES if _matches(name, needles)]
+    return types or [OTHER_TYPE]
+
+
+def region_from_address(address):
+    """
+    주소를 공백 단위 토큰으로 나눠 '제주시'/'서귀포시' 토큰, 없으면 읍/면/동 토큰(ADMIN_DISTRICTS)으로 판단합니다.
+    '서귀포로' 같은 도로명이나 다른 단어 속 지명은 토큰이 아니므로 보지 않습니다.
+    """
+    tokens = [token.strip(',()') for token in (address or '').split()]
+    for token in tokens:
+        if token in ADMIN_DISTRICTS:
+            return token
+    for token in tokens:
+        match = re.fullmatch(r'(.+?)\d*[읍면동]', token)
+        if match and match.group(1) in _DISTRICT_REGION:
+            return _DISTRICT_REGION[match.group(1)]
+    return ''
+
+
+def region_from_name(name):
+    """숙소 이름에 한 시의 지명(REGION_RULES)만 나오면 그 시, 없거나 두 시가 섞이면 ''."""
+    regions = {region for region, needles in REGION_RULES if name and _matches(name, needles)}
+    return regions.pop() if len(regions) == 1 else ''
+
+
+def region_from_coordinates(lat, lon):
+    """REGION_BOUNDARY 보다 북쪽이면 제주시, 남쪽이면 서귀포시. 좌표가 없거나 제주 밖이면 ''."""
+    try:
+        lat, lon = float(lat), float(lon)
+    except (TypeError, ValueError):
+        return ''
+    lat_min, lat_max, lon_min, lon_max = JEJU_BOUNDS
+    if not (lat_min <= lat <= lat_max and lon_min <= lon <= lon_max):   # NaN 도 여기서 걸러집니다
+        return ''
+
+    lons = [point[0] for point in REGION_BOUNDARY]
+    i = min(max(bisect_left(lons, lon), 1), len(REGION_BOUNDARY) - 1)
+    (lon0, lat0), (lon1, lat1) = REGION_BOUNDARY[i - 1], REGION_BOUNDARY[i]
+    boundary_lat = lat0 + (lat1 - lat0) * (min(max(lon, lon0), lon1) - lon0) / (lon1 - lon0)
+    return '제주시' if lat > boundary_lat else '서귀포시'
+
+
+def classify_region(name, address='', lat=None, lon=None):
+    """주소 -> 좌표 -> 숙소 이름의 지명 순으로 판단합니다. 알 수 없으면 ''."""
+    return region_from_address(address) or region_from_coordinates(lat, lon) or region_from_name(name)
+
+
+def facility_tokens(text):
+    """부대시설기타를 쉼표/슬래시 등으로 나눈 원문 항목 목록."""
+    if text is None or text.strip() in _EMPTY_FACILITY:
+        return []
+    return [token.strip() for token in re.split(r'[,/·|\n]+', text) if token.strip()]
+
+
+def extract_facilities(text, pet_allowed=False):
+    tokens = facility_tokens(text)
+    tags = [tag for tag, needles in FACILITY_SYNONYMS.items() if any(_matches(t, needles) for t in tokens)]
+    if pet_allowed and '반려동물' not in tags:
+        tags.append('반려동물')
+    return tags
+
+
+def join_tags(tags):
+    return TAG_SEPARATOR.join(tags)
+
+
+def split_tags(value):
+    if value is None or value != value or value == '':
+        return []
+    return str(value).split(TAG_SEPARATOR)
+
+
+def features(name, facility_text, pet_allowed=False, address='', lat=None, lon=None):
+    """{'숙소유형', '지역', '시설태그'} 컬럼 값."""
+    return {
+        '숙소유형': join_tags(classify_types(name)),
+        '지역': classify_region(name, address, lat, lon),
+        '시설태그': join_tags(extract_facilities(facility_text, pet_allowed)),
+    }
+
+
+def annotate_frame(df):
+    """숙소 DataFrame에 특징 컬럼을 추가한 사본을 반환합니다."""
+    n = len(df)
+    names = df['콘텐츠명'].astype(str)
+    texts = df['부대시설기타'].astype(str) if '부대시설기타' in df.columns else [''] * n
+    pets = df['애완동물동반허용여부'].astype(str) if '애완동물동반허용여부' in df.columns else ['X'] * n
+    addresses = df['주소'].fillna('').astype(str) if '주소' in df.columns else [''] * n
+    lats = df['lat'] if 'lat' in df.columns else [None] * n
+    lons = df['lon'] if 'lon' in df.columns else [None] * n
+
+    rows = [features(name, text, pet == 'O', address, lat, lon)
+            for name, text, pet, address, lat, lon in zip(names, texts, pets, addresses, lats, lons)]
+    df = df.copy()
+    for col in FEATURE_COLUMNS:
+        df[col] = [row[col] for row in rows]
+    return df
+
+
+def annotate_csv(path):
+    """게시된 숙소 CSV에 특징 컬럼을 (다시) 계산해 덧붙입니다."""
+    with open(path, encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        fieldnames = [name for name in reader.fieldnames if name not in FEATURE_COLUMNS]
+        rows = list(reader)
+
+    for row in rows:
+        row.update(features(row['콘텐츠명'], row.get('부대시설기타', ''),
+                            row.get('애완동물동반허용여부') == 'O', row.get('주소', ''),
+                            row.get('lat'), row.get('lon')))
+
+    with open(path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames + FEATURE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    return len(rows)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: python accommodation_features.py <accommodation_clean.csv>")
+        sys.exit(2)
+    print(f"{annotate_csv(sys.argv[1])}개 숙소에 유형/지역/시설태그 추가")
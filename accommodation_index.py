@@ -0,0 +1,149 @@
+"""
+숙소 필터용 비트마스크 인덱스
+
+O/X 편의 옵션 다섯 개를 숙소별 uint8 비트마스크 하나로 묶고, 등급은 정렬된 배열로 둡니다.
+체크박스/슬라이더 조합은 등급 구간 이진 탐색 + 비트 AND 한 번으로 풀리므로
+숙소 수가 늘어나도 중간 DataFrame을 만들지 않고, 같은 조합은 메모이즈된 결과를 돌려줍니다.
+
+지역/숙소유형/시설태그(accommodation_features)는 태그 -> 숙소 번호 역색인(posting list)으로 두고
+선택한 태그의 목록끼리 교집합(유형/지역은 합집합)으로 풉니다. 지역을 알 수 없는 숙소는
+accommodation_features.UNKNOWN_REGION('위치 미상') 태그로 묶어 지역 필터에 함께 넣을 수 있습니다.
+
+    index = accommodation_index.load_accommodation_index()
+    ids = index.filter((3, 5), ['조식제공여부'], types=['호텔', '펜션'], facilities=['주차'],
+                       regions=['제주시', accommodation_features.UNKNOWN_REGION])
+    index.frame(ids)
+"""
+import numpy as np
+
+import accommodation_features
+import data_loader
+
+# 비트 순서 = data_loader.OX_COLUMNS 순서
+AMENITY_BITS = {col: 1 << i for i, col in enumerate(data_loader.OX_COLUMNS)}
+
+
+class AccommodationIndex:
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        n = len(self.df)
+
+        self.masks = np.zeros(n, dtype=np.uint8)
+        for col, bit in AMENITY_BITS.items():
+            if col in self.df.columns:
+                self.masks |= np.where(self.df[col].astype(str).to_numpy() == 'O', bit, 0).astype(np.uint8)
+
+        grades = self.df['등급'].to_numpy(dtype=np.int64) if '등급' in self.df.columns else np.zeros(n, np.int64)
+        self.grades = grades
+        self._grade_order = np.argsort(grades, kind='stable')
+        self.sorted_grades = grades[self._grade_order]
+
+        names = self.df['콘텐츠명'].astype(str).to_numpy() if '콘텐츠명' in self.df.columns else np.array([''] * n)
+        self._name_rank = np.empty(n, dtype=np.int64)
+        self._name_rank[np.argsort(names, kind='stable')] = np.arange(n)
+
+        self.postings = {}
+        for col in accommodation_features.FEATURE_COLUMNS:
+            if col not in self.df.columns:
+                continue
+            lists = {}
+            for row_id, value in enumerate(self.df[col]):
+                for tag in accommodation_features.split_tags(value):
+                    lists.setdefault(tag, []).append(row_id)
+            self.postings[col] = {tag: np.array(ids, dtype=np.int64) for tag, ids in lists.items()}
+        if '지역' in self.df.columns:
+            untagged = np.flatnonzero(self.df['지역'].to_numpy() == '')
+            self.postings['지역'][accommodation_features.UNKNOWN_REGION] = untagged.astype(np.int64)
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.df)
+
+    @staticmethod
+    def required_mask(columns):
+        mask = 0
+        for col in columns:
+            mask |= AMENITY_BITS[col]
+        return mask
+
+    def has(self, row_id, col):
+        return bool(self.masks[row_id] & AMENITY_BITS[col])
+
+    def posting(self, col, tag):
+        return self.postings.get(col, {}).get(tag, np.empty(0, dtype=np.int64))
+
+    def count_untagged(self, col):
+        """col 값이 비어 있는 숙소 수 (예: 지역을 알 수 없는 숙소)."""
+        if col not in self.df.columns:
+            return len(self)
+        return int((self.df[col] == '').sum())
+
+    # --- 1. 필터 ---
+    def filter(self, grade_range=(0, 5), required=(), types=(), facilities=(), regions=()):
+        """
+        등급 구간(양끝 포함), 필수 옵션(모두 'O'), 숙소유형(하나라도), 시설태그(모두), 지역(하나라도)을
+        만족하는 행 번호 (원래 순서, 읽기 전용).
+        """
+        key = (int(grade_range[0]), int(grade_range[1]), self.required_mask(required),
+               tuple(sorted(types)), tuple(sorted(facilities)), tuple(sorted(regions)))
+        if key not in self._cache:
+            self._cache[key] = self._filter(*key)
+        return self._cache[key]
+
+    def _filter(self, low, high, required, types, facilities, regions):
+        start = np.searchsorted(self.sorted_grades, low, side='left')
+        stop = np.searchsorted(self.sorted_grades, high, side='right')
+        ids = self._grade_order[start:stop]
+        if required:
+            ids = ids[(self.masks[ids] & required) == required]
+        ids = np.sort(ids)
+
+        postings = [self.posting('시설태그', tag) for tag in facilities]
+        if regions:
+            postings.append(np.unique(np.concatenate([self.posting('지역', r) for r in regions])))
+        if types:
+            postings.append(np.unique(np.concatenate([self.posting('숙소유형', t) for t in types])))
+        # 짧은 목록부터 교집합해 중간 결과를 작게 유지합니다.
+        for posting in sorted(postings, key=len):
+            ids = np.intersect1d(ids, posting, assume_unique=True)
+
+        ids.setflags(write=False)
+        return ids
+
+    # --- 2. 정렬 / 페이지 ---
+    def sort(self, ids, order=None):
+        """
+        order: None(원래 순서) / 'grade_desc'(등급 높은 순) / 'name'(이름 순).
+        동률은 행 번호로 정렬하므로 리런마다 같은 순서가 보장됩니다.
+        """
+        if order == 'grade_desc':
+            return ids[np.lexsort((ids, -self.grades[ids]))]
+        if order == 'name':
+            return ids[np.lexsort((ids, self._name_rank[ids]))]
+        return ids
+
+    @staticmethod
+    def page_count(total, page_size):
+        return max(1, -(-total // page_size))
+
+    def page(self, ids, page, page_size):
+        """1부터 시작하는 page 번째 구간의 DataFrame만 만듭니다."""
+        start = (page - 1) * page_size
+        return self.frame(ids[start:start + page_size])
+
+    def frame(self, ids):
+        return self.df.iloc[ids]
+
+
+_index_cache = {'source': None, 'index': None}
+
+
+def load_accommodation_index():
+    """data_loader의 숙소 프레임이 바뀔 때만 다시 만드는 프로세스 공용 인덱스. 데이터가 없으면 None."""
+    df = data_loader.load_accommodation()
+    if df.empty:
+        return None
+    if _index_cache['source'] is not df:
+        _index_cache['index'] = AccommodationIndex(df)
+        _index_cache['source'] = df
+    return _index_cache['index']
@@ -0,0 +1,101 @@
+"""
+자동 코스 날짜 묶기: sklearn KMeans vs day_clustering (NumPy 균형 k-means) 벤치마크
+
+- import: 새 파이썬 프로세스에서 모듈을 import 하는 시간 (페이지 첫 로딩 비용)
+- fit   : 찜 목록 크기(n)/일수(k)별 묶기 시간 중앙값 (day_clustering 은 메모이즈 전 / 후)
+- 균형  : 하루 장소 수의 최대-최소 차이 (중앙값)
+- 거리 제곱합: 묶음 내 거리 제곱합의 KMeans 대비 비율 (균형을 맞춘 만큼 1.00 보다 큼)
+
+좌표는 제주 범위 안 무작위 값이며, scikit-learn 이 없으면 KMeans 열은 건너뜁니다.
+
+사용법:
+    python benchmarks/bench_clustering.py [--trials 20] [--seed 0]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import numpy as np  # noqa: E402
+
+import day_clustering  # noqa: E402
+
+try:
+    from sklearn.cluster import KMeans
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+JEJU_LAT = (33.20, 33.56)
+JEJU_LON = (126.16, 126.94)
+CASES = [(6, 2), (9, 3), (12, 4), (20, 5), (30, 7)]
+
+
+def measure_import(statement):
+    code = f"import time; s = time.perf_counter(); {statement}; print(time.perf_counter() - s)"
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip())
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def spread(labels, k):
+    counts = np.bincount(np.asarray(labels), minlength=k)
+    return int(counts.max() - counts.min())
+
+
+def inertia(points, labels, k):
+    labels = np.asarray(labels)
+    return sum(((points[labels == c] - points[labels == c].mean(axis=0)) ** 2).sum() for c in range(k))
+
+
+def kmeans_labels(coords, k):
+    return KMeans(n_clusters=k, random_state=42, n_init=10).fit_predict(coords)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trials', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    print(f"import day_clustering : {measure_import('import day_clustering') * 1000:8.1f} ms")
+    if SKLEARN_AVAILABLE:
+        print(f"import sklearn.cluster: {measure_import('from sklearn.cluster import KMeans') * 1000:8.1f} ms")
+    print()
+
+    print(f"{'n':>3} {'k':>2} {'kmeans(ms)':>11} {'balanced(ms)':>13} {'memo(us)':>9} "
+          f"{'spread km':>10} {'spread bal':>11} {'SSE ratio':>10}")
+    for n, k in CASES:
+        kmeans_ms, balanced_ms, memo_us, kmeans_spread, balanced_spread, ratios = [], [], [], [], [], []
+        for _ in range(args.trials):
+            coords = np.column_stack([rng.uniform(*JEJU_LAT, n), rng.uniform(*JEJU_LON, n)])
+            labels, elapsed = timed(day_clustering.cluster_days, coords.tolist(), k)
+            balanced_ms.append(elapsed)
+            memo_us.append(timed(day_clustering.cluster_days, coords.tolist(), k)[1] * 1000)
+            balanced_spread.append(spread(labels, k))
+            if SKLEARN_AVAILABLE:
+                km_labels, elapsed = timed(kmeans_labels, coords, k)
+                kmeans_ms.append(elapsed)
+                kmeans_spread.append(spread(km_labels, k))
+                ratios.append(inertia(coords, labels, k) / inertia(coords, km_labels, k))
+
+        def cell(values, width, fmt):
+            return f"{format(statistics.median(values), fmt):>{width}}" if values else f"{'-':>{width}}"
+
+        print(f"{n:3d} {k:2d} {cell(kmeans_ms, 11, '.2f')} {cell(balanced_ms, 13, '.2f')} {cell(memo_us, 9, '.0f')} "
+              f"{cell(kmeans_spread, 10, '.1f')} {cell(balanced_spread, 11, '.1f')} {cell(ratios, 10, '.2f')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+data/ 로딩 경로별 cold/warm 벤치마크
+
+- CSV   : jeju_places_with_auto_keywords.csv 파싱 + 파생 컬럼(search_blob, naver_map_url)
+- XLSX  : jeju_places_mean.xlsx (openpyxl) 파싱 + naver_map_url
+- feather: data/snapshots/*.feather 메모리 맵 읽기 (파생 컬럼 포함)
+
+cold = 새 파이썬 프로세스에서 pandas import 이후 첫 로드 시간
+warm = 같은 프로세스에서 반복 로드한 시간의 중앙값 (프로세스 캐시는 거치지 않음)
+
+사용법:
+    python data_loader.py build-snapshots
+    python benchmarks/bench_data_load.py [--repeat 20]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import data_loader  # noqa: E402
+
+TARGETS = [
+    ('csv', data_loader.PLACES_KEYWORDS_FILE),
+    ('xlsx', data_loader.PLACES_MEAN_FILE),
+    ('feather', data_loader.PLACES_KEYWORDS_FILE),
+    ('feather', data_loader.PLACES_MEAN_FILE),
+]
+
+
+def load_source(file_name):
+    return data_loader._PARSERS[file_name](data_loader.data_file(file_name))
+
+
+def load_snapshot(file_name):
+    from pyarrow import feather
+    return feather.read_table(data_loader.snapshot_file(file_name), memory_map=True).to_pandas()
+
+
+LOADERS = {'csv': 'load_source', 'xlsx': 'load_source', 'feather': 'load_snapshot'}
+
+
+def measure_cold(kind, file_name):
+    """새 프로세스에서 첫 로드 시간을 잽니다. (pandas import 시간은 제외)"""
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--cold-one', kind, file_name],
+        capture_output=True, text=True, check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def run_cold_one(kind, file_name):
+    import pandas  # noqa: F401
+    loader = globals()[LOADERS[kind]]
+    start = time.perf_counter()
+    loader(file_name)
+    print(time.perf_counter() - start)
+
+
+def measure_warm(kind, file_name, repeat):
+    loader = globals()[LOADERS[kind]]
+    loader(file_name)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loader(file_name)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--cold-one', nargs=2, metavar=('KIND', 'FILE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.cold_one:
+        run_cold_one(*args.cold_one)
+        return
+
+    print(f"{'path':8} {'file':40} {'cold(ms)':>10} {'warm(ms)':>10}")
+    for kind, file_name in TARGETS:
+        if kind == 'feather' and not os.path.exists(data_loader.snapshot_file(file_name)):
+            print(f"{kind:8} {file_name:40} 스냅샷 없음 (python data_loader.py build-snapshots)")
+            continue
+        try:
+            cold = measure_cold(kind, file_name)
+            warm = measure_warm(kind, file_name, args.repeat)
+        except Exception as e:
+            print(f"{kind:8} {file_name:40} 실패: {e}")
+            continue
+        print(f"{kind:8} {file_name:40} {cold * 1000:10.1f} {warm * 1000:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+예측 모델 rolling-origin 백테스트 + 비용 벤치마크
+
+캘린더_시각화.ipynb 가 예측하는 다섯 시계열(총 입도객, 렌터카/전세버스 가동률,
+한라산 탐방객, 골프장 내장객)에 대해 예측 시작점을 한 달씩 옮겨 가며
+1~H개월 앞을 예측하고, 모델별로 아래를 기록합니다.
+
+- 예측 거리(horizon)별 MAE / MAPE
+- 시작점당 적합(fit) / 예측(forecast) 소요 시간 (평균, 최대)
+- 적합+예측 중 최대 메모리 (tracemalloc 기준 파이썬/NumPy 할당 peak)
+  * tracemalloc 은 할당마다 추적 비용이 들어 시간을 부풀리므로, 시간은 추적 없이 재고
+    메모리는 같은 시작점을 한 번 더 실행하는 별도 단계에서 잽니다.
+
+모델
+- seasonal_naive : 12개월 전 값 (기준선)
+- sarima<차수>   : 시작점마다 SARIMAX 재적합 (--order 로 추가, 기본은 노트북의 (1,1,1)(1,1,1,12))
+- stored_filter  : data/golden_compass_forecast_params.json 파라미터로 칼만 필터만 (재적합 없음)
+                   * 파라미터를 전체 구간으로 적합했으므로 오차는 낙관적이며, 비용 비교용입니다.
+
+시계열은 파이프라인 캐시(base_index, series_hallasan, series_golf)에서 가져옵니다.
+(publish=False 로 열어 data/ 의 게시 파일은 건드리지 않습니다)
+
+사용법:
+    python benchmarks/bench_forecast.py [--horizon 6] [--min-train 24] [--order 1,1,1,1,1,1]
+                                        [--output benchmarks/results/forecast_backtest.json]
+"""
+import argparse
+import datetime
+import json
+import math
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import numpy as np  # noqa: E402
+
+from pipeline import Pipeline, forecasting, order_search  # noqa: E402
+from pipeline.dag import CACHE_DIR, RAW_DIR  # noqa: E402
+from pipeline.stages import BASE_METRICS  # noqa: E402
+
+DEFAULT_ORDERS = [((1, 1, 1), (1, 1, 1, 12))]
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, 'benchmarks', 'results', 'forecast_backtest.json')
+
+
+# --- 1. 시계열 ---
+def load_series(raw_dir=RAW_DIR, cache_dir=CACHE_DIR):
+    pipeline = Pipeline(raw_dir=raw_dir, cache_dir=cache_dir, log=lambda message: None, publish=False)
+    df_base = pipeline.result('base_index').set_index('날짜').sort_index()
+    series_dict = {metric: df_base[metric].asfreq('MS') for metric in BASE_METRICS}
+    series_dict['한라산 탐방객'] = pipeline.result('series_hallasan').asfreq('MS')
+    series_dict['골프장 내장객(도외)'] = pipeline.result('series_golf').asfreq('MS')
+    return series_dict
+
+
+# --- 2. 모델 (fit -> forecast 두 단계로 나눠 시간을 잽니다) ---
+def seasonal_naive_fit(train):
+    return train
+
+
+def seasonal_naive_forecast(train, steps):
+    return np.array([train.iloc[len(train) - 12 + (i % 12)] for i in range(steps)], dtype=float)
+
+
+def sarima_model(order, seasonal_order):
+    def fit(train):
+        return order_search._fit(train, order, seasonal_order)
+
+    def forecast(fitted, steps):
+        return np.asarray(fitted.forecast(steps=steps), dtype=float)
+    return fit, forecast
+
+
+def stored_filter_model(entry):
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    def fit(train):
+        model = SARIMAX(train,
+                        order=tuple(entry['order']),
+                        seasonal_order=tuple(entry['seasonal_order']),
+                        enforce_stationarity=False,
+                        enforce_invertibility=False)
+        return model.filter(np.asarray(entry['params'], dtype=float))
+
+    def forecast(fitted, steps):
+        return np.asarray(fitted.forecast(steps=steps), dtype=float)
+    return fit, forecast
+
+
+def build_models(name, orders):
+    models = {'seasonal_naive': (seasonal_naive_fit, seasonal_naive_forecast)}
+    for order, seasonal_order in orders:
+        models[f"sarima{order_search.order_key(order, seasonal_order)}"] = sarima_model(order, seasonal_order)
+    entry = forecasting.load_store().get(name)
+    if entry is not None:
+        models['stored_filter'] = stored_filter_model(entry)
+    return models
+
+
+# --- 3. 백테스트 ---
+def backtest(series, fit, forecast, horizon, min_train):
+    """시작점마다 fit/forecast를 실행해 horizon별 오차와 비용을 모읍니다."""
+    errors = [[] for _ in range(horizon)]
+    fit_times, forecast_times, failures = [], [], 0
+    origins = range(min_train, len(series))
+
+    # 1) 오차 + 시간 (tracemalloc 없이)
+    for origin in origins:
+        train = series.iloc[:origin]
+        actual = series.iloc[origin:origin + horizon].to_numpy(dtype=float)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                start = time.perf_counter()
+                fitted = fit(train)
+                fit_times.append(time.perf_counter() - start)
+                start = time.perf_counter()
+                predicted = forecast(fitted, len(actual))
+                forecast_times.append(time.perf_counter() - start)
+        except Exception:
+            failures += 1
+            continue
+
+        predicted = np.clip(predicted, 0, None)
+        for h, (p, a) in enumerate(zip(predicted, actual)):
+            errors[h].append((p, a))
+
+    # 2) 최대 메모리 (같은 시작점을 추적하며 다시 실행, 시간은 재지 않음)
+    peaks = []
+    for origin in origins:
+        train = series.iloc[:origin]
+        steps = len(series.iloc[origin:origin + horizon])
+        tracemalloc.start()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                forecast(fit(train), steps)
+        except Exception:
+            continue
+        finally:
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+    return {
+        'origins': len(series) - min_train,
+        'failures': failures,
+        'horizons': [_horizon_metrics(h + 1, pairs) for h, pairs in enumerate(errors)],
+        'fit_seconds': _summary(fit_times),
+        'forecast_seconds': _summary(forecast_times),
+        'peak_memory_mb': max(peaks) / 2 ** 20 if peaks else math.nan,
+    }
+
+
+def _horizon_metrics(h, pairs):
+    if not pairs:
+        return {'h': h, 'n': 0, 'mae': math.nan, 'mape': math.nan}
+    predicted, actual = np.array(pairs).T
+    nonzero = actual != 0
+    mape = (float(np.mean(np.abs((predicted[nonzero] - actual[nonzero]) / actual[nonzero])) * 100)
+            if nonzero.any() else math.nan)
+    return {'h': h, 'n': len(pairs), 'mae': float(np.mean(np.abs(predicted - actual))), 'mape': mape}
+
+
+def _summary(samples):
+    if not samples:
+        return {'mean': math.nan, 'max': math.nan, 'total': 0.0}
+    return {'mean': float(np.mean(samples)), 'max': float(np.max(samples)), 'total': float(np.sum(samples))}
+
+
+# --- 4. 실행 / 보고서 ---
+def parse_order(text):
+    values = [int(v) for v in text.split(',')]
+    if len(values) != 6:
+        raise argparse.ArgumentTypeError("p,d,q,P,D,Q 여섯 개 값이 필요합니다.")
+    return tuple(values[:3]), tuple(values[3:]) + (order_search.SEASONAL_PERIOD,)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--horizon', type=int, default=6)
+    parser.add_argument('--min-train', type=int, default=24, help="첫 예측 시작점까지의 학습 개월 수")
+    parser.add_argument('--order', type=parse_order, action='append', metavar='p,d,q,P,D,Q',
+                        help="재적합 백테스트할 SARIMA 차수 (여러 번 지정 가능)")
+    parser.add_argument('--raw-dir', default=RAW_DIR)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+
+    series_dict = load_series(args.raw_dir)
+    report = {
+        'generated_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'horizon': args.horizon,
+        'min_train': args.min_train,
+        'series': {},
+    }
+
+    print(f"{'series':22} {'model':34} {'MAE(h=1)':>12} {'MAPE(h=1)':>10} {'MAPE(avg)':>10} "
+          f"{'fit(ms)':>9} {'fcst(ms)':>9} {'peak(MB)':>9}")
+    for name, series in series_dict.items():
+        series = series.dropna()
+        if len(series) <= args.min_train:
+            print(f"{name:22} 데이터 부족 ({len(series)}개월)")
+            continue
+        report['series'][name] = {'observations': len(series),
+                                  'end': series.index.max().strftime('%Y-%m-%d'),
+                                  'models': {}}
+        for model_name, (fit, forecast) in build_models(name, args.order or DEFAULT_ORDERS).items():
+            result = backtest(series, fit, forecast, args.horizon, args.min_train)
+            report['series'][name]['models'][model_name] = result
+            first = result['horizons'][0]
+            mean_mape = np.nanmean([h['mape'] for h in result['horizons']])
+            print(f"{name:22} {model_name:34} {first['mae']:12.4g} {first['mape']:10.2f} {mean_mape:10.2f} "
+                  f"{result['fit_seconds']['mean'] * 1000:9.1f} {result['forecast_seconds']['mean'] * 1000:9.1f} "
+                  f"{result['peak_memory_mb']:9.2f}")
+
+    os.makedirs(os.path.dirname(args.output), exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"보고서: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
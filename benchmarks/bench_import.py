@@ -0,0 +1,144 @@
+"""
+페이지 진입점별 cold import 시간 (-X importtime) + 예산 검사
+
+각 진입점(streamlit_app.py, pages/*.py, jeju_active_senior_spots.py)의 모듈 최상위 import 문만
+ast 로 뽑아, 새 파이썬 프로세스에서 `python -X importtime` 으로 실행하고 시간을 잽니다.
+(페이지 본문은 실행하지 않으므로 데이터 로딩/네트워크 시간은 포함되지 않습니다)
+
+streamlit + pandas 는 모든 페이지가 반드시 쓰므로 같은 프로세스에서 먼저 불러 기준선(baseline)으로 재고,
+그 뒤 페이지 import 가 새로 불러온 모듈 시간(extra)만 따로 셉니다. (인터프리터 시작 시간은 제외)
+extra 가 예산(BUDGET_MS, 페이지별 PAGE_BUDGETS_MS)을 넘으면 목록을 출력하고 종료 코드 1로 끝납니다.
+값은 --repeat 번 잰 중앙값입니다.
+
+사용법:
+    python benchmarks/bench_import.py [--repeat 5] [--budget-ms 150] [--top 5] [--output ...json]
+"""
+import argparse
+import ast
+import glob
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE_MODULES = ['streamlit', 'pandas']
+BUDGET_MS = 150
+# 페이지 기능상 무거운 모듈을 미리 불러와야 하는 진입점만 따로 지정합니다.
+PAGE_BUDGETS_MS = {}
+
+
+def entry_points():
+    pages = sorted(glob.glob(os.path.join(ROOT_DIR, 'pages', '*.py')))
+    return [os.path.join(ROOT_DIR, 'streamlit_app.py')] + pages + [os.path.join(ROOT_DIR, 'jeju_active_senior_spots.py')]
+
+
+def top_level_imports(path):
+    """
+    모듈 최상위 import 문을 실행할 코드 목록. 최상위 try 안의 import(선택 의존성)는
+    실패해도 넘어가도록 감쌉니다.
+    """
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    tree = ast.parse(source)
+    statements = []
+
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append(ast.get_source_segment(source, node))
+        elif isinstance(node, ast.Try):
+            for inner in node.body:
+                if isinstance(inner, (ast.Import, ast.ImportFrom)):
+                    statement = ast.get_source_segment(source, inner)
+                    statements.append(f"try:\n    {statement}\nexcept ImportError:\n    pass")
+    return statements
+
+
+MARKER = '@@page-imports'
+
+
+def run_importtime(statements):
+    """
+    기준선 import 후 statements 를 실행한 새 프로세스의 -X importtime 결과.
+    (기준선 ms, {페이지가 새로 부른 최상위 모듈: 누적 ms}). import 에 실패하면 RuntimeError.
+    """
+    code = "\n".join(
+        ["import sys"] + [f"import {module}" for module in BASELINE_MODULES]
+        + [f"sys.stderr.write('{MARKER}\\n')"] + statements
+    )
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=ROOT_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+
+    baseline, modules, in_page = 0.0, {}, False
+    for line in result.stderr.splitlines():
+        if line == MARKER:
+            in_page = True
+            continue
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if name[1:].startswith(' '):   # 들여쓰기된 줄 = 다른 모듈이 부른 import (상위 줄 누적에 포함)
+            continue
+        name = name.strip()
+        if in_page:
+            modules[name] = int(cumulative) / 1000
+        elif name in BASELINE_MODULES:
+            baseline += int(cumulative) / 1000
+    return baseline, modules
+
+
+def measure(statements, repeat):
+    """(기준선 ms, 페이지 extra ms, {모듈: ms}) 중앙값."""
+    runs = [run_importtime(statements) for _ in range(repeat)]
+    baseline = statistics.median(run[0] for run in runs)
+    extra = statistics.median(sum(run[1].values()) for run in runs)
+    names = {name for run in runs for name in run[1]}
+    modules = {name: statistics.median(run[1].get(name, 0.0) for run in runs) for name in names}
+    return baseline, extra, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS)
+    parser.add_argument('--top', type=int, default=5, help="페이지별로 보여 줄 무거운 모듈 수")
+    parser.add_argument('--output', default=None, help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    print(f"{'entry point':36} {'baseline(ms)':>12} {'extra(ms)':>10} {'budget':>7}  heaviest")
+
+    report, over_budget = {'baseline_modules': BASELINE_MODULES, 'entry_points': {}}, []
+    for path in entry_points():
+        name = os.path.relpath(path, ROOT_DIR)
+        try:
+            baseline, extra, modules = measure(top_level_imports(path), args.repeat)
+        except RuntimeError as e:
+            print(f"{name:36} 실패: {e}")
+            over_budget.append(name)
+            continue
+        budget = PAGE_BUDGETS_MS.get(name, args.budget_ms)
+        heaviest = sorted(((ms, module) for module, ms in modules.items()), reverse=True)
+        heaviest_text = ", ".join(f"{module} {ms:.0f}" for ms, module in heaviest[:args.top])
+        flag = "" if extra <= budget else "  <-- 예산 초과"
+        print(f"{name:36} {baseline:12.1f} {extra:10.1f} {budget:7.0f}  {heaviest_text}{flag}")
+        report['entry_points'][name] = {'baseline_ms': baseline, 'extra_ms': extra, 'budget_ms': budget, 'modules_ms': modules}
+        if extra > budget:
+            over_budget.append(name)
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+
+    if over_budget:
+        print(f"\n예산 초과: {', '.join(over_budget)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""
+방문 순서 엔진(route_planner) 벤치마크
+
+- 작은 문제(기본 5~9곳): 모든 순열 비교(brute force) 최적해 대비 총 이동 시간 차이(%)와 소요 시간
+- 큰 문제(기본 20, 30, 50곳): route_planner.order_route 소요 시간만
+
+이동 시간 행렬은 제주 범위 안의 무작위 좌표로 travel_matrix.estimate(직선거리 기반 추정)를 만들고,
+실제 도로처럼 방향마다 다르도록 0~20% 잡음을 곱합니다. (API 호출 없음)
+
+사용법:
+    python benchmarks/bench_route.py [--trials 20] [--seed 0]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import route_planner  # noqa: E402
+from travel_matrix import estimate  # noqa: E402
+
+JEJU_LAT = (33.20, 33.56)
+JEJU_LON = (126.16, 126.94)
+SMALL_SIZES = [5, 6, 7, 8, 9]
+LARGE_SIZES = [20, 30, 50]
+
+
+def random_costs(n, rng):
+    points = [(rng.uniform(*JEJU_LAT), rng.uniform(*JEJU_LON)) for _ in range(n)]
+    return [[0.0 if i == j else estimate(a, b)[1] * rng.uniform(1.0, 1.2)
+             for j, b in enumerate(points)] for i, a in enumerate(points)]
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--trials', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'n':>4} {'gap mean(%)':>12} {'gap max(%)':>11} {'optimal':>8} {'heuristic(ms)':>14} {'brute(ms)':>10}")
+    for n in SMALL_SIZES:
+        gaps, heuristic_times, brute_times = [], [], []
+        for _ in range(args.trials):
+            costs = random_costs(n, rng)
+            route, heuristic_seconds = timed(route_planner.order_route, costs)
+            best, brute_seconds = timed(route_planner.brute_force, costs)
+            optimum = route_planner.route_cost(best, costs)
+            gaps.append((route_planner.route_cost(route, costs) / optimum - 1) * 100)
+            heuristic_times.append(heuristic_seconds * 1000)
+            brute_times.append(brute_seconds * 1000)
+        optimal = sum(gap < 1e-6 for gap in gaps)
+        print(f"{n:4d} {statistics.mean(gaps):12.2f} {max(gaps):11.2f} {optimal:4d}/{args.trials:<3d} "
+              f"{statistics.median(heuristic_times):14.2f} {statistics.median(brute_times):10.1f}")
+
+    print()
+    print(f"{'n':>4} {'heuristic median(ms)':>21} {'max(ms)':>9}")
+    for n in LARGE_SIZES:
+        times = [timed(route_planner.order_route, random_costs(n, rng))[1] * 1000 for _ in range(args.trials)]
+        print(f"{n:4d} {statistics.median(times):21.2f} {max(times):9.2f}")
+
+
+if __name__ == "__main__":
+    main()
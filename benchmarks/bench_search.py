@@ -0,0 +1,69 @@
+"""
+맛집 검색 벤치마크: 기존 str.contains 전체 스캔 vs place_search 역색인
+
+검색어마다 아래를 잽니다. (인덱스 메모이즈는 매번 비우고 잽니다)
+- scan : df.copy() + search_blob.str.contains(검색어) (이전 pages/9_smart_food.py 방식)
+- index: place_search.PlaceSearchIndex.search(검색어)
+  초성("ㅎㄷㅈ"), 덜 조합한 글자("흑돼ㅈ"), 한 자모 오타("흑돼쥐")는 jamo_index 를 거칩니다.
+  (기존 방식은 이런 검색어에서 0곳)
+
+사용법:
+    python benchmarks/bench_search.py [--repeat 50] [--query 흑돼지 --query "고기 한식" ...]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import data_loader  # noqa: E402
+import place_search  # noqa: E402
+
+DEFAULT_QUERIES = ['흑돼지', '갈치', '제주', '국수', '고기 한식', '스타벅스', '애월 흑돼지', '없는말',
+                   'ㅎㄷㅈ', '흑돼ㅈ', '흑됒', '흑돼쥐', '스타벅수', 'ㅎㄷㅈ 애월']
+
+
+def scan(df, query):
+    df_filtered = df.copy()
+    return df_filtered[df_filtered['search_blob'].str.contains(query, na=False)]
+
+
+def median_us(func, repeat, before=None):
+    times = []
+    for _ in range(repeat):
+        if before is not None:
+            before()
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50)
+    parser.add_argument('--query', action='append', default=None)
+    args = parser.parse_args()
+
+    df = data_loader.load_places_keywords()
+    if df.empty:
+        print(f"카탈로그가 없습니다: {data_loader.data_file(data_loader.PLACES_KEYWORDS_FILE)}")
+        return 1
+
+    start = time.perf_counter()
+    index = place_search.PlaceSearchIndex(df)
+    print(f"build: {(time.perf_counter() - start) * 1000:.1f} ms ({len(df)} rows, {len(index.postings)} grams)")
+    print(f"{'query':16} {'scan(us)':>10} {'index(us)':>10} {'hits scan':>10} {'hits index':>11}")
+    for query in args.query or DEFAULT_QUERIES:
+        scan_us = median_us(lambda: scan(df, query), args.repeat)
+        index_us = median_us(lambda: index.search(query), args.repeat, before=index._cache.clear)
+        # scan 은 search_blob 한 줄(공백 포함)에서 찾으므로 여러 낱말 검색어는 결과 수가 다를 수 있습니다.
+        print(f"{query:16} {scan_us:10.0f} {index_us:10.0f} {len(scan(df, query)):10d} {len(index.search(query)):11d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""
+공간 인덱스(spatial_index) 벤치마크: 1배 / 100배 카탈로그
+
+맛집 카탈로그(jeju_places_with_auto_keywords.csv) 좌표를 그대로(1배), 또는 각 장소 주변 ±JITTER_KM
+안에 무작위로 복제해 100배로 늘린 뒤 아래를 잽니다.
+
+- build : 인덱스 생성 시간
+- radius: 반경 --radius km 검색 시간 중앙값 / 평균 결과 수
+- knn   : 최근접 --k 곳 검색 시간 중앙값
+- brute : 전체 거리 계산(NumPy) 후 정렬하는 kNN 시간 중앙값 (비교용)
+
+검색 지점은 카탈로그 장소 좌표 중 무작위로 고르며, 결과는 brute force 와 같은지 확인합니다.
+
+사용법:
+    python benchmarks/bench_spatial.py [--queries 500] [--radius 3] [--k 10] [--scales 1,100]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+import data_loader  # noqa: E402
+import spatial_index  # noqa: E402
+
+JITTER_KM = 0.5
+
+
+def scaled_catalog(df, scale, rng):
+    if scale == 1:
+        return df[['lat', 'lon']].reset_index(drop=True)
+    lat = np.repeat(df['lat'].to_numpy(), scale)
+    lon = np.repeat(df['lon'].to_numpy(), scale)
+    lat = lat + rng.uniform(-JITTER_KM, JITTER_KM, len(lat)) / spatial_index.KM_PER_DEG_LAT
+    km_per_deg_lon = spatial_index.KM_PER_DEG_LON_EQUATOR * np.cos(np.radians(lat))
+    lon = lon + rng.uniform(-JITTER_KM, JITTER_KM, len(lon)) / km_per_deg_lon
+    return pd.DataFrame({'lat': lat, 'lon': lon})
+
+
+def timed_us(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--radius', type=float, default=3.0)
+    parser.add_argument('--k', type=int, default=10)
+    parser.add_argument('--scales', default='1,100')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    base = data_loader.load_places_keywords()
+    if base.empty:
+        print(f"카탈로그가 없습니다: {data_loader.data_file(data_loader.PLACES_KEYWORDS_FILE)}")
+        return 1
+
+    print(f"{'scale':>5} {'rows':>8} {'build(ms)':>10} {'radius(us)':>11} {'hits':>7} {'knn(us)':>8} {'brute(us)':>10}")
+    for scale in (int(s) for s in args.scales.split(',')):
+        df = scaled_catalog(base, scale, rng)
+        start = time.perf_counter()
+        index = spatial_index.SpatialIndex(df)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        radius_us, knn_us, brute_us, hits = [], [], [], []
+        for row in rng.integers(len(base), size=args.queries):
+            lat, lon = base['lat'].iat[row], base['lon'].iat[row]
+            (ids, _), elapsed = timed_us(index.radius, lat, lon, args.radius)
+            radius_us.append(elapsed)
+            hits.append(len(ids))
+            (_, knn_dist), elapsed = timed_us(index.nearest, lat, lon, args.k)
+            knn_us.append(elapsed)
+
+            start = time.perf_counter()
+            distances = np.hypot(*(index.xy - index.project([lat], [lon])[0]).T)
+            brute = np.sort(np.partition(distances, args.k - 1)[:args.k])
+            brute_us.append((time.perf_counter() - start) * 1e6)
+            assert np.allclose(knn_dist, brute), "kNN 결과가 brute force 와 다릅니다"
+
+        print(f"{scale:5d} {len(df):8d} {build_ms:10.1f} {statistics.median(radius_us):11.1f} "
+              f"{statistics.mean(hits):7.0f} {statistics.median(knn_us):8.1f} {statistics.median(brute_us):10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+로컬 가짜 Kakao API 서버 (지오코딩 작업/HTTP 클라이언트 시험용)
+
+실제 API와 같은 경로/응답 형식으로, 검색어에서 결정적으로 만든 주소와 제주도 안의 좌표를 돌려줍니다.
+    GET /v2/local/search/keyword.json?query=...&size=N   -> {"documents": [...], "meta": {...}}
+    GET /v1/directions?origin=x,y&destination=x,y        -> {"routes": [{"summary": {...}}]}
+    GET /__stats                                         -> 경로별 요청 수
+
+- 검색어에 '폐업' 이 들어 있으면 빈 결과를 돌려줍니다. (not_found 경로 확인용)
+- --latency 초만큼 응답을 늦추고, --error-rate 비율로 500을, 초당 --max-qps 를 넘으면 429를 돌려줍니다.
+- Authorization 헤더가 'KakaoAK '로 시작하지 않으면 401.
+
+    python benchmarks/fake_kakao_server.py --port 8765 [--latency 0.05] [--error-rate 0.1] [--max-qps 20]
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+import urllib.parse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 제주도 대략적인 범위 (위도, 경도)
+LAT_RANGE = (33.20, 33.55)
+LON_RANGE = (126.15, 126.95)
+DISTRICTS = ['제주시 애월읍', '제주시 노형동', '제주시 조천읍', '서귀포시 중문동', '서귀포시 성산읍', '서귀포시 표선면']
+
+
+def _unit(text, salt):
+    digest = hashlib.sha1(f"{salt}:{text}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') / 0xFFFFFFFF
+
+
+def fake_place(query, rank=0):
+    name = query.replace('제주 ', '', 1)
+    lat = LAT_RANGE[0] + (LAT_RANGE[1] - LAT_RANGE[0]) * _unit(query, f"lat{rank}")
+    lon = LON_RANGE[0] + (LON_RANGE[1] - LON_RANGE[0]) * _unit(query, f"lon{rank}")
+    district = DISTRICTS[int(_unit(query, 'district') * len(DISTRICTS)) % len(DISTRICTS)]
+    number = 1 + int(_unit(query, f"no{rank}") * 999)
+    return {
+        'place_name': name if rank == 0 else f"{name} {rank + 1}호점",
+        'address_name': f"제주특별자치도 {district} {number}",
+        'road_address_name': f"제주특별자치도 {district} 가짜로 {number}",
+        'category_name': '여행 > 숙박',
+        'phone': '',
+        'x': f"{lon:.7f}",
+        'y': f"{lat:.7f}",
+        'place_url': f"http://place.map.kakao.com/{number}",
+    }
+
+
+def fake_route(origin, destination):
+    (x1, y1), (x2, y2) = [tuple(float(v) for v in p.split(',')[:2]) for p in (origin, destination)]
+    km = math.hypot((x2 - x1) * 93.0, (y2 - y1) * 111.0) * 1.3
+    return {'routes': [{'result_code': 0, 'summary': {'distance': int(km * 1000), 'duration': int(km / 40 * 3600)}}]}
+
+
+class FakeKakao:
+    def __init__(self, latency=0.0, error_rate=0.0, max_qps=None, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.max_qps = max_qps
+        self.random = random.Random(seed)
+        self.stats = Counter()
+        self._window = []
+        self._lock = threading.Lock()
+
+    def throttled(self):
+        if not self.max_qps:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            self._window = [t for t in self._window if now - t < 1.0]
+            if len(self._window) >= self.max_qps:
+                return True
+            self._window.append(now)
+            return False
+
+    def failed(self):
+        with self._lock:
+            return self.random.random() < self.error_rate
+
+
+def make_handler(fake):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send(self, status, body):
+            payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def do_GET(self):
+            url = urllib.parse.urlparse(self.path)
+            params = {k: v[0] for k, v in urllib.parse.parse_qs(url.query).items()}
+            with fake._lock:
+                fake.stats[url.path] += 1
+
+            if url.path == '/__stats':
+                return self._send(200, dict(fake.stats))
+            if not self.headers.get('Authorization', '').startswith('KakaoAK '):
+                return self._send(401, {'errorType': 'AccessDeniedError', 'message': 'no key'})
+            if fake.throttled():
+                return self._send(429, {'errorType': 'RateLimitExceeded', 'message': 'too many requests'})
+            if fake.latency:
+                time.sleep(fake.latency)
+            if fake.failed():
+                return self._send(500, {'errorType': 'InternalError', 'message': 'fake failure'})
+
+            if url.path == '/v2/local/search/keyword.json':
+                query = params.get('query', '')
+                size = int(params.get('size', 15))
+                documents = [] if '폐업' in query else [fake_place(query, i) for i in range(size)]
+                return self._send(200, {'documents': documents,
+                                        'meta': {'total_count': len(documents), 'is_end': True}})
+            if url.path == '/v1/directions':
+                return self._send(200, fake_route(params['origin'], params['destination']))
+            return self._send(404, {'errorType': 'NotFound', 'message': url.path})
+
+    return Handler
+
+
+def serve(port=8765, **options):
+    server = ThreadingHTTPServer(('127.0.0.1', port), make_handler(FakeKakao(**options)))
+    print(f"fake kakao: http://127.0.0.1:{server.server_address[1]}")
+    server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--max-qps', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    serve(args.port, latency=args.latency, error_rate=args.error_rate, max_qps=args.max_qps, seed=args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+"""
+GOLDEN JEJU 공용 데이터 로더
+
+data/ 폴더의 산출물(CSV/XLSX)을 프로세스당 한 번만 읽고, 파생 컬럼과 dtype을
+정리한 뒤 모든 페이지가 같은 DataFrame을 공유하도록 합니다.
+파일이 바뀌면(mtime/크기 변경 + 내용 해시 변경) 다음 호출에서 다시 읽습니다.
+
+`python data_loader.py build-snapshots` 를 실행하면 파생 컬럼까지 계산된 결과를
+data/snapshots/*.feather (Arrow IPC, 비압축)로 저장합니다. 원본 해시가 일치하는 스냅샷이
+있으면 CSV/XLSX 파싱 대신 스냅샷을 메모리 맵으로 읽습니다. 널이 없는 숫자 컬럼은 맵 버퍼를 복사 없이
+(읽기 전용으로) 가리키고, 문자열/범주 컬럼만 pandas로 변환됩니다. (pyarrow 필요, 없으면 원본 파싱)
+
+주의: 반환되는 DataFrame은 여러 페이지/세션이 함께 쓰므로 제자리(inplace) 수정하지 말고
+필요하면 .copy() 하거나 새 컬럼은 assign()으로 만드세요.
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+import urllib.parse
+
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# --- 1. 경로 설정 ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.join(BASE_DIR, 'data')
+SNAPSHOT_DIR = os.path.join(DATA_DIR, 'snapshots')
+SNAPSHOT_MANIFEST = os.path.join(SNAPSHOT_DIR, 'manifest.json')
+
+# 파서(파생 컬럼) 로직이 바뀌면 올려서 기존 스냅샷을 무효화합니다.
+SNAPSHOT_VERSION = 3
+
+FINAL_THEMES_FILE = 'golden_compass_final_themes.csv'
+BASE_INDEX_FILE = 'golden_compass_base_index.csv'
+FORECASTED_FILE = 'golden_compass_forecasted.csv'
+ACCOM_FILE = 'golden_compass_accommodation_clean.csv'
+ACCOM_GEOCODE_FILE = 'golden_compass_accommodation_geocode.jsonl'
+FOODIE_FILE = 'golden_compass_foodie_ranking.csv'
+WELLNESS_FILE = 'golden_compass_wellness_ranking.csv'
+ACTIVITY_FILE = 'golden_compass_activity_ranking.csv'
+PLACES_KEYWORDS_FILE = 'jeju_places_with_auto_keywords.csv'
+PLACES_MEAN_FILE = 'jeju_places_mean.xlsx'
+THEME_PARAMS_FILE = 'golden_compass_theme_params.json'
+
+# 파싱 결과가 다른 파일에도 의존하는 경우 (해당 파일이 바뀌어도 다시 읽습니다)
+_DEPENDENCIES = {
+    FINAL_THEMES_FILE: [THEME_PARAMS_FILE],
+}
+
+LABELS_5 = ["매우\n쾌적", "쾌적", "보통", "혼잡", "매우\n혼잡"]
+OX_COLUMNS = ['장애인전용객실여부', '애완동물동반허용여부', '조식제공여부', 'LATE체크인여부', '셔틀버스운행여부']
+
+
+def data_file(file_name):
+    return os.path.join(DATA_DIR, file_name)
+
+
+def naver_map_url(place_name):
+    return f"https://map.naver.com/v5/search/{urllib.parse.quote(place_name)}"
+
+
+# --- 2. 프로세스 공용 캐시 (mtime/해시 기반 무효화) ---
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _source_paths(file_name):
+    paths = [data_file(file_name)]
+    paths += [data_file(dep) for dep in _DEPENDENCIES.get(file_name, [])]
+    return [p for p in paths if os.path.exists(p)]
+
+
+def _file_signature(paths):
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _file_hash(paths):
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_cached(file_name):
+    """file_name을 읽어 캐시합니다. 파일이 없거나 읽기에 실패하면 빈 DataFrame."""
+    path = data_file(file_name)
+    if not os.path.exists(path):
+        return pd.DataFrame()
+
+    paths = _source_paths(file_name)
+    signature = _file_signature(paths)
+    with _cache_lock:
+        entry = _cache.get(file_name)
+        if entry is not None and entry['signature'] == signature:
+            return entry['df']
+
+    # mtime만 바뀌고 내용이 같으면(예: git checkout) 다시 파싱하지 않습니다.
+    content_hash = _file_hash(paths)
+    if entry is not None and entry['hash'] == content_hash:
+        with _cache_lock:
+            entry['signature'] = signature
+        return entry['df']
+
+    try:
+        df = _read_snapshot(file_name, content_hash)
+        if df is None:
+            df = _PARSERS[file_name](path)
+    except Exception as e:
+        print(f"Data load error for {file_name}: {e}")
+        return pd.DataFrame()
+
+    with _cache_lock:
+        _cache[file_name] = {'signature': signature, 'hash': content_hash, 'df': df}
+    return df
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+# --- 3. 파일별 파서 ---
+def _add_month_columns(df):
+    df['날짜'] = pd.to_datetime(df['날짜'])
+    df['년'] = df['날짜'].dt.year.astype('int16')
+    df['월'] = df['날짜'].dt.month.astype('int8')
+    df['월_라벨'] = df['날짜'].dt.strftime('%Y년 %m월')
+    df['월_str'] = df['날짜'].dt.strftime('%m월')
+    return df
+
+
+def _quintile_label(series, edges=None):
+    """고정 경계값이 있으면 그것으로, 없으면 (파라미터 고정 전) qcut으로 5분위 라벨을 매깁니다."""
+    if edges is not None:
+        import theme_index
+        return theme_index.assign_labels(series, edges)
+    return pd.qcut(series, 5, labels=LABELS_5, duplicates='drop')
+
+
+def _parse_final_themes(path):
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    df = _add_month_columns(df)
+
+    for col in ['관광 포화 지수', '웰니스 쾌적도', '골프 쾌적도', '렌터카 가동률', '전세버스 가동률']:
+        if col in df.columns:
+            df[col] = df[col].astype(float)
+
+    label_edges = {}
+    params_path = data_file(THEME_PARAMS_FILE)
+    if os.path.exists(params_path):
+        with open(params_path, encoding='utf-8') as f:
+            label_edges = json.load(f).get('label_edges', {})
+
+    label_sources = {'쾌적도 라벨': '관광 포화 지수', '웰니스 라벨': '웰니스 쾌적도', '골프 라벨': '골프 쾌적도'}
+    for label_col, source_col in label_sources.items():
+        if source_col in df.columns:
+            df[label_col] = _quintile_label(df[source_col], label_edges.get(source_col))
+        else:
+            df[label_col] = "N/A"
+
+    return df.sort_values(by='날짜').reset_index(drop=True)
+
+
+def _parse_monthly_index(path):
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    return _add_month_columns(df).sort_values(by='날짜').reset_index(drop=True)
+
+
+def _parse_accommodation(path):
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    df['콘텐츠명'] = df['콘텐츠명'].astype(str)
+    df['등급'] = pd.to_numeric(df['등급'], errors='coerce').fillna(0).astype('int8')
+    for col in OX_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype(pd.CategoricalDtype(['O', 'X']))
+    if '부대시설기타' in df.columns:
+        df['부대시설기타'] = df['부대시설기타'].fillna('정보 없음').astype(str)
+
+    # 주소/좌표 (geocode_accommodation.py 가 채웁니다. 없으면 빈 값)
+    for col in ['주소', '도로명주소']:
+        df[col] = df[col].fillna('').astype(str) if col in df.columns else ''
+    for col in ['lat', 'lon']:
+        df[col] = pd.to_numeric(df[col], errors='coerce') if col in df.columns else float('nan')
+
+    import accommodation_features
+    if all(col in df.columns for col in accommodation_features.FEATURE_COLUMNS):
+        for col in accommodation_features.FEATURE_COLUMNS:
+            df[col] = df[col].fillna('').astype(str)
+    else:
+        # 파이프라인 이전 버전 CSV: 특징 컬럼을 즉석에서 계산합니다.
+        df = accommodation_features.annotate_frame(df)
+    return df
+
+
+def _parse_ranking(path):
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    if '월' in df.columns:
+        df['월'] = df['월'].astype('int8')
+    if '점수' in df.columns:
+        df['점수'] = df['점수'].astype(float)
+    return df
+
+
+def _parse_places_keywords(path):
+    df = pd.read_csv(path, encoding='utf-8-sig')
+    df.columns = df.columns.str.strip()
+    df = df.rename(columns={
+        'y': 'lat',
+        'x': 'lon',
+        'keywords': 'original_keywords'  # 원본 키워드 (표시용)
+    })
+    df = df.dropna(subset=['lat', 'lon']).reset_index(drop=True)
+
+    df['place_name'] = df['place_name'].fillna('').astype(str)
+    df['category_name'] = df['category_name'].fillna('').astype(str)
+    df['original_keywords'] = df['original_keywords'].fillna('').astype(str)
+
+    df['search_blob'] = (
+        df['place_name'] + ' ' +
+        df['category_name'].str.replace('>', ' ') + ' ' +
+        df['original_keywords'].str.replace(',', ' ')
+    )
+    df['naver_map_url'] = df['place_name'].map(naver_map_url)
+    return df
+
+
+def _parse_places_mean(path):
+    df = pd.read_excel(path)
+    df.columns = df.columns.str.strip()
+
+    if '위도' in df.columns and '경도' in df.columns:
+        df = df.rename(columns={'위도': 'lat', '경도': 'lon'})
+    elif 'y' in df.columns and 'x' in df.columns:
+        df = df.rename(columns={'y': 'lat', 'x': 'lon'})
+
+    df = df.dropna(subset=['lat', 'lon']).reset_index(drop=True)
+    df['naver_map_url'] = df['장소명'].astype(str).map(naver_map_url)
+    return df
+
+
+_PARSERS = {
+    FINAL_THEMES_FILE: _parse_final_themes,
+    BASE_INDEX_FILE: _parse_monthly_index,
+    FORECASTED_FILE: _parse_monthly_index,
+    ACCOM_FILE: _parse_accommodation,
+    FOODIE_FILE: _parse_ranking,
+    WELLNESS_FILE: _parse_ranking,
+    ACTIVITY_FILE: _parse_ranking,
+    PLACES_KEYWORDS_FILE: _parse_places_keywords,
+    PLACES_MEAN_FILE: _parse_places_mean,
+}
+
+
+# --- 4. 컬럼형 스냅샷 (Feather) ---
+def snapshot_file(file_name):
+    return os.path.join(SNAPSHOT_DIR, os.path.splitext(file_name)[0] + '.feather')
+
+
+def _read_manifest():
+    if not os.path.exists(SNAPSHOT_MANIFEST):
+        return {}
+    with open(SNAPSHOT_MANIFEST, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_snapshot(file_name, content_hash):
+    """원본 해시와 버전이 일치하는 스냅샷이 있으면 메모리 맵으로 읽고, 없으면 None."""
+    if not PYARROW_AVAILABLE:
+        return None
+    entry = _read_manifest().get(file_name)
+    if not entry or entry.get('hash') != content_hash or entry.get('version') != SNAPSHOT_VERSION:
+        return None
+    path = snapshot_file(file_name)
+    if not os.path.exists(path):
+        return None
+    # split_blocks: 컬럼마다 따로 블록을 만들어, 널이 없는 숫자 컬럼은 메모리 맵 버퍼를 복사 없이 가리킵니다.
+    # (문자열/범주 컬럼은 pandas 객체로 변환되며 복사됩니다. 공유 프레임이므로 읽기 전용으로 씁니다)
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def build_snapshots(file_names=None):
+    """원본 CSV/XLSX를 파싱해 파생 컬럼을 포함한 Feather 스냅샷과 manifest를 씁니다."""
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError("스냅샷을 만들려면 'pyarrow' 라이브러리가 필요합니다. (pip install pyarrow)")
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    manifest = _read_manifest()
+    built = []
+    for file_name in (file_names or _PARSERS):
+        path = data_file(file_name)
+        if not os.path.exists(path):
+            continue
+        df = _PARSERS[file_name](path)
+        # 메모리 맵으로 바로 읽을 수 있도록 비압축으로 저장합니다.
+        feather.write_feather(df, snapshot_file(file_name), compression='uncompressed')
+        manifest[file_name] = {
+            'hash': _file_hash(_source_paths(file_name)),
+            'version': SNAPSHOT_VERSION,
+            'rows': int(len(df)),
+        }
+        built.append(file_name)
+
+    with open(SNAPSHOT_MANIFEST, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    clear_cache()
+    return built
+
+
+# --- 5. 페이지에서 사용하는 공개 함수 ---
+def load_final_themes():
+    """월별 쾌적도/웰니스/골프 지표 (날짜순 정렬, 라벨 포함)."""
+    return _load_cached(FINAL_THEMES_FILE)
+
+
+def load_base_index():
+    return _load_cached(BASE_INDEX_FILE)
+
+
+def load_forecasted():
+    return _load_cached(FORECASTED_FILE)
+
+
+def load_accommodation():
+    return _load_cached(ACCOM_FILE)
+
+
+def load_foodie_ranking():
+    return _load_cached(FOODIE_FILE)
+
+
+def load_wellness_ranking():
+    return _load_cached(WELLNESS_FILE)
+
+
+def load_activity_ranking():
+    return _load_cached(ACTIVITY_FILE)
+
+
+def load_places_keywords():
+    """맛집 카탈로그 (lat/lon, search_blob, naver_map_url 포함)."""
+    return _load_cached(PLACES_KEYWORDS_FILE)
+
+
+def load_places_mean():
+    """관광지 연령/성별 비율 카탈로그 (openpyxl 필요)."""
+    return _load_cached(PLACES_MEAN_FILE)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ['build-snapshots']:
+        for name in build_snapshots():
+            print(f"snapshot: {name} -> {snapshot_file(name)}")
+    else:
+        print("usage: python data_loader.py build-snapshots")
+        sys.exit(2)
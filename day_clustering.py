@@ -0,0 +1,155 @@
+"""
+찜한 장소를 여행 일수만큼 묶기 (NumPy 전용, 하루 장소 수 균형)
+
+KMeans 는 한쪽에 1곳, 다른 쪽에 8곳 같은 날을 만들기 쉬워서, 묶음 크기를 ceil(n/k) 또는 floor(n/k)
+로 고정한 용량 제약 k-means 를 씁니다.
+
+1. k-means++ 로 중심을 고르고
+2. 각 날의 용량을 정한 뒤 (가까운 장소가 많은 날에 ceil 을 먼저 배정),
+   (장소, 중심) 쌍을 거리 순으로 훑으며 용량이 남은 날에 배정 -> 중심 갱신을 배정이 바뀌지 않을 때까지 반복하고
+3. 두 날 사이 장소 맞바꾸기로 묶음 내 거리 제곱합을 더 줄입니다.
+
+초기값을 n_init 번 바꿔 거리 제곱합이 가장 작은 결과를 씁니다. 좌표는 경도에 cos(위도)를 곱해
+거리 비율을 맞추고, 좌표가 없는 장소는 자리가 남은 날에 채웁니다.
+결과는 (장소 좌표 목록, 일수) 키로 프로세스 메모리에 기억합니다.
+
+    labels = day_clustering.cluster_days([(lat, lon), ...], num_days)   # 0..num_days-1
+"""
+import math
+
+import numpy as np
+
+N_INIT = 10
+MAX_ITER = 50
+RANDOM_STATE = 42
+ROUND_DIGITS = 6
+MAX_CACHE_ENTRIES = 256
+
+_cache = {}
+
+
+def _project(coords):
+    coords = np.asarray(coords, dtype=float)
+    mean_lat = np.radians(np.nanmean(coords[:, 0]))
+    return np.column_stack([coords[:, 0], coords[:, 1] * np.cos(mean_lat)])
+
+
+def _kmeans_plus_plus(points, k, rng):
+    centers = [points[rng.integers(len(points))]]
+    for _ in range(1, k):
+        d2 = ((points[:, None, :] - np.array(centers)[None, :, :]) ** 2).sum(axis=2).min(axis=1)
+        total = d2.sum()
+        index = rng.choice(len(points), p=d2 / total) if total > 0 else rng.integers(len(points))
+        centers.append(points[index])
+    return np.array(centers)
+
+
+def _capacities(d2, k):
+    n = len(d2)
+    base, extra = divmod(n, k)
+    demand = np.bincount(d2.argmin(axis=1), minlength=k)
+    capacities = np.full(k, base)
+    capacities[np.argsort(-demand, kind='stable')[:extra]] += 1
+    return capacities
+
+
+def _assign(d2, capacities):
+    """(장소, 중심) 쌍을 가까운 순으로 보며 용량이 남은 중심에 배정."""
+    n, k = d2.shape
+    labels = np.full(n, -1)
+    remaining = capacities.copy()
+    left = n
+    for flat in np.argsort(d2, axis=None, kind='stable'):
+        point, center = divmod(int(flat), k)
+        if labels[point] == -1 and remaining[center] > 0:
+            labels[point] = center
+            remaining[center] -= 1
+            left -= 1
+            if left == 0:
+                break
+    return labels
+
+
+def _centers(points, labels, k):
+    return np.array([points[labels == c].mean(axis=0) for c in range(k)])
+
+
+def _swap_improve(points, labels, k):
+    """다른 날의 두 장소를 맞바꿔 거리 제곱합이 줄면 적용 (더 없을 때까지)."""
+    improved = True
+    while improved:
+        improved = False
+        centers = _centers(points, labels, k)
+        d2 = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        own = d2[np.arange(len(points)), labels]
+        # gain[i, j] = i 와 j 를 맞바꿀 때 (현재 중심 기준) 줄어드는 거리 제곱합
+        gain = own[:, None] + own[None, :] - d2[:, labels].T - d2[:, labels]
+        gain[labels[:, None] == labels[None, :]] = 0
+        i, j = np.unravel_index(np.argmax(gain), gain.shape)
+        if gain[i, j] > 1e-12:
+            labels[i], labels[j] = labels[j], labels[i]
+            improved = True
+    return labels
+
+
+def _inertia(points, labels, k):
+    centers = _centers(points, labels, k)
+    return float(((points - centers[labels]) ** 2).sum())
+
+
+def balanced_kmeans(points, k, n_init=N_INIT, max_iter=MAX_ITER, random_state=RANDOM_STATE):
+    """묶음 크기가 floor(n/k) 또는 ceil(n/k) 인 라벨 배열."""
+    n = len(points)
+    if k >= n:
+        return np.arange(n)
+    rng = np.random.default_rng(random_state)
+    best_labels, best_inertia = None, math.inf
+    for _ in range(n_init):
+        centers = _kmeans_plus_plus(points, k, rng)
+        d2 = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        capacities = _capacities(d2, k)
+        labels = None
+        for _ in range(max_iter):
+            new_labels = _assign(d2, capacities)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            centers = _centers(points, labels, k)
+            d2 = ((points[:, None, :] - centers[None, :, :]) ** 2).sum(axis=2)
+        labels = _swap_improve(points, labels, k)
+        inertia = _inertia(points, labels, k)
+        if inertia < best_inertia:
+            best_labels, best_inertia = labels, inertia
+    return best_labels
+
+
+def _coord_key(value):
+    value = float(value)
+    return None if math.isnan(value) else round(value, ROUND_DIGITS)
+
+
+def cluster_days(coords, num_days):
+    """장소 좌표 [(lat, lon)] 를 num_days 개 날로 나눈 라벨 목록 (좌표가 없는 장소 포함)."""
+    key = (tuple((_coord_key(lat), _coord_key(lon)) for lat, lon in coords), num_days)
+    if key in _cache:
+        return list(_cache[key])
+
+    coords = np.asarray(coords, dtype=float).reshape(-1, 2)
+    located = ~np.isnan(coords).any(axis=1)
+    labels = np.full(len(coords), -1)
+    if located.any():
+        points = _project(coords[located])
+        k = min(num_days, len(points))
+        labels[located] = balanced_kmeans(points, k)
+
+    # 좌표가 없는 장소는 가장 적게 배정된 날부터 채웁니다.
+    counts = np.bincount(labels[labels >= 0], minlength=num_days)
+    for index in np.flatnonzero(labels < 0):
+        day = int(np.argmin(counts))
+        labels[index] = day
+        counts[day] += 1
+
+    if len(_cache) >= MAX_CACHE_ENTRIES:
+        _cache.pop(next(iter(_cache)))
+    _cache[key] = tuple(int(label) for label in labels)
+    return list(_cache[key])
@@ -0,0 +1,180 @@
+"""
+숙소 카탈로그 일괄 지오코딩 (오프라인 작업)
+
+golden_compass_accommodation_clean.csv 의 모든 숙소를 Kakao 키워드 검색으로 한 번씩 조회해
+주소/도로명주소/좌표를 구하고, 결과를 CSV 컬럼('주소', '도로명주소', 'lat', 'lon')으로 씁니다.
+페이지는 이 컬럼을 읽기만 하고 API를 부르지 않습니다.
+
+- 동시 요청 수는 --concurrency 로, 초당 요청 수는 --rate 로 제한합니다. (kakao_client 토큰 버킷,
+  429/5xx 재시도 포함)
+- 조회 결과는 체크포인트(JSONL, 한 줄 = 숙소 하나)에 바로 추가되므로 중간에 멈춰도
+  다시 실행하면 남은 숙소만 조회합니다. 오류(네트워크/5xx)는 기록하지 않아 다음 실행에서 재시도합니다.
+- --base-url 로 로컬 가짜 서버를 가리키면 API 할당량 없이 시험할 수 있습니다.
+
+    python benchmarks/fake_kakao_server.py --port 8765 &
+    python geocode_accommodation.py --base-url http://127.0.0.1:8765 --csv /tmp/accom.csv --checkpoint /tmp/geo.jsonl
+    python geocode_accommodation.py            # 실제 API, data/ 갱신
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import accommodation_features
+import data_loader
+import kakao_client
+
+KAKAO_API_BASE = os.environ.get('KAKAO_API_BASE', 'https://dapi.kakao.com')
+KEYWORD_PATH = '/v2/local/search/keyword.json'
+
+GEOCODE_COLUMNS = ['주소', '도로명주소', 'lat', 'lon']
+DEFAULT_CONCURRENCY = 4
+
+
+# --- 1. 체크포인트 ---
+def checkpoint_path():
+    return data_loader.data_file(data_loader.ACCOM_GEOCODE_FILE)
+
+
+def load_checkpoint(path=None):
+    """{콘텐츠명: 결과 dict}. 마지막 줄이 중간에 잘렸으면 무시합니다."""
+    path = path or checkpoint_path()
+    results = {}
+    if not os.path.exists(path):
+        return results
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            results[record['콘텐츠명']] = record
+    return results
+
+
+class CheckpointWriter:
+    """여러 작업 스레드의 결과를 한 줄씩 추가하고 바로 flush 합니다."""
+
+    def __init__(self, path):
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def write(self, record):
+        with self._lock:
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+# --- 2. 조회 ---
+def geocode_one(client, name, base_url=KAKAO_API_BASE):
+    """
+    숙소 하나를 조회합니다. 찾으면 status='ok', 결과가 없으면 'not_found'.
+    재시도 후에도 남은 네트워크 오류나 4xx/5xx 응답은 예외로 올려 체크포인트에 남기지 않습니다.
+    """
+    result = client.get_json(base_url.rstrip('/') + KEYWORD_PATH, {"query": f"제주 {name}", "size": 1})
+    documents = result.get('documents', [])
+    if not documents:
+        return {'콘텐츠명': name, 'status': 'not_found'}
+    doc = documents[0]
+    return {
+        '콘텐츠명': name,
+        'status': 'ok',
+        '주소': doc.get('address_name', ''),
+        '도로명주소': doc.get('road_address_name', ''),
+        'lat': float(doc['y']),
+        'lon': float(doc['x']),
+    }
+
+
+def geocode_all(names, checkpoint, client, base_url=KAKAO_API_BASE, concurrency=DEFAULT_CONCURRENCY, log=print):
+    """체크포인트에 없는 숙소만 동시에 최대 concurrency개씩 조회합니다. (성공, 실패) 수를 반환."""
+    done = load_checkpoint(checkpoint)
+    pending = [name for name in dict.fromkeys(names) if name not in done]
+    log(f"지오코딩: {len(pending)}개 조회 (체크포인트 {len(done)}개 재사용)")
+    if not pending:
+        return 0, 0
+
+    writer = CheckpointWriter(checkpoint)
+    succeeded = failed = 0
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = {pool.submit(geocode_one, client, name, base_url): name for name in pending}
+            for i, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    writer.write(future.result())
+                    succeeded += 1
+                except Exception as e:
+                    failed += 1
+                    print(f"Kakao Geocoding Error for {name}: {e}")
+                if i % 100 == 0:
+                    log(f"  {i}/{len(pending)}")
+    finally:
+        writer.close()
+    return succeeded, failed
+
+
+# --- 3. CSV 반영 ---
+def geocode_columns(record):
+    if not record or record.get('status') != 'ok':
+        return {col: '' for col in GEOCODE_COLUMNS}
+    return {col: record.get(col, '') for col in GEOCODE_COLUMNS}
+
+
+def write_columns(csv_path, results):
+    """지오코딩 결과를 CSV 컬럼으로 쓰고, 주소 기준으로 지역 태그를 다시 계산합니다."""
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        reader = csv.DictReader(f)
+        fieldnames = [name for name in reader.fieldnames if name not in GEOCODE_COLUMNS]
+        rows = list(reader)
+
+    for row in rows:
+        row.update(geocode_columns(results.get(row['콘텐츠명'])))
+
+    with open(csv_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames + GEOCODE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+    accommodation_features.annotate_csv(csv_path)
+    return sum(1 for row in rows if row['주소'])
+
+
+def read_names(csv_path):
+    with open(csv_path, encoding='utf-8-sig', newline='') as f:
+        return [row['콘텐츠명'] for row in csv.DictReader(f)]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--csv', default=data_loader.data_file(data_loader.ACCOM_FILE))
+    parser.add_argument('--checkpoint', default=checkpoint_path())
+    parser.add_argument('--base-url', default=KAKAO_API_BASE)
+    parser.add_argument('--api-key', default=kakao_client.KAKAO_API_KEY)
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument('--rate', type=float, default=kakao_client.RATE_PER_SEC, help="초당 최대 요청 수")
+    parser.add_argument('--limit', type=int, default=None, help="이번 실행에서 조회할 최대 숙소 수")
+    args = parser.parse_args(argv)
+
+    names = read_names(args.csv)
+    if args.limit is not None:
+        done = load_checkpoint(args.checkpoint)
+        names = [name for name in names if name not in done][:args.limit]
+    client = kakao_client.KakaoClient(api_key=args.api_key, pool_size=max(args.concurrency, 1),
+                                      bucket=kakao_client.shared_bucket(args.rate))
+    succeeded, failed = geocode_all(names, args.checkpoint, client, args.base_url, args.concurrency)
+    located = write_columns(args.csv, load_checkpoint(args.checkpoint))
+    print(f"완료: 조회 {succeeded}개, 실패 {failed}개 (다시 실행하면 재시도) / 주소 보유 {located}개")
+    for endpoint, stats in client.stats().items():
+        print(f"  {endpoint}: {stats['calls']}회, 재시도 {stats['retries']}, "
+              f"p50 {stats['p50_ms']:.0f}ms, p95 {stats['p95_ms']:.0f}ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+"""
+초성/자모 단위 검색 인덱스 (place_search 의 보조 인덱스)
+
+어르신들이 "ㅎㄷㅈ"(흑돼지)처럼 초성만 치거나, 마지막 글자를 덜 조합한 채("흑돼ㅈ", "흑됒")
+검색하는 경우를 위해 장소 이름/키워드를 미리 두 가지로 풀어 둡니다.
+
+- 자모: 글자를 키보드 입력 단위 자모로 분해 (ㅙ -> ㅗㅐ, ㄺ -> ㄹㄱ)  "흑돼지" -> "ㅎㅡㄱㄷㅗㅐㅈㅣ"
+- 초성: 글자마다 첫소리만                                              "흑돼지" -> "ㅎㄷㅈ"
+
+각 문자열의 모든 위치에서 시작하는 접미사(최대 MAX_KEY_LEN 자)를 정렬해 두면(접미사 배열)
+"어디든 이 문자열로 시작하는 곳" = 이진 탐색 한 번으로 찾는 구간이 됩니다. 그래서
+
+1. 초성 검색어: 초성 접미사 배열에서 접두사 구간
+2. 그 밖의 검색어: 자모 접미사 배열에서 접두사 구간 (덜 조합된 마지막 글자도 자연히 맞음)
+3. 2가 비면 편집 거리 1 (자모 하나 틀림/빠짐/더함): 검색어를 앞/뒤 절반으로 나누면 한 번의 편집은
+   한쪽만 망가뜨리므로, 두 절반을 각각 접미사 배열에서 찾은 위치 주변만 확인합니다.
+
+모두 색인을 거치며 전체 행을 훑지 않습니다.
+
+    index = jamo_index.JamoIndex({'place_name': names, 'original_keywords': keywords})
+    kind, matches = index.match("ㅎㄷㅈ")   # ('choseong', {'place_name': array([...]), ...})
+"""
+from bisect import bisect_left
+
+import numpy as np
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+# 겹모음/겹받침 -> 키보드로 치는 순서
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+}
+SYLLABLE_BASE = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+MAX_KEY_LEN = 32
+MIN_FUZZY_LEN = 4
+KEY_END = '\U0010FFFF'
+
+
+def _syllable_parts(ch):
+    """한글 음절이면 (초성, 중성, 종성) 자모, 아니면 None."""
+    code = ord(ch)
+    if not SYLLABLE_BASE <= code <= SYLLABLE_LAST:
+        return None
+    offset = code - SYLLABLE_BASE
+    return CHOSEONG[offset // 588], JUNGSEONG[(offset % 588) // 28], JONGSEONG[offset % 28]
+
+
+def decompose(text):
+    """키보드 입력 단위 자모 문자열 (공백 제거, 영문 소문자)."""
+    result = []
+    for ch in str(text).lower():
+        if ch.isspace():
+            continue
+        parts = _syllable_parts(ch)
+        for part in (parts if parts is not None else (ch,)):
+            result.append(COMPOUND_JAMO.get(part, part))
+    return ''.join(result)
+
+
+def choseong(text):
+    """글자마다 초성 (한글이 아닌 글자는 그대로, 공백 제거)."""
+    result = []
+    for ch in str(text).lower():
+        if ch.isspace():
+            continue
+        parts = _syllable_parts(ch)
+        result.append(parts[0] if parts is not None else ch)
+    return ''.join(result)
+
+
+def is_choseong_query(text):
+    text = ''.join(str(text).split())
+    return bool(text) and all(ch in CHOSEONG for ch in text)
+
+
+def within_one_edit(a, b):
+    """편집 거리(바꾸기/빼기/넣기)가 1 이하인지."""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+class SuffixArray:
+    """문자열 목록의 모든 위치 접미사(최대 MAX_KEY_LEN 자)를 정렬한 배열."""
+
+    def __init__(self, texts):
+        self.texts = texts
+        entries = sorted(
+            (text[pos:pos + MAX_KEY_LEN], text_id, pos)
+            for text_id, text in enumerate(texts) for pos in range(len(text))
+        )
+        self.keys = [key for key, _, _ in entries]
+        self.text_ids = np.array([text_id for _, text_id, _ in entries], dtype=np.int64)
+        self.positions = np.array([pos for _, _, pos in entries], dtype=np.int64)
+
+    def _range(self, pattern):
+        key = pattern[:MAX_KEY_LEN]
+        return bisect_left(self.keys, key), bisect_left(self.keys, key + KEY_END)
+
+    def find(self, pattern):
+        """pattern 이 나오는 (문자열 번호, 위치) 배열."""
+        lo, hi = self._range(pattern)
+        text_ids, positions = self.text_ids[lo:hi], self.positions[lo:hi]
+        if len(pattern) > MAX_KEY_LEN:
+            keep = [self.texts[t].startswith(pattern, p) for t, p in zip(text_ids.tolist(), positions.tolist())]
+            text_ids, positions = text_ids[keep], positions[keep]
+        return text_ids, positions
+
+
+class JamoIndex:
+    def __init__(self, fields):
+        """fields: {필드 이름: 장소 번호 순서의 문자열 목록}"""
+        self.fields = list(fields)
+        texts_jamo, texts_choseong, owners = [], [], []
+        for field_id, values in enumerate(fields.values()):
+            for row_id, value in enumerate(values):
+                jamo = decompose(value)
+                if jamo:
+                    texts_jamo.append(jamo)
+                    texts_choseong.append(choseong(value))
+                    owners.append((field_id, row_id))
+        owners = np.array(owners, dtype=np.int64).reshape(-1, 2)
+        self._field_ids = owners[:, 0]
+        self._row_ids = owners[:, 1]
+        self.jamo = SuffixArray(texts_jamo)
+        self.choseong = SuffixArray(texts_choseong)
+
+    def _group(self, text_ids):
+        """문자열 번호 -> {필드: 장소 번호 배열}"""
+        text_ids = np.unique(text_ids)
+        field_ids, row_ids = self._field_ids[text_ids], self._row_ids[text_ids]
+        return {field: np.unique(row_ids[field_ids == field_id])
+                for field_id, field in enumerate(self.fields) if (field_ids == field_id).any()}
+
+    def _fuzzy(self, pattern):
+        """편집 거리 1 이하로 pattern 이 나오는 문자열 번호 배열."""
+        m = len(pattern)
+        half = m // 2
+        head, tail = pattern[:half], pattern[half:]
+        texts = self.jamo.texts
+        found = set()
+
+        # 앞 절반이 맞으면 그 위치에서 시작, 뒤 절반이 맞으면 그 위치에서 끝나는 구간만 확인
+        text_ids, positions = self.jamo.find(head)
+        for text_id, start in zip(text_ids.tolist(), positions.tolist()):
+            if text_id not in found and any(
+                    within_one_edit(pattern, texts[text_id][start:start + length]) for length in (m - 1, m, m + 1)):
+                found.add(text_id)
+        text_ids, positions = self.jamo.find(tail)
+        for text_id, pos in zip(text_ids.tolist(), positions.tolist()):
+            end = pos + len(tail)
+            if text_id not in found and any(
+                    within_one_edit(pattern, texts[text_id][max(end - length, 0):end]) for length in (m - 1, m, m + 1)):
+                found.add(text_id)
+        return np.fromiter(found, dtype=np.int64, count=len(found))
+
+    def match(self, query):
+        """
+        (방식, {필드: 장소 번호 배열}). 방식은 'choseong' / 'prefix' / 'edit1' 중 처음 결과가 나온 것,
+        아무것도 없으면 (None, {}).
+        """
+        if is_choseong_query(query):
+            text_ids, _ = self.choseong.find(''.join(str(query).split()))
+            return ('choseong', self._group(text_ids)) if len(text_ids) else (None, {})
+
+        pattern = decompose(query)
+        if not pattern:
+            return None, {}
+        text_ids, _ = self.jamo.find(pattern)
+        if len(text_ids):
+            return 'prefix', self._group(text_ids)
+        if len(pattern) >= MIN_FUZZY_LEN:
+            text_ids = self._fuzzy(pattern)
+            if len(text_ids):
+                return 'edit1', self._group(text_ids)
+        return None, {}
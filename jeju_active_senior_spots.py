@@ -2,8 +2,6 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import folium
-from streamlit_folium import st_folium
 
 st.set_page_config(page_title="Jeju Active Senior — 인기스팟추천", layout="wide")
 st.title("🧭 제주 액티브 시니어 인기 스팟 추천 (2023–2025)")
@@ -112,21 +110,28 @@ top = (dfm.groupby(["장소명","위도","경도"], as_index=False)[col_ratio]
 
 
 # 4) 지도(핀만 표시) + 툴팁/팝업
-m = folium.Map(location=[33.38, 126.55], zoom_start=10, tiles="CartoDB positron", control_scale=True)
-
-for _, r in top.iterrows():
-    name = r["장소명"]
-    val = float(r[col_ratio])  # 비율(%)로 들어왔다고 가정
-    popup = f"<b>{name}</b><br/>{gender} 50대 이상 방문비율(최근3개년 {sel_month_label} 평균): {val:.2f}%"
-    tooltip = f"{name} — {val:.2f}%"
-    folium.Marker(
-        location=[float(r["위도"]), float(r["경도"])],
-        tooltip=tooltip,
-        popup=folium.Popup(popup, max_width=360)
-    ).add_to(m)
+# folium/streamlit_folium 은 무거우므로 지도를 그릴 때 불러옵니다. (위쪽 제목/선택 상자가 먼저 표시됨)
+def render_spot_map(top, col_ratio, gender, sel_month_label):
+    import folium
+    from streamlit_folium import st_folium
+
+    m = folium.Map(location=[33.38, 126.55], zoom_start=10, tiles="CartoDB positron", control_scale=True)
+
+    for _, r in top.iterrows():
+        name = r["장소명"]
+        val = float(r[col_ratio])  # 비율(%)로 들어왔다고 가정
+        popup = f"<b>{name}</b><br/>{gender} 50대 이상 방문비율(최근3개년 {sel_month_label} 평균): {val:.2f}%"
+        tooltip = f"{name} — {val:.2f}%"
+        folium.Marker(
+            location=[float(r["위도"]), float(r["경도"])],
+            tooltip=tooltip,
+            popup=folium.Popup(popup, max_width=360)
+        ).add_to(m)
+
+    st_folium(m, width=1100, height=720)
 
 st.subheader(f"📍 {sel_month_label} · {gender} 기준 — 인기스팟 TOP 20")
-st_folium(m, width=1100, height=720)
+render_spot_map(top, col_ratio, gender, sel_month_label)
 
 # 하단 표(확인용)
 st.dataframe(
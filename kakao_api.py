@@ -0,0 +1,60 @@
+"""
+Kakao 로컬/내비 API 공용 호출 함수
+
+모든 페이지의 Kakao 호출은 여기를 거치며, 응답은 kakao_cache(SQLite 공용 캐시)에 저장됩니다.
+캐시에 없을 때의 실제 요청은 kakao_client(연결 풀, 재시도, 속도 제한)로 보냅니다.
+실패하면 KakaoError 를 올리므로 페이지는 각자 안내 문구/기본값을 정하면 됩니다.
+"""
+import os
+
+import kakao_cache
+import kakao_client
+
+KAKAO_API_KEY = kakao_client.KAKAO_API_KEY
+KAKAO_API_BASE = os.environ.get('KAKAO_API_BASE', 'https://dapi.kakao.com')
+KAKAO_NAVI_BASE = os.environ.get('KAKAO_NAVI_BASE', 'https://apis-navi.kakao.com')
+KEYWORD_URL = KAKAO_API_BASE + '/v2/local/search/keyword.json'
+DIRECTIONS_URL = KAKAO_NAVI_BASE + '/v1/directions'
+
+
+class KakaoError(Exception):
+    pass
+
+
+def _get_json(url, params):
+    return kakao_client.get_client().get_json(url, params)
+
+
+def _cached(endpoint, params, fetch):
+    try:
+        return kakao_cache.get_cache().get_or_fetch(endpoint, params, fetch)
+    except Exception as e:
+        raise KakaoError(str(e)) from e
+
+
+# --- 1. 키워드 장소 검색 ---
+def search_keyword(query, size=None):
+    """장소 검색 결과 documents 목록 (결과가 없으면 빈 목록)."""
+    params = {"query": query}
+    if size is not None:
+        params["size"] = size
+    return _cached('keyword', params, lambda: _get_json(KEYWORD_URL, params).get('documents', []))
+
+
+# --- 2. 자동차 길찾기 ---
+def driving_summary(start_lon, start_lat, goal_lon, goal_lat):
+    """(거리 km, 소요 분). 경로가 없으면 None."""
+    params = {
+        "origin": f"{start_lon},{start_lat}",
+        "destination": f"{goal_lon},{goal_lat}",
+        "summary": "true"
+    }
+
+    def fetch():
+        routes = _get_json(DIRECTIONS_URL, params).get('routes', [])
+        return routes[0]['summary'] if routes and 'summary' in routes[0] else None
+
+    summary = _cached('directions', params, fetch)
+    if summary is None:
+        return None
+    return summary['distance'] / 1000.0, summary['duration'] / 60.0
@@ -0,0 +1,249 @@
+"""
+Kakao API 응답 공용 캐시 (SQLite)
+
+st.cache_data 는 프로세스 메모리에만 있고 재시작하면 사라지며, 실패 결과도 영구히 캐시합니다.
+이 캐시는 디스크(SQLite, WAL)에 있어 재시작 후에도 남고, 같은 서버의 모든 페이지/워커 프로세스가
+함께 씁니다.
+
+- 엔드포인트별 TTL (ENDPOINT_TTLS). 만료 후 STALE_GRACE 안이면 이전 값을 바로 돌려주고
+  백그라운드에서 다시 받아옵니다. (stale-while-revalidate)
+  다시 받아오기가 실패해도 이전 값은 지우지 않고 실패 시각(failed_at)만 남겨, NEGATIVE_TTL 동안은
+  재시도 없이 이전 값을 계속 돌려줍니다.
+- 이전 값이 없거나 STALE_GRACE 가 지난 요청의 실패(네트워크 오류, 4xx/5xx)는 NEGATIVE_TTL 동안만
+  기억해, 그 사이 같은 요청은 API를 부르지 않고 바로 실패합니다. 그 뒤에는 다시 시도합니다.
+- 같은 키를 동시에 요청하면 한 번만 API를 부릅니다.
+  프로세스 안에서는 Future 공유로, 프로세스 사이에서는 SQLite 임대(lease) 행으로 조정합니다.
+
+    cache = kakao_cache.get_cache()
+    documents = cache.get_or_fetch('keyword', {'query': '제주 흑돼지'}, fetch)
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.environ.get('KAKAO_CACHE_PATH', os.path.join(BASE_DIR, '.kakao_cache.sqlite'))
+
+DAY = 24 * 60 * 60
+ENDPOINT_TTLS = {
+    'keyword': 7 * DAY,      # 장소 검색 (주소/좌표는 잘 바뀌지 않음)
+    'directions': 1 * DAY,   # 자동차 길찾기 (교통 상황 반영)
+}
+DEFAULT_TTL = 1 * DAY
+STALE_GRACE = {
+    'keyword': 30 * DAY,
+    'directions': 7 * DAY,
+}
+NEGATIVE_TTL = 5 * 60
+LEASE_SECONDS = 15
+LEASE_POLL_SECONDS = 0.1
+
+
+class CachedFailure(Exception):
+    """NEGATIVE_TTL 안에 같은 요청이 실패했던 기록이 있을 때."""
+
+
+class ResponseCache:
+    def __init__(self, path=CACHE_PATH, ttls=None, stale_grace=None, negative_ttl=NEGATIVE_TTL):
+        self.path = path
+        self.ttls = dict(ENDPOINT_TTLS, **(ttls or {}))
+        self.stale_grace = dict(STALE_GRACE, **(stale_grace or {}))
+        self.negative_ttl = negative_ttl
+        self.owner = uuid.uuid4().hex
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.stats = {'hit': 0, 'stale': 0, 'negative': 0, 'miss': 0, 'coalesced': 0}
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY, endpoint TEXT, payload TEXT, ok INTEGER, error TEXT,
+            fetched_at REAL, expires_at REAL, failed_at REAL)""")
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(responses)")]
+        if 'failed_at' not in columns:   # failed_at 이전에 만든 캐시 파일
+            conn.execute("ALTER TABLE responses ADD COLUMN failed_at REAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT, until REAL)")
+        conn.commit()
+
+    # --- 1. 저장소 ---
+    def _conn(self):
+        """스레드마다 연결 하나 (sqlite3 연결은 스레드 간 공유하지 않습니다)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def key(endpoint, params):
+        raw = endpoint + json.dumps(params, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def _read(self, key):
+        return self._conn().execute(
+            "SELECT payload, ok, error, expires_at, failed_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+    def _write(self, key, endpoint, payload=None, error=None):
+        now = time.time()
+        ok = error is None
+        ttl = self.ttls.get(endpoint, DEFAULT_TTL) if ok else self.negative_ttl
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (key, endpoint, json.dumps(payload, ensure_ascii=False) if ok else None,
+             int(ok), error, now, now + ttl, None if ok else now),
+        )
+        conn.commit()
+
+    def _in_grace(self, row, endpoint, now):
+        """정상 값이고 만료 후 STALE_GRACE 안인지."""
+        return bool(row[1]) and now < row[3] + self.stale_grace.get(endpoint, 0)
+
+    def _record_failure(self, key, endpoint, error):
+        """이전 정상 값이 STALE_GRACE 안이면 값은 두고 실패 시각만, 아니면 실패 항목을 씁니다."""
+        now = time.time()
+        row = self._read(key)
+        if row is not None and self._in_grace(row, endpoint, now):
+            conn = self._conn()
+            conn.execute("UPDATE responses SET error = ?, failed_at = ? WHERE key = ?", (error, now, key))
+            conn.commit()
+        else:
+            self._write(key, endpoint, error=error)
+
+    def prune(self):
+        """STALE_GRACE 까지 지난 항목과 만료된 임대를 지웁니다."""
+        now = time.time()
+        conn = self._conn()
+        longest_grace = max(self.stale_grace.values(), default=0)
+        conn.execute("DELETE FROM responses WHERE expires_at + ? < ?", (longest_grace, now))
+        conn.execute("DELETE FROM leases WHERE until < ?", (now,))
+        conn.commit()
+
+    # --- 2. 프로세스 간 임대 ---
+    def _acquire_lease(self, key):
+        now = time.time()
+        conn = self._conn()
+        conn.execute("DELETE FROM leases WHERE key = ? AND until < ?", (key, now))
+        cursor = conn.execute("INSERT OR IGNORE INTO leases VALUES (?, ?, ?)", (key, self.owner, now + LEASE_SECONDS))
+        conn.commit()
+        return cursor.rowcount == 1
+
+    def _release_lease(self, key):
+        conn = self._conn()
+        conn.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, self.owner))
+        conn.commit()
+
+    def _wait_for_other_process(self, key, since):
+        """
+        다른 프로세스가 받아오는 중이면 결과가 써질 때까지(최대 LEASE_SECONDS) 기다립니다.
+        (실패해서 이전 값에 실패 시각만 남긴 경우도 결과로 봅니다)
+        """
+        deadline = time.time() + LEASE_SECONDS
+        while time.time() < deadline:
+            time.sleep(LEASE_POLL_SECONDS)
+            row = self._conn().execute(
+                "SELECT payload, ok, error, expires_at, failed_at FROM responses "
+                "WHERE key = ? AND (fetched_at >= ? OR failed_at >= ?)", (key, since, since)
+            ).fetchone()
+            if row is not None:
+                return row
+        return None
+
+    # --- 3. 조회 ---
+    @staticmethod
+    def _unpack(row):
+        payload, ok, error = row[:3]
+        if not ok:
+            raise CachedFailure(error)
+        return json.loads(payload)
+
+    def get_or_fetch(self, endpoint, params, fetch):
+        """
+        캐시된 값 또는 fetch() 결과를 반환합니다.
+        fetch()가 예외를 내면 짧은 실패 기록을 남기고 예외를 그대로 올립니다.
+        """
+        key = self.key(endpoint, params)
+        row = self._read(key)
+        now = time.time()
+        if row is not None:
+            expires_at = row[3]
+            if now < expires_at:
+                self.stats['hit' if row[1] else 'negative'] += 1
+                return self._unpack(row)
+            if self._in_grace(row, endpoint, now):
+                self.stats['stale'] += 1
+                failed_at = row[4]
+                if failed_at is None or now >= failed_at + self.negative_ttl:
+                    self._revalidate(endpoint, key, fetch)
+                return self._unpack(row)
+        self.stats['miss'] += 1
+        return self._fetch_coalesced(endpoint, key, fetch).result()
+
+    def _revalidate(self, endpoint, key, fetch):
+        with self._lock:
+            if key in self._inflight:
+                return
+        thread = threading.Thread(target=self._fetch_quietly, args=(endpoint, key, fetch), daemon=True)
+        thread.start()
+
+    def _fetch_quietly(self, endpoint, key, fetch):
+        future = self._fetch_coalesced(endpoint, key, fetch)
+        try:
+            future.result()
+        except Exception as e:
+            print(f"Kakao cache revalidate error ({endpoint}): {e}")
+
+    def _fetch_coalesced(self, endpoint, key, fetch):
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self.stats['coalesced'] += 1
+                return future
+            future = Future()
+            self._inflight[key] = future
+
+        try:
+            started = time.time()
+            if not self._acquire_lease(key):
+                row = self._wait_for_other_process(key, started)
+                if row is not None:
+                    self.stats['coalesced'] += 1
+                    future.set_result(self._unpack(row))
+                    return future
+            try:
+                value = fetch()
+            except Exception as e:
+                self._record_failure(key, endpoint, str(e))
+                raise
+            else:
+                self._write(key, endpoint, payload=value)
+                future.set_result(value)
+            finally:
+                self._release_lease(key)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return future
+
+
+_cache = {'instance': None}
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 공용 ResponseCache (첫 호출 때 오래된 항목 정리)."""
+    with _cache_lock:
+        if _cache['instance'] is None:
+            _cache['instance'] = ResponseCache()
+            _cache['instance'].prune()
+        return _cache['instance']
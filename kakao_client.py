@@ -0,0 +1,233 @@
+"""
+Kakao HTTP 클라이언트 (연결 풀 + 타임아웃 + 재시도 + 속도 제한 + 지연 통계)
+
+모든 Kakao 호출(kakao_api, geocode_accommodation)이 프로세스 공용 클라이언트 하나를 씁니다.
+- requests.Session + HTTPAdapter 연결 풀로 keep-alive (요청마다 TLS 핸드셰이크를 하지 않음)
+- 연결/읽기 타임아웃 (TIMEOUT)
+- 429/5xx 와 연결 오류는 지수 백오프 + full jitter 로 MAX_RETRIES 번까지 재시도 (Retry-After 존중)
+- 토큰 버킷으로 서버 전체 초당 요청 수 제한 (KAKAO_RATE_PER_SEC, KAKAO_BURST)
+  버킷 상태는 kakao_cache 의 SQLite 파일(rate_buckets 테이블)에 있어, 같은 파일을 쓰는 모든
+  워커 프로세스와 geocode_accommodation 작업이 한 버킷을 나눠 씁니다. (모두 같은 속도로 설정하세요)
+  파일을 열 수 없으면 프로세스 전용 버킷으로 대신하며, 그때는 제한이 프로세스마다 따로 적용됩니다.
+- 엔드포인트별 호출 수/오류/재시도/지연(평균, p50, p95, 최대) 카운터: get_client().stats()
+
+requests 는 첫 클라이언트를 만들 때 import 합니다. (캐시만 읽는 페이지는 불러오지 않음)
+"""
+import os
+import random
+import sqlite3
+import threading
+import time
+import urllib.parse
+from collections import deque
+
+import kakao_cache
+
+KAKAO_API_KEY = os.environ.get('KAKAO_API_KEY', "bf3481d1f6e13e299cc42b118357ace8")
+TIMEOUT = (3.05, 10)          # (연결, 읽기) 초
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RATE_PER_SEC = float(os.environ.get('KAKAO_RATE_PER_SEC', 10))
+BURST = int(os.environ.get('KAKAO_BURST', 20))
+POOL_SIZE = 16
+LATENCY_WINDOW = 1000
+BUCKET_NAME = 'kakao'
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷. acquire()는 토큰이 생길 때까지 기다립니다."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SharedTokenBucket:
+    """
+    TokenBucket 과 같지만 (남은 토큰, 갱신 시각)을 SQLite 행 하나에 두고 BEGIN IMMEDIATE 트랜잭션으로
+    갱신합니다. 같은 파일을 여는 모든 프로세스가 한 버킷을 나눠 쓰므로 합계 요청 수가 제한됩니다.
+    """
+
+    def __init__(self, path, rate, capacity, name=BUCKET_NAME):
+        self.path = path
+        self.rate = rate
+        self.capacity = capacity
+        self.name = name
+        self._local = threading.local()
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS rate_buckets (name TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+        conn.execute("INSERT OR IGNORE INTO rate_buckets VALUES (?, ?, ?)", (name, float(capacity), time.time()))
+
+    def _conn(self):
+        """스레드마다 연결 하나 (자동 커밋, 트랜잭션은 직접 엽니다)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def _take(self):
+        """토큰 하나를 가져갔으면 0, 모자라면 기다릴 초."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            row = conn.execute("SELECT tokens, updated FROM rate_buckets WHERE name = ?", (self.name,)).fetchone()
+            tokens, updated = row if row is not None else (float(self.capacity), now)
+            # 프로세스마다 시계가 조금 달라도 토큰이 거꾸로 줄지 않도록 합니다.
+            updated = min(updated, now)
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+            if not wait:
+                tokens -= 1
+            conn.execute("INSERT OR REPLACE INTO rate_buckets VALUES (?, ?, ?)", (self.name, tokens, now))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return wait
+
+    def acquire(self):
+        while True:
+            wait = self._take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+def shared_bucket(rate=RATE_PER_SEC, burst=BURST, path=None):
+    """kakao_cache 파일의 서버 공용 버킷. 열 수 없으면 프로세스 전용 TokenBucket."""
+    try:
+        return SharedTokenBucket(path or kakao_cache.CACHE_PATH, rate, burst)
+    except sqlite3.Error as e:
+        print(f"Kakao rate limit: shared bucket unavailable, using a per-process limit ({e})")
+        return TokenBucket(rate, burst)
+
+
+class LatencyStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def record(self, endpoint, seconds, ok, retries):
+        with self._lock:
+            entry = self._endpoints.setdefault(endpoint, {
+                'calls': 0, 'errors': 0, 'retries': 0, 'total': 0.0, 'max': 0.0,
+                'recent': deque(maxlen=LATENCY_WINDOW),
+            })
+            entry['calls'] += 1
+            entry['errors'] += 0 if ok else 1
+            entry['retries'] += retries
+            entry['total'] += seconds
+            entry['max'] = max(entry['max'], seconds)
+            entry['recent'].append(seconds)
+
+    def snapshot(self):
+        """{엔드포인트: {calls, errors, retries, mean_ms, p50_ms, p95_ms, max_ms}}"""
+        with self._lock:
+            result = {}
+            for endpoint, entry in self._endpoints.items():
+                recent = sorted(entry['recent'])
+                result[endpoint] = {
+                    'calls': entry['calls'],
+                    'errors': entry['errors'],
+                    'retries': entry['retries'],
+                    'mean_ms': entry['total'] / entry['calls'] * 1000,
+                    'p50_ms': recent[len(recent) // 2] * 1000 if recent else 0.0,
+                    'p95_ms': recent[min(len(recent) - 1, int(len(recent) * 0.95))] * 1000 if recent else 0.0,
+                    'max_ms': entry['max'] * 1000,
+                }
+            return result
+
+
+class KakaoClient:
+    def __init__(self, api_key=KAKAO_API_KEY, rate=RATE_PER_SEC, burst=BURST, timeout=TIMEOUT,
+                 max_retries=MAX_RETRIES, pool_size=POOL_SIZE, bucket=None):
+        """bucket 이 없으면 이 클라이언트 전용 TokenBucket(rate, burst)을 씁니다."""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self._requests = requests
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.bucket = bucket or TokenBucket(rate, burst)
+        self.latency = LatencyStats()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers['Authorization'] = f"KakaoAK {api_key}"
+
+    @staticmethod
+    def _backoff(attempt, response=None):
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return min(BACKOFF_CAP, float(retry_after))
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+    def get_json(self, url, params):
+        """
+        GET 후 JSON을 반환합니다. 429/5xx/연결 오류는 재시도하고,
+        그래도 실패하거나 다른 4xx면 requests 예외를 올립니다.
+        """
+        endpoint = urllib.parse.urlparse(url).path
+        start = time.perf_counter()
+        attempt = 0
+        try:
+            while True:
+                self.bucket.acquire()
+                try:
+                    response = self.session.get(url, params=params, timeout=self.timeout)
+                except (self._requests.ConnectionError, self._requests.Timeout):
+                    if attempt >= self.max_retries:
+                        raise
+                    time.sleep(self._backoff(attempt))
+                    attempt += 1
+                    continue
+
+                if response.status_code in RETRY_STATUS and attempt < self.max_retries:
+                    time.sleep(self._backoff(attempt, response))
+                    attempt += 1
+                    continue
+                response.raise_for_status()
+                result = response.json()
+                self.latency.record(endpoint, time.perf_counter() - start, True, attempt)
+                return result
+        except Exception:
+            self.latency.record(endpoint, time.perf_counter() - start, False, attempt)
+            raise
+
+    def stats(self):
+        return self.latency.snapshot()
+
+
+_client = {'instance': None}
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 공용 KakaoClient (요청 수 제한은 서버 공용 버킷)."""
+    with _client_lock:
+        if _client['instance'] is None:
+            _client['instance'] = KakaoClient(bucket=shared_bucket())
+        return _client['instance']
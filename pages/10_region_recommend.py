@@ -3,34 +3,34 @@ import pandas as pd
 import os
 import navigation
 import urllib.parse
-import requests 
+import kakao_api
+import region_recommend
 
 st.set_page_config(page_title="GOLDEN JEJU | 지역별 추천", layout="wide", initial_sidebar_state="collapsed")
 navigation.apply_theme()
 navigation.show_header(current_page="pages/10_지역별추천.py")
 
-# --- 카카오 API 키 및 URL 정의 ---
-KAKAO_API_KEY = "bf3481d1f6e13e299cc42b118357ace8"
-GEOCODE_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
+# --- 카카오 API 키 ---
+KAKAO_API_KEY = kakao_api.KAKAO_API_KEY
 
-# --- 1. 카카오 API 호출 함수 (캐시 적용) ---
-@st.cache_data
-def search_kakao_places(query, size=5):
+# 스냅샷(python region_recommend.py snapshot)이 있으면 API를 부르지 않고 그 결과를 보여줍니다.
+# 스냅샷이 없을 때만 아래 모드로 실시간 조회합니다.
+# 'all'   : 6개 지역 탭의 12개 검색을 동시에 보내고 한 번에 기다립니다.
+# 'active': 선택한 지역 2개 검색만 기다리고, 나머지 지역은 백그라운드로 미리 받아 둡니다.
+FETCH_MODE = os.environ.get('REGION_FETCH_MODE', 'all')
+
+# --- 1. 카카오 API 호출 결과 정리 (서버 공용 디스크 캐시 적용) ---
+def places_or_error(results, query):
     """
-    Kakao 키워드 검색 API를 호출하여 장소 목록(상위 5개)을 반환합니다.
+    region_recommend.fetch_many 결과에서 장소 목록(상위 5개)을 꺼냅니다. 오류면 안내 후 빈 목록.
     """
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": query, "size": size}
-    try:
-        response = requests.get(GEOCODE_URL, headers=headers, params=params)
-        response.raise_for_status() 
-        data = response.json()
-        return data.get('documents', []) 
-    except Exception as e:
+    result = results.get(query, [])
+    if isinstance(result, kakao_api.KakaoError):
         # API 키 할당량이 초과되었을 수도 있습니다.
-        st.error(f"Kakao API 호출 중 오류 (쿼리: {query}): {e}")
+        st.error(f"Kakao API 호출 중 오류 (쿼리: {query}): {result}")
         st.warning("API 키가 유효한지 또는 일일/월간 API 요청 할당량을 초과하지 않았는지 확인하세요.")
         return []
+    return result
 
 # --- 2. 찜하기 세션 초기화 ---
 if 'itinerary_basket' not in st.session_state:
@@ -52,20 +52,17 @@ def add_to_basket(place_name, lat, lon, source_type):
 
 # --- 4. [수정] 장소/맛집 리스트 표시 함수 (API 기반) ---
 # [수정] 'api_query_suffix' 인자 추가
-def display_places(filter_keyword, source_type, title, emoji, no_data_msg, api_query_suffix):
+def display_places(results, filter_keyword, source_type, title, emoji, no_data_msg):
     """
-    API를 호출하고, 결과를 st.container(border=True) 내에 표시합니다.
+    미리 받아 둔 검색 결과(results)를 st.container(border=True) 내에 표시합니다.
     """
     st.subheader(f"{emoji} {title}")
     
-    # --- [수정] ---
-    # 1. API 검색어 생성 (예: "애월 관광지", "제주시 맛집")
-    # "추천" 단어 제거
-    query = f"{filter_keyword} {api_query_suffix}" 
-    # --- ---
+    # 1. API 검색어 (예: "애월 관광지", "제주시 맛집")
+    query = region_recommend.query_for(filter_keyword, source_type)
     
-    # 2. API 호출
-    places_list = search_kakao_places(query, size=5)
+    # 2. 결과 꺼내기
+    places_list = places_or_error(results, query)
     
     # 3. 디자인 - 고정 높이 컨테이너
     with st.container(height=400):
@@ -100,49 +97,59 @@ st.info("이 페이지는 '스마트 추천맵'(사용자 필터링)과 달리,
 st.markdown("---")
 
 # 주요 지역 정의
-regions = {
-    "제주시(도심)": "제주시",
-    "애월읍": "애월",
-    "한림읍": "한림",
-    "서귀포시(도심)": "서귀포시",
-    "성산읍": "성산",
-    "중문": "중문"
-}
+regions = region_recommend.REGIONS
+
+def show_region(results, region_name):
+    region_keyword = regions[region_name] # 검색 키워드
+    st.header(f"🍊 {region_name} 추천 TOP 5")
+    
+    col_attr, col_food = st.columns(2)
+    
+    with col_attr:
+        with st.container(border=True):
+            display_places(
+                results,
+                filter_keyword=region_keyword,
+                source_type="map",
+                title="추천 관광지", 
+                emoji="🗺️",
+                no_data_msg=f"'{region_keyword} 관광지'를 찾을 수 없습니다."
+            )
+
+    with col_food:
+        with st.container(border=True):
+            display_places(
+                results,
+                filter_keyword=region_keyword,
+                source_type="food",
+                title="추천 맛집", 
+                emoji="🍲",
+                no_data_msg=f"'{region_keyword} 맛집'을 찾을 수 없습니다."
+            )
 
-tabs = st.tabs(list(regions.keys()))
+snapshot = region_recommend.load_snapshot()
 
-if not KAKAO_API_KEY:
+if snapshot is not None:
+    st.caption(f"추천 목록 기준 시각: {snapshot['created_at']}")
+    tabs = st.tabs(list(regions.keys()))
+    for tab, region_name in zip(tabs, regions):
+        with tab:
+            show_region(snapshot['queries'], region_name)
+elif not KAKAO_API_KEY:
     st.error("Kakao API 키가 설정되지 않았습니다. (API KEY가 코드에 하드코딩 되어있는지 확인하세요)")
+elif FETCH_MODE == 'active':
+    # st.tabs는 모든 탭 내용을 한 번에 그리므로, 선택한 지역만 그리도록 라디오로 고릅니다.
+    region_name = st.radio("지역", list(regions.keys()), horizontal=True, label_visibility="collapsed")
+    active_keyword = regions[region_name]
+    results = region_recommend.fetch_many(region_recommend.all_queries([active_keyword]))
+    region_recommend.prefetch(region_recommend.all_queries(
+        [keyword for keyword in regions.values() if keyword != active_keyword]
+    ))
+    show_region(results, region_name)
 else:
-    for i, tab in enumerate(tabs):
-        region_name = list(regions.keys())[i] # 탭 이름
-        region_keyword = regions[region_name] # 검색 키워드
-        
+    # 12개 검색을 동시에 보내고 한 번만 기다립니다.
+    results = region_recommend.fetch_many(region_recommend.all_queries())
+    tabs = st.tabs(list(regions.keys()))
+    for tab, region_name in zip(tabs, regions):
         with tab:
-            st.header(f"🍊 {region_name} 추천 TOP 5")
-            
-            col_attr, col_food = st.columns(2)
-            
-            with col_attr:
-                with st.container(border=True):
-                    # [수정] api_query_suffix="관광지", no_data_msg 수정
-                    display_places(
-                        filter_keyword=region_keyword,
-                        source_type="map",
-                        title="추천 관광지", 
-                        emoji="🗺️",
-                        api_query_suffix="관광지", # "추천" 제거
-                        no_data_msg=f"'{region_keyword} 관광지'를 찾을 수 없습니다."
-                    )
-
-            with col_food:
-                with st.container(border=True):
-                    # [수정] api_query_suffix="맛집", no_data_msg 수정
-                    display_places(
-                        filter_keyword=region_keyword,
-                        source_type="food",
-                        title="추천 맛집", 
-                        emoji="🍲",
-                        api_query_suffix="맛집", # "추천" 제거
-                        no_data_msg=f"'{region_keyword} 맛집'을 찾을 수 없습니다."
-                    )
\ No newline at end of file
+            show_region(results, region_name)
\ No newline at end of file
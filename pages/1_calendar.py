@@ -1,8 +1,7 @@
 import streamlit as st
 import pandas as pd
-import os
-import datetime
 import navigation # [수정] navigation 임포트
+import theme_calendar
 
 st.set_page_config(
     page_title="GOLDEN JEJU | 관광 쾌적도 캘린더",
@@ -15,43 +14,8 @@ navigation.apply_theme()
 navigation.show_header(current_page="pages/1_쾌적도캘린더.py") 
 # --- ---
 
-# --- (기존 app.py의 데이터 로드 함수들) ---
-data_folder_name = '데이터'
-data_path = data_folder_name
-final_themes_file = os.path.join(data_path, 'golden_compass_final_themes.csv')
-
-@st.cache_data
-def load_data(file_path):
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(file_path)
-        df['날짜'] = pd.to_datetime(df['날짜'])
-        df['월_라벨'] = df['날짜'].dt.strftime('%Y년 %m월')
-        df['월'] = df['날짜'].dt.month
-        df['월_str'] = df['날짜'].dt.strftime('%m월')
-        df['년'] = df['날짜'].dt.year
-
-        labels_5 = ["매우\n쾌적", "쾌적", "보통", "혼잡", "매우\n혼잡"]
-
-        if '관광 포화 지수' in df.columns:
-            df['쾌적도 라벨'] = pd.qcut(df['관광 포화 지수'], 5, labels=labels_5, duplicates='drop')
-        else:
-            df['쾌적도 라벨'] = "N/A"
-        if '웰니스 쾌적도' in df.columns:
-            df['웰니스 라벨'] = pd.qcut(df['웰니스 쾌적도'], 5, labels=labels_5, duplicates='drop')
-        else:
-            df['웰니스 라벨'] = "N/A"
-        if '골프 쾌적도' in df.columns:
-            df['골프 라벨'] = pd.qcut(df['골프 쾌적도'], 5, labels=labels_5, duplicates='drop')
-        else:
-            df['골프 라벨'] = "N/A"
-        return df.sort_values(by='날짜')
-    except Exception as e:
-        return pd.DataFrame()
-
 # --- (기존 app.py의 캘린더 그리기 함수) ---
-def draw_monthly_cards(df, year, label_col):
+def draw_monthly_cards(calendar, year, label_col):
     st.markdown(f"#### {year}년")
     
     status_map = {
@@ -63,15 +27,13 @@ def draw_monthly_cards(df, year, label_col):
         "N/A": "❓"
     }
 
-    df_year = df[df['년'] == year]
     cols = st.columns(12)
     
     for month in range(1, 13):
         with cols[month-1]:
-            month_data = df_year[df_year['월'] == month]
+            label = calendar.label(label_col, year, month)
             
-            if not month_data.empty:
-                label = month_data[label_col].iloc[0]
+            if label is not None:
                 icon = status_map.get(label, "❓")
                 css_class = f"status-{label.replace(chr(10), '')}" 
             else:
@@ -90,14 +52,11 @@ def draw_monthly_cards(df, year, label_col):
 
 def calendar_page():
     
-    df_full = load_data(final_themes_file)
+    calendar = theme_calendar.load_theme_calendar()
 
-    if df_full.empty:
-        st.warning("데이터 파일을 찾을 수 없습니다. '데이터' 폴더를 확인해주세요.")
+    if calendar is None:
+        st.warning("데이터 파일을 찾을 수 없습니다. 'data' 폴더를 확인해주세요.")
         return
-        
-    df_future = df_full[df_full['날짜'] >= datetime.datetime(2025, 1, 1)].copy()
-    df_past = df_full[df_full['날짜'] < datetime.datetime(2025, 1, 1)].copy()
 
     # --- (기존 app.py의 메인 영역 내용) ---
     st.subheader("📅 관광 쾌적도 캘린더 (예측)")
@@ -130,16 +89,16 @@ def calendar_page():
         "⛳ 골프 쾌적도"
     ])
     with tab1:
-        draw_monthly_cards(df_future, 2025, '쾌적도 라벨')
-        draw_monthly_cards(df_future, 2026, '쾌적도 라벨')
+        draw_monthly_cards(calendar, 2025, '쾌적도 라벨')
+        draw_monthly_cards(calendar, 2026, '쾌적도 라벨')
     with tab2:
         st.info("💡 **웰니스 쾌적도란?** \n\n과거 데이터(방문자 수, 검색량 등)를 기반으로 명상, 스파, 힐링, 산책 등 '웰니스' 활동에 얼마나 쾌적한지를 나타내는 예측 지수입니다.")
-        draw_monthly_cards(df_future, 2025, '웰니스 라벨')
-        draw_monthly_cards(df_future, 2026, '웰니스 라벨')
+        draw_monthly_cards(calendar, 2025, '웰니스 라벨')
+        draw_monthly_cards(calendar, 2026, '웰니스 라벨')
     with tab3:
         st.info("💡 **골프 쾌적도란?** \n\n과거 데이터(골프장 방문자 수, 날씨, 이용 요금 등)를 기반으로 골프 활동에 얼마나 쾌적한지를 나타내는 예측 지수입니다.")
-        draw_monthly_cards(df_future, 2025, '골프 라벨')
-        draw_monthly_cards(df_future, 2026, '골프 라벨')
+        draw_monthly_cards(calendar, 2025, '골프 라벨')
+        draw_monthly_cards(calendar, 2026, '골프 라벨')
 
     st.markdown("---")
     
@@ -148,9 +107,9 @@ def calendar_page():
         st.subheader("과거 쾌적도 캘린더 (비교용)")
         tab_past1, tab_past2 = st.tabs(["2023년", "2024년"])
         with tab_past1:
-            draw_monthly_cards(df_past, 2023, '쾌적도 라벨')
+            draw_monthly_cards(calendar, 2023, '쾌적도 라벨')
         with tab_past2:
-            draw_monthly_cards(df_past, 2024, '쾌적도 라벨')
+            draw_monthly_cards(calendar, 2024, '쾌적도 라벨')
     # --- ---
 
 if __name__ == "__main__":
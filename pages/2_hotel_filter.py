@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
-import os
 import navigation
+import data_loader
+import accommodation_index
+import accommodation_features
 import urllib.parse
-import requests
 
 st.set_page_config(page_title="GOLDEN JEJU | 맞춤 숙소 찾기", layout="wide", initial_sidebar_state="collapsed")
 # --- [수정됨] ---
@@ -11,46 +12,21 @@ navigation.apply_theme()
 navigation.show_header(current_page="pages/2_숙소필터.py")
 # --- ---
 
-# --- 1. KAKAO API 설정 ---
-KAKAO_API_KEY = "bf3481d1f6e13e299cc42b118357ace8"
-GEOCODE_URL = "https.dapi.kakao.com/v2/local/search/keyword.json"
+# --- 1. 주소 표시 ---
+# 주소는 geocode_accommodation.py 가 미리 채운 컬럼만 읽습니다. (페이지에서는 API를 부르지 않습니다)
+def format_address(row):
+    return row.get('주소') or row.get('도로명주소') or "주소 정보 없음"
 
-# --- 2. API 호출 함수 (주소 반환용) ---
-@st.cache_data
-def get_address_kakao(place_name):
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": f"제주 {place_name}"}
-    try:
-        response = requests.get(GEOCODE_URL, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        if data['documents']:
-            doc = data['documents'][0]
-            return doc.get('address_name', doc.get('road_address_name', '주소 정보 없음'))
-    except Exception as e:
-        print(f"Kakao Geocoding Error for {place_name}: {e}")
-    return "주소 정보를 불러올 수 없습니다."
-
-# --- 3. 데이터 로드 ---
-data_folder_name = '데이터'
-data_path = data_folder_name
-accom_file = os.path.join(data_path, 'golden_compass_accommodation_clean.csv')
-
-@st.cache_data
-def load_accom_data(file_path):
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    try:
-        return pd.read_csv(file_path)
-    except Exception as e:
-        return pd.DataFrame()
+# --- 3. 결과 정렬/페이지 설정 ---
+SORT_OPTIONS = {"기본 순": None, "등급 높은 순": 'grade_desc', "이름 순": 'name'}
+PAGE_SIZE_OPTIONS = [10, 20, 50]
 
 # --- 4. UI ---
 def show_accom_page():
     st.title("🏨 맞춤 숙소 찾기")
     st.caption("액티브 시니어에게 중요한 '편의성'을 기준으로 숙소를 필터링합니다.")
     
-    df_accom = load_accom_data(accom_file)
+    df_accom = data_loader.load_accommodation()
     if df_accom.empty:
         st.warning("숙소 데이터 파일을 찾을 수 없습니다.")
         # return # [수정] 데이터가 없어도 필터는 보이도록 주석 처리
@@ -79,7 +55,7 @@ def show_accom_page():
         st.markdown("**(3) 시설/서비스 (다중 선택)**")
         selected_amenities = st.multiselect(
             "시설/서비스",
-            ["주차 가능", "반려동물 동반", "스파", "객실 금연", "OTT 제공"],
+            list(accommodation_features.FACILITY_OPTIONS),
             placeholder="원하는 시설/서비스를 선택하세요.",
             label_visibility="collapsed"
         )
@@ -103,30 +79,64 @@ def show_accom_page():
         
     st.markdown("---")
 
-    # (데이터 필터링 로직은 요청대로 비워둡니다)
-    # df_accom = ... (위에서 선택한 selected_location, selected_types, selected_amenities 등으로 필터링)
-
-    filtered_accom = df_accom[(df_accom['등급'] >= rating_range[0]) & (df_accom['등급'] <= rating_range[1])]
-    
-    if chk_breakfast:
-        filtered_accom = filtered_accom[filtered_accom['조식제공여부'] == 'O']
-    if chk_accessible:
-        filtered_accom = filtered_accom[filtered_accom['장애인전용객실여부'] == 'O']
-    if chk_pet:
-        filtered_accom = filtered_accom[filtered_accom['애완동물동반허용여부'] == 'O']
-    if chk_late_checkin:
-        filtered_accom = filtered_accom[filtered_accom['LATE체크인여부'] == 'O']
-    if chk_shuttle:
-        filtered_accom = filtered_accom[filtered_accom['셔틀버스운행여부'] == 'O']
+    # 시니어 편의 옵션은 비트마스크 AND 한 번으로, 위치/유형/시설은 역색인 교집합으로 필터링
+    # (조합별 결과는 인덱스에 메모이즈)
+    required = [col for col, checked in [
+        ('조식제공여부', chk_breakfast),
+        ('장애인전용객실여부', chk_accessible),
+        ('애완동물동반허용여부', chk_pet),
+        ('LATE체크인여부', chk_late_checkin),
+        ('셔틀버스운행여부', chk_shuttle),
+    ] if checked]
+    accom_index = accommodation_index.load_accommodation_index()
+    regions = [] if selected_location == "제주도 전체" else [selected_location]
+    include_unknown = False
+    if regions and accom_index is not None and accom_index.count_untagged('지역'):
+        # 주소/좌표/이름 어디에서도 지역을 알 수 없는 숙소는 빼지 않고 '위치 미상'으로 함께 보여줍니다.
+        include_unknown = st.checkbox(
+            f"위치 미상 숙소 {accom_index.count_untagged('지역')}곳도 함께 보기", value=True
+        )
+        if include_unknown:
+            regions.append(accommodation_features.UNKNOWN_REGION)
+    if accom_index is None:
+        result_ids = []
+    else:
+        facilities = [accommodation_features.FACILITY_OPTIONS[a] for a in selected_amenities]
+        result_ids = accom_index.filter(
+            rating_range, required, types=selected_types, facilities=facilities, regions=regions
+        )
             
-    st.markdown(f"**총 {len(filtered_accom)}개의 숙소가 검색되었습니다.**")
+    st.markdown(f"**총 {len(result_ids)}개의 숙소가 검색되었습니다.**")
+
+    # 현재 페이지에 해당하는 숙소만 만들어 화면에 보냅니다.
+    col_sort, col_size, col_page = st.columns([2, 1, 1])
+    with col_sort:
+        sort_label = st.selectbox("정렬", list(SORT_OPTIONS))
+    with col_size:
+        page_size = st.selectbox("페이지당 숙소 수", PAGE_SIZE_OPTIONS, index=1)
+    total_pages = accommodation_index.AccommodationIndex.page_count(len(result_ids), page_size)
+
+    # 조건이 바뀌면 1페이지로 돌아갑니다.
+    page_key = (rating_range, tuple(required), tuple(selected_types), tuple(selected_amenities),
+                selected_location, include_unknown, sort_label, page_size)
+    if st.session_state.get('accom_page_key') != page_key or st.session_state.get('accom_page', 1) > total_pages:
+        st.session_state['accom_page_key'] = page_key
+        st.session_state['accom_page'] = 1
+    with col_page:
+        page = st.number_input(f"페이지 (총 {total_pages})", min_value=1, max_value=total_pages, step=1,
+                               key='accom_page')
     st.markdown("---")
 
+    if accom_index is None or len(result_ids) == 0:
+        page_accom = df_accom.iloc[0:0]
+    else:
+        page_accom = accom_index.page(accom_index.sort(result_ids, SORT_OPTIONS[sort_label]), page, page_size)
+
     with st.container(height=600):
-        if filtered_accom.empty:
+        if page_accom.empty:
             st.info("선택한 조건에 맞는 숙소가 없습니다.")
         else:
-            for index, row in filtered_accom.iterrows():
+            for index, row in page_accom.iterrows():
                 with st.container():
                     cols = st.columns([3, 1])
                     with cols[0]:
@@ -135,9 +145,7 @@ def show_accom_page():
                         else:
                             st.markdown(f"#### {row['콘텐츠명']}")
                         
-                        # --- API로 주소 가져오기 ---
-                        address = get_address_kakao(row['콘텐츠명'])
-                        st.caption(f"📍 {address}")
+                        st.caption(f"📍 {format_address(row)}")
                         # --- ---
                         
                         amenities = []
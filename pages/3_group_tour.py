@@ -3,6 +3,7 @@ import pandas as pd
 import os
 import datetime
 import navigation
+import theme_calendar
 import urllib.parse
 
 # --- [수정됨] (항목 2) ---
@@ -11,47 +12,23 @@ navigation.apply_theme()
 navigation.show_header(current_page="pages/3_황금동행.py")
 # --- ---
 
-data_folder_name = '데이터'
-data_path = data_folder_name
-final_themes_file = os.path.join(data_path, 'golden_compass_final_themes.csv')
-
 image1_path = "image1.jpg"
 image2_path = "image2.jpg"
 
-@st.cache_data
-def load_data(file_path):
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(file_path)
-        df['날짜'] = pd.to_datetime(df['날짜'])
-        return df.set_index('날짜')
-    except Exception as e:
-        return pd.DataFrame()
-
 def show_tour_page():
     # --- [수정됨] (항목 2) ---
     st.title("🚌 황금 단체투어 (소셜 투어)") # 이름 수정
     st.caption("개인도 신청 가능한 단체 투어! 데이터로 검증된 쾌적한 날, 비슷한 연령대의 새로운 사람들과 함께 떠나보세요.")
     # --- ---
     
-    df_themes = load_data(final_themes_file)
-    if df_themes.empty:
+    calendar = theme_calendar.load_theme_calendar()
+    if calendar is None:
         st.warning("테마 데이터 파일을 찾을 수 없습니다.")
         return
 
-    try:
-        data_march = df_themes.loc[datetime.datetime(2026, 3, 1)]
-        wellness_score = data_march['웰니스 쾌적도']
-        bus_rate = data_march['전세버스 가동률']
-    except KeyError:
-        wellness_score = 0.35 
-        bus_rate = 22.0
-    try:
-        data_april = df_themes.loc[datetime.datetime(2026, 4, 1)]
-        golf_score = data_april['골프 쾌적도']
-    except KeyError:
-        golf_score = -0.15
+    wellness_score = calendar.metric('웰니스 쾌적도', 2026, 3, default=0.35)
+    bus_rate = calendar.metric('전세버스 가동률', 2026, 3, default=22.0)
+    golf_score = calendar.metric('골프 쾌적도', 2026, 4, default=-0.15)
 
     st.subheader("🚌 현재 모집중인 GOLDEN J 소셜 투어")
     
@@ -1,10 +1,10 @@
 import streamlit as st
 import pandas as pd
-import os
 import datetime
-import numpy as np
 import navigation
-import requests
+import data_loader
+import theme_calendar
+import kakao_api
 import urllib.parse
 
 # --- [수정됨] (항목 2) ---
@@ -13,52 +13,22 @@ navigation.apply_theme()
 navigation.show_header(current_page="pages/4_황금원패스.py")
 # --- ---
 
-# --- 1. KAKAO API 설정 ---
-KAKAO_API_KEY = "bf3481d1f6e13e299cc42b118357ace8"
-GEOCODE_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
-
-# --- 2. API 호출 함수 (주소 반환용) ---
-@st.cache_data
+# --- 1. KAKAO API 호출 함수 (주소 반환용, 서버 공용 디스크 캐시 적용) ---
 def get_place_info_kakao(place_name):
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": f"제주 {place_name}"}
     try:
-        response = requests.get(GEOCODE_URL, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        if data['documents']:
-            doc = data['documents'][0]
+        documents = kakao_api.search_keyword(f"제주 {place_name}")
+        if documents:
+            doc = documents[0]
             address = doc.get('address_name', doc.get('road_address_name', '주소 정보 없음'))
             naver_link = f"https://map.naver.com/v5/search/{urllib.parse.quote(f'제주 {place_name}')}"
             return address, naver_link
-    except Exception as e:
+    except kakao_api.KakaoError as e:
         print(f"Kakao Geocoding Error for {place_name}: {e}")
     
     # 실패 시 기본값 반환
     naver_link = f"https://map.naver.com/v5/search/{urllib.parse.quote(f'제주 {place_name}')}"
     return "주소 정보를 불러올 수 없습니다.", naver_link
 
-# --- 3. 데이터 로드 ---
-data_folder_name = '데이터'
-data_path = data_folder_name
-final_themes_file = os.path.join(data_path, 'golden_compass_final_themes.csv')
-accom_file = os.path.join(data_path, 'golden_compass_accommodation_clean.csv')
-foodie_file = os.path.join(data_path, 'golden_compass_foodie_ranking.csv')
-
-@st.cache_data
-def load_data(file_path):
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(file_path)
-        if '날짜' in df.columns:
-            df['날짜'] = pd.to_datetime(df['날짜'])
-            df['월_라벨'] = df['날짜'].dt.strftime('%Y년 %m월')
-            df['월'] = df['날짜'].dt.month
-        return df
-    except Exception as e:
-        return pd.DataFrame()
-
 # --- 4. UI ---
 def show_pass_page():
     # --- [수정됨] (항목 2) ---
@@ -66,12 +36,12 @@ def show_pass_page():
     st.caption("모든 데이터를 종합하여, 'GOLDEN JEJU'가 제안하는 최적의 큐레이션 패키지입니다.")
     # --- ---
     
-    df_themes = load_data(final_themes_file)
-    df_accom = load_data(accom_file)
-    df_foodie = load_data(foodie_file)
+    calendar = theme_calendar.load_theme_calendar()
+    df_accom = data_loader.load_accommodation()
+    df_foodie = data_loader.load_foodie_ranking()
     
-    if df_themes.empty or df_accom.empty or df_foodie.empty:
-        st.warning("데이터 로드 중 오류가 발생했습니다. '데이터' 폴더를 확인하세요.")
+    if calendar is None or df_accom.empty or df_foodie.empty:
+        st.warning("데이터 로드 중 오류가 발생했습니다. 'data' 폴더를 확인하세요.")
         return
 
     if 'booking_step' not in st.session_state:
@@ -99,9 +69,7 @@ def show_pass_page():
         selected_month = selected_date.month
         selected_month_label = selected_date.strftime('%Y년 %m월')
         
-        try:
-            selected_data = df_themes[df_themes['월_라벨'] == selected_month_label].iloc[0]
-        except (IndexError, KeyError):
+        if (selected_date.year, selected_month) not in calendar:
             st.error(f"{selected_month_label}의 데이터가 없습니다. CSV 파일을 확인하세요.")
             return
 
@@ -2,9 +2,7 @@ import streamlit as st
 import pandas as pd
 import os
 import datetime
-from PIL import Image
 import navigation
-import numpy as np
 
 st.set_page_config(page_title="GOLDEN JEJU | 제주이야기", layout="wide", initial_sidebar_state="collapsed")
 navigation.apply_theme()
@@ -106,6 +104,7 @@ if st.session_state.view_post_id is None:
                 image_path = None
                 if uploaded_image:
                     try:
+                        from PIL import Image
                         img = Image.open(uploaded_image)
                         now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                         file_extension = os.path.splitext(uploaded_image.name)[1]
@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 import os
 import datetime
-from PIL import Image
 import urllib.parse
 import navigation
 
@@ -43,6 +42,7 @@ def show_gourmet_page():
             else:
                 now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
                 image_path = os.path.join(upload_path, f"{now}_{nickname}{os.path.splitext(uploaded_image.name)[1]}")
+                from PIL import Image
                 Image.open(uploaded_image).save(image_path)
                 new_entry = pd.DataFrame([{"timestamp": now, "nickname": nickname, "restaurant_name": restaurant_name, 
                                            "region": region, "comment": comment, "image_path": image_path}])
@@ -4,9 +4,12 @@ import datetime
 import pandas as pd
 import os
 import numpy as np
-import requests
+import kakao_api
+import travel_matrix
+import route_planner
+import day_clustering
+import spatial_index
 import urllib.parse
-import pydeck as pdk 
 
 # --- 지도 관련 상수 ---
 ICON_URL = "https://raw.githubusercontent.com/visgl/deck.gl-data/master/website/icon-atlas.png"
@@ -14,59 +17,33 @@ ICON_MAPPING = {
     "marker": {"x": 0, "y": 0, "width": 128, "height": 128, "mask": True}
 }
 
-try:
-    from sklearn.cluster import KMeans
-    SKLEARN_AVAILABLE = True
-except ImportError:
-    SKLEARN_AVAILABLE = False
-
 
 st.set_page_config(page_title="GOLDEN JEJU | 나만의 여행 일정", layout="wide", initial_sidebar_state="collapsed")
 navigation.apply_theme()
 navigation.show_header(current_page="pages/7_나만의_여행일정.py")
 
-KAKAO_API_KEY = "bf3481d1f6e13e299cc42b118357ace8" # API 키는 원본 유지
-GEOCODE_URL = "https://dapi.kakao.com/v2/local/search/keyword.json"
-DIRECTIONS_URL = "https://apis-navi.kakao.com/v1/directions" 
-
-@st.cache_data
+# Kakao 호출은 kakao_api 를 거치며 응답은 서버 공용 디스크 캐시(kakao_cache)에 저장됩니다.
 def get_geocode_kakao(address):
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {"query": address}
     try:
-        response = requests.get(GEOCODE_URL, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        if data['documents']:
-            lat = float(data['documents'][0]['y'])
-            lon = float(data['documents'][0]['x'])
+        documents = kakao_api.search_keyword(address)
+        if documents:
+            lat = float(documents[0]['y'])
+            lon = float(documents[0]['x'])
             return (lat, lon)
-        else:
-            raise Exception(f"'{address}'에 대한 검색 결과가 없습니다.")
-    except Exception as e:
-        return (np.nan, np.nan) 
-
-@st.cache_data
-def get_driving_distance_kakao(start_lon, start_lat, goal_lon, goal_lat):
-    headers = {"Authorization": f"KakaoAK {KAKAO_API_KEY}"}
-    params = {
-        "origin": f"{start_lon},{start_lat}",
-        "destination": f"{goal_lon},{goal_lat}",
-        "summary": "true"
-    }
-    try:
-        response = requests.get(DIRECTIONS_URL, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        if data['routes']:
-            summary = data['routes'][0]['summary']
-            distance_km = summary['distance'] / 1000.0
-            duration_min = summary['duration'] / 60.0
-            return (distance_km, duration_min)
-        else:
-            raise Exception("경로를 찾을 수 없습니다.")
-    except Exception as e:
-        raise Exception(f"Kakao Directions Error: {e}")
+    except kakao_api.KakaoError:
+        pass
+    return (np.nan, np.nan)
+
+def has_coords(schedule):
+    return pd.notna(schedule['lat']) and pd.notna(schedule['lon'])
+
+# 하루 일정의 이동 거리/시간 행렬. 빠진 구간만 동시에 조회하고 (반올림 좌표 캐시),
+# API 실패 구간은 직선거리 기반 추정치로 채웁니다.
+def get_day_matrix(schedule_list):
+    points = [(s['lat'], s['lon']) for s in schedule_list]
+    pairs = [(i, i + 1) for i in range(len(schedule_list) - 1)
+             if has_coords(schedule_list[i]) and has_coords(schedule_list[i + 1])]
+    return travel_matrix.build(points, pairs)
 
 if 'my_itinerary' not in st.session_state:
     st.session_state.my_itinerary = {}
@@ -78,8 +55,8 @@ if 'itinerary_basket' not in st.session_state:
 if 'active_day_index' not in st.session_state:
     st.session_state.active_day_index = 0
 
-def add_schedule(date_str, time, place_name, memo, source="manual"):
-    lat, lon = get_geocode_kakao(place_name)
+def add_schedule(date_str, time, place_name, memo, source="manual", coords=None):
+    lat, lon = coords if coords is not None else get_geocode_kakao(place_name)
     
     new_schedule = {
         "time": time.strftime("%H:%M"), 
@@ -124,6 +101,48 @@ def update_schedule_time(date_str, index, session_key):
     except (KeyError, IndexError):
         st.error("시간 업데이트 중 오류가 발생했습니다.")
 
+# 일정 장소 주변의 맛집/관광지 (spatial_index 격자 인덱스 반경 검색). 누르면 찜한 장소에 추가합니다.
+def show_nearby_places(date_str, schedule_list):
+    stops = [s for s in schedule_list if has_coords(s)]
+    if not stops:
+        return
+
+    with st.expander("🧭 일정 장소 주변 추천"):
+        selected = st.selectbox(
+            "기준 장소", options=range(len(stops)),
+            format_func=lambda i: f"{stops[i]['time']} {stops[i]['place']}", key=f"nearby_stop_{date_str}"
+        )
+        radius_km = st.slider("반경 (km)", 1, 10, int(spatial_index.NEARBY_RADIUS_KM), key=f"nearby_radius_{date_str}")
+        stop = stops[selected]
+
+        catalogs = [
+            ("🍲 맛집", spatial_index.load_restaurant_index(), 'food'),
+            ("🗺️ 관광지", spatial_index.load_attraction_index(), 'map'),
+        ]
+        for col, (label, index, source) in zip(st.columns(2), catalogs):
+            with col:
+                st.markdown(f"**{label}**")
+                if index is None:
+                    st.caption("데이터가 없습니다.")
+                    continue
+                nearby = index.nearby(stop['lat'], stop['lon'], radius_km, exclude_name=stop['place'])
+                if nearby.empty:
+                    st.caption(f"{radius_km}km 안에 없습니다.")
+                for row_id, place in nearby.iterrows():
+                    place_name = place[index.name_column]
+                    label_text = f"➕ {place_name} · {place[spatial_index.DISTANCE_COLUMN]:.1f} km"
+                    if st.button(label_text, key=f"nearby_{date_str}_{source}_{row_id}", use_container_width=True, help="찜한 장소에 추가"):
+                        if place_name not in [item['name'] for item in st.session_state.itinerary_basket]:
+                            st.session_state.itinerary_basket.append({
+                                'name': place_name,
+                                'lat': place['lat'],
+                                'lon': place['lon'],
+                                'source': source
+                            })
+                            st.toast(f"'{place_name}'을(를) 찜했습니다!")
+                        else:
+                            st.toast(f"'{place_name}'은(는) 이미 찜한 장소입니다.")
+
 def set_active_day(index):
     st.session_state.active_day_index = index
 
@@ -141,10 +160,24 @@ def handle_course_selection(date_str, day_key):
 
     places_to_add = st.session_state.generated_courses[selected_course]
 
-    start_time = datetime.time(9, 0)
-    for i, place_name in enumerate(places_to_add):
-        current_time = (datetime.datetime.combine(datetime.date.today(), start_time) + datetime.timedelta(minutes=90*i)).time()
-        add_schedule(date_str, current_time, place_name, memo="자동 생성 코스", source="auto")
+    # 방문 순서는 이미 조회해 둔 구간의 실제 이동 시간(없는 구간만 직선거리 추정)으로 정하고 (API 호출 없음),
+    # 정해진 순서의 이웃 구간만 길찾기로 조회해 방문 시각을 실제 이동 시간 + 체류 시간으로 정합니다.
+    # (좌표를 모르는 장소는 맨 뒤에 붙입니다)
+    basket_coords = {item['name']: (item['lat'], item['lon']) for item in st.session_state.itinerary_basket}
+    coords = [basket_coords.get(name) or get_geocode_kakao(name) for name in places_to_add]
+    located = [i for i, (lat, lon) in enumerate(coords) if pd.notna(lat) and pd.notna(lon)]
+    unlocated = [i for i in range(len(places_to_add)) if i not in located]
+
+    order = route_planner.order_route(travel_matrix.cached_matrix([coords[i] for i in located]).duration_min)
+    route = [located[i] for i in order] + unlocated
+    ordered_points = [coords[i] for i in route[:len(located)]]
+    matrix = travel_matrix.build(ordered_points, travel_matrix.consecutive_pairs(len(ordered_points)))
+    legs = [matrix.duration_min[i, i + 1] for i in range(len(ordered_points) - 1)] + [0] * len(unlocated)
+    visit_times = route_planner.visit_times(legs)
+
+    for visit_time, place_index in zip(visit_times, route):
+        add_schedule(date_str, visit_time, places_to_add[place_index],
+                     memo="자동 생성 코스", source="auto", coords=coords[place_index])
     
     st.toast(f"{date_str}에 '{selected_course}' 일정이 자동 추가되었습니다!", icon="🗓️")
 
@@ -183,6 +216,9 @@ def visualize_itinerary(schedule_list, map_container):
         })
     df_paths = pd.DataFrame(paths)
     
+    # pydeck 은 실제로 지도를 그릴 때만 불러옵니다. (일정이 빈 날은 import 하지 않음)
+    import pydeck as pdk
+    
     line_layer = pdk.Layer(
         'LineLayer',
         data=df_paths,
@@ -290,10 +326,7 @@ if selected_dates and len(selected_dates) == 2:
         with col_auto_course:
             st.subheader("🤖 위치 기반 코스 생성")
             
-            if not SKLEARN_AVAILABLE:
-                st.error("자동 코스 생성 기능을 사용하려면 'scikit-learn' 라이브러리가 필요합니다.")
-                st.code("pip install scikit-learn", language="bash")
-            elif not basket_items:
+            if not basket_items:
                 st.warning("먼저 찜한 장소 목록에 1개 이상의 장소를 추가해주세요.")
             elif num_days > len(basket_items):
                 st.warning(f"여행 일수({num_days}일)가 찜한 장소 수({len(basket_items)}개)보다 많습니다. 장소를 더 추가해주세요.")
@@ -302,10 +335,10 @@ if selected_dates and len(selected_dates) == 2:
                 
                 if st.button("🗺️ 자동 코스 생성하기", type="primary", use_container_width=True):
                     locations_df = pd.DataFrame(basket_items)
-                    coordinates = locations_df[['lat', 'lon']].values
+                    coordinates = locations_df[['lat', 'lon']].values.tolist()
                     
-                    kmeans = KMeans(n_clusters=num_days, random_state=42, n_init=10)
-                    locations_df['cluster'] = kmeans.fit_predict(coordinates)
+                    # 하루 장소 수를 고르게 나누는 NumPy 묶기 (찜 목록/일수가 같으면 이전 결과 재사용)
+                    locations_df['cluster'] = day_clustering.cluster_days(coordinates, num_days)
                     
                     st.session_state.generated_courses = {}
                     
@@ -434,6 +467,7 @@ if selected_dates and len(selected_dates) == 2:
             schedule_list = []
         else:
             schedule_list = st.session_state.my_itinerary[current_date_str]
+            day_matrix = get_day_matrix(schedule_list)
             
             for idx, schedule in enumerate(schedule_list):
                 schedule_cols = st.columns([1, 3, 2, 1])
@@ -464,19 +498,18 @@ if selected_dates and len(selected_dates) == 2:
                 if idx > 0:
                     prev_schedule = schedule_list[idx-1]
                     
-                    if pd.notna(prev_schedule['lat']) and pd.notna(schedule['lat']):
-                        try:
-                            distance_km, duration_min = get_driving_distance_kakao(
-                                prev_schedule['lon'], prev_schedule['lat'],
-                                schedule['lon'], schedule['lat']
-                            )
+                    if has_coords(prev_schedule) and has_coords(schedule):
+                        distance_km, duration_min, estimated = day_matrix.leg(idx - 1, idx)
+                        if estimated:
+                            st.warning(f"🚗 {prev_schedule['place']}에서 약 **{distance_km:.1f} km** (예상 {duration_min:.0f} 분, 경로 탐색 실패로 직선거리 기준 추정)")
+                        else:
                             st.info(f"🚗 {prev_schedule['place']}에서 약 **{distance_km:.1f} km** (예상 {duration_min:.0f} 분)")
-                        except Exception as e:
-                            st.warning(f"🚗 {prev_schedule['place']}에서 경로 탐색에 실패했습니다. (API 오류)")
                     else:
                         st.info(f"🚗 (이전 장소 또는 현재 장소의 좌표를 찾을 수 없어 거리 계산이 불가능합니다.)")
                 
                 st.divider()
+            
+            show_nearby_places(current_date_str, schedule_list)
 
     # 5. 지도 렌더링 (활성화된 Day의 내용으로 map_container_placeholder를 덮어씁니다)
     visualize_itinerary(schedule_list, map_container_placeholder)
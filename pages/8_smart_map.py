@@ -1,16 +1,13 @@
 import streamlit as st
 import pandas as pd
-import pydeck as pdk
 import navigation
-import os
-import urllib.parse
+import data_loader
+import spatial_index
 
 st.set_page_config(page_title="GOLDEN JEJU | 스마트 추천맵", layout="wide", initial_sidebar_state="collapsed") 
 navigation.apply_theme()
 navigation.show_header(current_page="pages/8_스마트추천맵.py")
 
-DATA_FILE_PATH = os.path.join("데이터", "jeju_places_mean.xlsx")
-
 # --- [수정됨] (항목 3) ---
 # "https.raw..." -> "https://raw..."
 ICON_URL = "https://raw.githubusercontent.com/visgl/deck.gl-data/master/website/icon-atlas.png"
@@ -20,34 +17,7 @@ ICON_MAPPING = {
     "marker": {"x": 0, "y": 0, "width": 128, "height": 128, "mask": True}
 }
 
-@st.cache_data
-def load_map_data(file_path):
-    if not os.path.exists(file_path):
-        st.error(f"데이터 파일 '{file_path}'를 찾을 수 없습니다.")
-        st.error("'데이터' 폴더에 'jeju_places_mean.xlsx' 파일이 있는지 확인해주세요.")
-        return pd.DataFrame()
-    try:
-        df = pd.read_excel(file_path)
-        
-        df.columns = df.columns.str.strip()
-        
-        if '위도' in df.columns and '경도' in df.columns:
-             df = df.rename(columns={'위도': 'lat', '경도': 'lon'})
-        elif 'y' in df.columns and 'x' in df.columns:
-             df = df.rename(columns={'y': 'lat', 'x': 'lon'})
-
-        df.dropna(subset=['lat', 'lon'], inplace=True)
-        
-        df['naver_map_url'] = df['장소명'].apply(
-            lambda x: f"https://map.naver.com/v5/search/{urllib.parse.quote(x)}"
-        )
-        return df
-    except Exception as e:
-        st.error(f"데이터 로드 중 오류 발생: {e}")
-        st.warning("Excel 파일을 읽으려면 'openpyxl' 라이브러리가 필요할 수 있습니다. (pip install openpyxl)")
-        return pd.DataFrame()
-
-df = load_map_data(DATA_FILE_PATH)
+df = data_loader.load_places_mean()
 
 if 'itinerary_basket' not in st.session_state:
     st.session_state.itinerary_basket = []
@@ -150,10 +120,20 @@ if not df.empty:
                 st.info(f"**{selected_row['장소명']}** 위치를 보고 있습니다.")
                 st.link_button("🔗 네이버 지도로 상세정보 보기", selected_row['naver_map_url'], use_container_width=True, type="primary")
                 
+                restaurant_index = spatial_index.load_restaurant_index()
+                if restaurant_index is not None:
+                    nearby = restaurant_index.nearby(center_lat, center_lon)
+                    with st.expander(f"🍲 주변 {spatial_index.NEARBY_RADIUS_KM:.0f}km 맛집 ({len(nearby)}곳)", expanded=True):
+                        if nearby.empty:
+                            st.caption("가까운 맛집이 없습니다.")
+                        for _, place in nearby.iterrows():
+                            st.markdown(f"- [{place['place_name']}]({place['naver_map_url']}) · {place[spatial_index.DISTANCE_COLUMN]:.1f} km")
+                
             except IndexError:
                 st.session_state.selected_place_index = None
                 st.rerun()
 
+        import pydeck as pdk  # 지도 영역을 그릴 때 불러옵니다. (위쪽 목록은 먼저 표시)
         view_state = pdk.ViewState(
             latitude=center_lat,
             longitude=center_lon,
@@ -199,4 +179,5 @@ if not df.empty:
         )
         st.pydeck_chart(r, use_container_width=True)
 else:
-    st.error("데이터 지도를 표시할 수 없습니다. '데이터' 폴더에 'jeju_places_mean.xlsx' 파일이 올바른지 확인해주세요.")
\ No newline at end of file
+    st.error("데이터 지도를 표시할 수 없습니다. 'data' 폴더에 'jeju_places_mean.xlsx' 파일이 올바른지 확인해주세요.")
+    st.warning("Excel 파일을 읽으려면 'openpyxl' 라이브러리가 필요할 수 있습니다. (pip install openpyxl)")
\ No newline at end of file
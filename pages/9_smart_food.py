@@ -1,17 +1,14 @@
 import streamlit as st
 import pandas as pd
-import pydeck as pdk
 import navigation
-import os
-import urllib.parse
-import numpy as np
+import data_loader
+import place_search
+import spatial_index
 
 st.set_page_config(page_title="GOLDEN JEJU | 스마트 맛집 검색", layout="wide", initial_sidebar_state="collapsed")
 navigation.apply_theme()
 navigation.show_header(current_page="pages/9_스마트맛집검색.py")
 
-DATA_FILE_PATH = r"C:\공모전\데이터\jeju_places_with_auto_keywords.csv"
-
 # --- [수정됨] (항목 3) ---
 # "https.raw..." -> "https://raw..."
 ICON_URL = "https://raw.githubusercontent.com/visgl/deck.gl-data/master/website/icon-atlas.png"
@@ -21,45 +18,8 @@ ICON_MAPPING = {
     "marker": {"x": 0, "y": 0, "width": 128, "height": 128, "mask": True}
 }
 
-@st.cache_data
-def load_data(file_path):
-    if not os.path.exists(file_path):
-        st.error(f"데이터 파일 '{file_path}'를 찾을 수 없습니다.")
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(file_path)
-        df.columns = df.columns.str.strip()
-
-        df = df.rename(columns={
-            'y': 'lat', 
-            'x': 'lon', 
-            'keywords': 'original_keywords' # 원본 키워드 (표시용)
-        })
-        
-        df.dropna(subset=['lat', 'lon'], inplace=True)
-        
-        df['place_name'] = df['place_name'].fillna('').astype(str)
-        df['category_name'] = df['category_name'].fillna('').astype(str)
-        df['original_keywords'] = df['original_keywords'].fillna('').astype(str)
-
-        df['search_blob'] = (
-            df['place_name'] + ' ' + 
-            df['category_name'].str.replace('>', ' ') + ' ' + 
-            df['original_keywords'].str.replace(',', ' ')
-        )
-        
-        df['naver_map_url'] = df['place_name'].apply(
-            lambda x: f"https://map.naver.com/v5/search/{urllib.parse.quote(x)}"
-        )
-        
-        return df
-    
-    except Exception as e:
-        st.error(f"데이터 로드 중 오류 발생: {e}")
-        st.exception(e) 
-        return pd.DataFrame()
-
-df = load_data(DATA_FILE_PATH)
+df = data_loader.load_places_keywords()
+search_index = place_search.load_place_search_index()
 
 if 'itinerary_basket' not in st.session_state:
     st.session_state.itinerary_basket = []
@@ -70,18 +30,12 @@ if not df.empty:
     
     selected_term = st.text_input(
         "검색어로 맛집 찾기:",
-        placeholder="예: 흑돼지, 갈치 ..."
+        placeholder="예: 흑돼지, 갈치, ㅎㄷㅈ(초성) ..."
     )
     
-    df_filtered = df.copy()
-    
-    if selected_term:
-        df_filtered = df_filtered[df_filtered['search_blob'].str.contains(selected_term, na=False)]
-    else:
-        df_filtered = pd.DataFrame(columns=df.columns)
-
-    df_filtered['icon_size'] = 30
-    df_filtered['icon_name'] = 'marker'
+    # 검색어는 글자 그대로 다루며, 이름 > 키워드 > 분류 순으로 잘 맞은 맛집이 먼저 나옵니다.
+    result_ids = search_index.search(selected_term) if selected_term else []
+    df_filtered = search_index.frame(result_ids).assign(icon_size=30, icon_name='marker')
         
     if 'selected_place_name' not in st.session_state:
         st.session_state.selected_place_name = None
@@ -146,10 +100,20 @@ if not df.empty:
                 st.info(f"**{selected_row['place_name']}** 위치를 보고 있습니다.")
                 st.link_button("🔗 네이버 지도로 상세정보 보기", selected_row['naver_map_url'], use_container_width=True, type="primary")
                 
+                attraction_index = spatial_index.load_attraction_index()
+                if attraction_index is not None:
+                    nearby = attraction_index.nearby(center_lat, center_lon)
+                    with st.expander(f"🗺️ 주변 {spatial_index.NEARBY_RADIUS_KM:.0f}km 관광지 ({len(nearby)}곳)", expanded=True):
+                        if nearby.empty:
+                            st.caption("가까운 관광지가 없습니다.")
+                        for _, place in nearby.iterrows():
+                            st.markdown(f"- [{place['장소명']}]({place['naver_map_url']}) · {place[spatial_index.DISTANCE_COLUMN]:.1f} km")
+                
             except IndexError:
                 st.session_state.selected_place_name = None
                 st.rerun()
 
+        import pydeck as pdk  # 지도 영역을 그릴 때 불러옵니다. (위쪽 목록은 먼저 표시)
         view_state = pdk.ViewState(
             latitude=center_lat,
             longitude=center_lon,
@@ -195,4 +159,4 @@ if not df.empty:
         )
         st.pydeck_chart(r, use_container_width=True)
 else:
-    st.error(f"맛집 데이터를 표시할 수 없습니다. '{DATA_FILE_PATH}' 파일이 올바른지 확인해주세요.")
\ No newline at end of file
+    st.error(f"맛집 데이터를 표시할 수 없습니다. '{data_loader.data_file(data_loader.PLACES_KEYWORDS_FILE)}' 파일이 올바른지 확인해주세요.")
\ No newline at end of file
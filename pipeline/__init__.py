@@ -0,0 +1,9 @@
+"""
+GOLDEN JEJU 데이터 파이프라인
+
+노트북을 셀 단위로 손으로 돌리던 전처리 과정을 캐시되는 DAG로 옮긴 것입니다.
+    python -m pipeline list
+    python -m pipeline run [스테이지 ...] [--force 스테이지 ...] [--refit-scalers]
+"""
+from pipeline.dag import STAGES, Pipeline, stage
+from pipeline import stages  # noqa: F401  (스테이지 등록)
@@ -0,0 +1,62 @@
+import argparse
+import sys
+
+import data_loader
+from pipeline import STAGES, Pipeline
+from pipeline.dag import CACHE_DIR, RAW_DIR
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m pipeline', description="GOLDEN JEJU 데이터 파이프라인")
+    parser.add_argument('--raw-dir', default=RAW_DIR, help=f"원본 데이터 폴더 (기본: {RAW_DIR})")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    sub.add_parser('list', help="스테이지와 캐시 상태 보기")
+
+    run_parser = sub.add_parser('run', help="스테이지 실행 (기본: 전체)")
+    run_parser.add_argument('targets', nargs='*', metavar='STAGE')
+    run_parser.add_argument('--force', nargs='*', default=[], metavar='STAGE', help="캐시를 무시하고 다시 계산할 스테이지")
+    run_parser.add_argument('--force-all', action='store_true')
+    run_parser.add_argument('--refit-scalers', action='store_true', help="final_themes 스케일러/분위 경계를 전체 재적합")
+    run_parser.add_argument('--refit-models', action='store_true',
+                            help="SARIMA 차수 탐색 + 파라미터 전체 재적합 (기본: 저장된 파라미터로 필터링만)")
+    run_parser.add_argument('--order-criterion', choices=['holdout', 'aic'], default='holdout',
+                            help="SARIMA 차수 선택 기준 (홀드아웃 MAE 또는 AIC)")
+    run_parser.add_argument('--workers', type=int, default=None, help="차수 탐색 프로세스 수 (기본: CPU 수)")
+    run_parser.add_argument('--snapshots', action='store_true', help="실행 후 data/snapshots 갱신 (pyarrow 필요)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        pipeline = Pipeline(raw_dir=args.raw_dir, cache_dir=args.cache_dir, options={'order_criterion': 'holdout'})
+        for name, stage in STAGES.items():
+            deps = ', '.join(stage.deps) or '-'
+            output = stage.output or '-'
+            print(f"{name:18} deps: {deps:45} output: {output:42} {pipeline.status(name)}")
+        return 0
+
+    unknown = [name for name in args.targets + args.force if name not in STAGES]
+    if unknown:
+        parser.error(f"알 수 없는 스테이지: {', '.join(unknown)} (가능: {', '.join(STAGES)})")
+
+    force = set(args.force)
+    if args.force_all:
+        force = set(STAGES)
+    options = {'refit_scalers': args.refit_scalers, 'refit_models': args.refit_models,
+               'order_criterion': args.order_criterion, 'workers': args.workers}
+    if args.refit_scalers:
+        force.add('final_themes')
+
+    pipeline = Pipeline(raw_dir=args.raw_dir, cache_dir=args.cache_dir, force=force, options=options)
+    computed = pipeline.run(args.targets or None)
+    print(f"완료: {len(computed)}개 스테이지 계산 ({', '.join(computed) or '모두 캐시'})")
+
+    if args.snapshots:
+        for name in data_loader.build_snapshots():
+            print(f"snapshot: {name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
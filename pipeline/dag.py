@@ -0,0 +1,205 @@
+"""
+파이프라인 DAG 실행기
+
+각 스테이지는 @stage 데코레이터로 등록하며, 결과는 아래 값들의 해시를 키로 캐시됩니다.
+    - 스테이지 함수(및 uses로 지정한 보조 함수)의 소스 코드
+    - 입력 파일 내용 (원본 데이터 폴더 기준 glob 패턴 또는 절대 경로)
+    - 선행 스테이지의 키
+    - 결과에 영향을 주는 실행 옵션 (options로 지정)
+따라서 다시 실행하면 입력이나 코드가 바뀐 스테이지와 그 하위 스테이지만 계산합니다.
+"""
+import glob
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import time
+
+import data_loader
+
+RAW_DIR = os.environ.get('GOLDEN_JEJU_RAW_DIR', os.path.join(data_loader.BASE_DIR, '데이터'))
+CACHE_DIR = os.path.join(data_loader.BASE_DIR, '.pipeline_cache')
+
+
+class Stage:
+    def __init__(self, name, func, deps, inputs, output, uses, options):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.inputs = list(inputs)
+        self.output = output
+        self.uses = list(uses)
+        self.options = list(options)
+
+    def code_hash(self):
+        digest = hashlib.sha1()
+        for obj in [self.func] + self.uses:
+            source = inspect.getsource(obj) if callable(obj) else repr(obj)
+            digest.update(source.encode('utf-8'))
+        return digest.hexdigest()
+
+
+STAGES = {}
+
+
+def stage(name, deps=(), inputs=(), output=None, uses=(), options=()):
+    """
+    파이프라인 스테이지 등록.
+    deps   : 선행 스테이지 이름 (결과가 순서대로 함수 인자로 전달됨)
+    inputs : 원본 파일 glob 패턴 (RAW_DIR 기준) 또는 절대 경로. '?'로 시작하면 없어도 되는 입력
+    output : data/ 에 게시할 CSV 파일명 (없으면 중간 산출물)
+    uses   : 캐시 키에 소스(함수) 또는 repr(상수)을 포함할 대상
+    options: 캐시 키에 포함할 실행 옵션 이름
+    """
+    def decorator(func):
+        STAGES[name] = Stage(name, func, deps, inputs, output, uses, options)
+        return func
+    return decorator
+
+
+class StageContext:
+    """스테이지 함수가 받는 실행 컨텍스트 (입력 파일 경로, 옵션, 로그)."""
+
+    def __init__(self, pipeline, stage):
+        self.pipeline = pipeline
+        self.stage = stage
+        self.options = pipeline.options
+
+    def files(self, pattern):
+        return self.pipeline.resolve(pattern)
+
+    def path(self, pattern):
+        return self.files(pattern)[0]
+
+    def log(self, message):
+        self.pipeline.log(f"  [{self.stage.name}] {message}")
+
+
+class Pipeline:
+    def __init__(self, raw_dir=RAW_DIR, cache_dir=CACHE_DIR, data_dir=None, force=(), options=None, log=print,
+                 publish=True):
+        """publish=False 면 결과를 캐시에만 두고 data/ 에 게시하지 않습니다. (벤치마크/분석용)"""
+        self.raw_dir = raw_dir
+        self.cache_dir = cache_dir
+        self.data_dir = data_dir or data_loader.DATA_DIR
+        self.force = set(force)
+        self.options = options or {}
+        self.log = log
+        self.publish = publish
+        self._keys = {}
+        self._results = {}
+        self.computed = []
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._hash_index_path = os.path.join(self.cache_dir, 'file_hashes.json')
+        self._hash_index = self._read_json(self._hash_index_path)
+        self._published_path = os.path.join(self.cache_dir, 'published.json')
+        self._published = self._read_json(self._published_path)
+
+    # --- 1. 입력 파일 / 해시 ---
+    @staticmethod
+    def _read_json(path):
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def _write_json(self, path, data):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def resolve(self, pattern):
+        optional = pattern.startswith('?')
+        pattern = pattern.lstrip('?')
+        full = pattern if os.path.isabs(pattern) else os.path.join(self.raw_dir, pattern)
+        files = sorted(glob.glob(full))
+        if not files and not optional:
+            raise FileNotFoundError(f"입력 파일을 찾을 수 없습니다: {full}")
+        return files
+
+    def file_hash(self, path):
+        """(경로, mtime, 크기)가 같으면 이전 해시를 재사용해 큰 원본 파일을 매번 읽지 않습니다."""
+        stat = os.stat(path)
+        cached = self._hash_index.get(path)
+        if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+            return cached['sha1']
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        self._hash_index[path] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': digest.hexdigest()}
+        return digest.hexdigest()
+
+    # --- 2. 캐시 키 ---
+    def key(self, name):
+        if name in self._keys:
+            return self._keys[name]
+        stage = STAGES[name]
+        digest = hashlib.sha1()
+        digest.update(name.encode('utf-8'))
+        digest.update(stage.code_hash().encode('utf-8'))
+        for pattern in stage.inputs:
+            for path in self.resolve(pattern):
+                digest.update(os.path.basename(path).encode('utf-8'))
+                digest.update(self.file_hash(path).encode('utf-8'))
+        for dep in stage.deps:
+            digest.update(self.key(dep).encode('utf-8'))
+        for option in stage.options:
+            digest.update(f"{option}={self.options.get(option)!r}".encode('utf-8'))
+        self._keys[name] = digest.hexdigest()[:16]
+        return self._keys[name]
+
+    def cache_path(self, name):
+        return os.path.join(self.cache_dir, f"{name}-{self.key(name)}.pkl")
+
+    def status(self, name):
+        try:
+            return 'cached' if os.path.exists(self.cache_path(name)) else 'stale'
+        except FileNotFoundError as e:
+            return f"missing input ({e})"
+
+    # --- 3. 실행 ---
+    def result(self, name):
+        if name in self._results:
+            return self._results[name]
+        stage = STAGES[name]
+        path = self.cache_path(name)
+
+        if os.path.exists(path) and name not in self.force:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+            self.log(f"[{name}] cached ({self.key(name)})")
+        else:
+            args = [self.result(dep) for dep in stage.deps]
+            start = time.perf_counter()
+            result = stage.func(StageContext(self, stage), *args)
+            self.log(f"[{name}] computed in {time.perf_counter() - start:.2f}s ({self.key(name)})")
+            with open(path, 'wb') as f:
+                pickle.dump(result, f)
+            self.computed.append(name)
+
+        self._publish(stage, result)
+        self._results[name] = result
+        return result
+
+    def _publish(self, stage, result):
+        if not stage.output or not self.publish:
+            return
+        out_path = os.path.join(self.data_dir, stage.output)
+        key = self.key(stage.name)
+        if self._published.get(stage.output) == key and os.path.exists(out_path):
+            return
+        result.to_csv(out_path, index=False, encoding='utf-8-sig')
+        self._published[stage.output] = key
+        self.log(f"[{stage.name}] published -> {out_path}")
+
+    def run(self, targets=None):
+        targets = list(targets or STAGES)
+        try:
+            for name in targets:
+                self.result(name)
+        finally:
+            self._write_json(self._hash_index_path, self._hash_index)
+            if self.publish:
+                self._write_json(self._published_path, self._published)
+        return self.computed
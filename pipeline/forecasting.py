@@ -0,0 +1,89 @@
+"""
+고정 파라미터 기반 증분 예측
+
+적합된 SARIMAX 파라미터를 data/golden_compass_forecast_params.json 에 저장해 두고,
+새 달이 들어오면 재최적화 없이 저장된 파라미터로 칼만 필터만 다시 돌려(상태 갱신)
+예측 구간만 새로 만듭니다. 파라미터 재적합(차수 탐색 포함)은
+--refit-models 로 명시하거나, 마지막 적합 후 REFIT_EVERY_MONTHS가 지나면 수행합니다.
+"""
+import json
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+
+MODEL_PARAMS_FILE = 'golden_compass_forecast_params.json'
+REFIT_EVERY_MONTHS = 12
+
+
+# --- 1. 파라미터 저장소 ---
+def store_path():
+    return data_loader.data_file(MODEL_PARAMS_FILE)
+
+
+def load_store():
+    if not os.path.exists(store_path()):
+        return {}
+    with open(store_path(), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_entry(name, entry):
+    """name의 항목이 실제로 바뀐 경우에만 파일을 다시 씁니다. (파이프라인 캐시 키 안정성)"""
+    store = load_store()
+    if store.get(name) == entry:
+        return
+    store[name] = entry
+    with open(store_path(), 'w', encoding='utf-8') as f:
+        json.dump(store, f, ensure_ascii=False, indent=2)
+
+
+def _months_between(start, end):
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    return (end.year - start.year) * 12 + (end.month - start.month)
+
+
+def needs_refit(entry, series, refit=False):
+    if refit or entry is None:
+        return True
+    return _months_between(entry['fitted_through'], series.index.max()) >= REFIT_EVERY_MONTHS
+
+
+def make_entry(series, order, seasonal_order, params):
+    return {
+        'order': [int(v) for v in order],
+        'seasonal_order': [int(v) for v in seasonal_order],
+        'params': [float(v) for v in params],
+        'fitted_through': series.index.max().strftime('%Y-%m-%d'),
+    }
+
+
+# --- 2. 예측 ---
+def filter_forecast(series, steps, order, seasonal_order, params):
+    """고정 파라미터로 칼만 필터만 실행해(최적화 없음) steps개월을 예측합니다. 음수는 0으로 보정."""
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        model = SARIMAX(series.asfreq('MS'),
+                        order=tuple(order),
+                        seasonal_order=tuple(seasonal_order),
+                        enforce_stationarity=False,
+                        enforce_invertibility=False)
+        results = model.filter(np.asarray(params, dtype=float))
+    forecast = results.forecast(steps=steps)
+    forecast[forecast < 0] = 0
+    return forecast
+
+
+def forecast_series(name, series, steps, selected):
+    """
+    selected(sarima_orders 스테이지 결과)의 차수/파라미터로 예측하고,
+    재적합된 경우에만 저장소를 갱신합니다.
+    """
+    if selected['refit']:
+        save_entry(name, make_entry(series, selected['order'], selected['seasonal_order'], selected['params']))
+    return filter_forecast(series, steps, selected['order'], selected['seasonal_order'], selected['params'])
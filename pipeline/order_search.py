@@ -0,0 +1,152 @@
+"""
+SARIMA 차수 자동 탐색
+
+노트북은 다섯 시계열 모두 (1,1,1)(1,1,1,12)로 고정해 한 개씩 순서대로 적합했습니다.
+여기서는 (p,d,q)(P,D,Q) 격자의 모든 (시계열, 차수) 조합을 프로세스 풀에 한꺼번에 넣어
+코어 수만큼 병렬로 적합하고, 시계열마다 AIC 또는 홀드아웃 오차로 최적 차수를 고릅니다.
+
+결과는 (시계열 해시, 차수) 단위로 <cache_dir>/sarima/<해시>.json 에 쌓이므로
+데이터가 바뀐 시계열만, 그리고 아직 평가하지 않은 차수만 다시 적합합니다.
+"""
+import hashlib
+import itertools
+import json
+import math
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+SEASONAL_PERIOD = 12
+HOLDOUT_MONTHS = 6
+
+ORDER_GRID = {
+    'p': [0, 1, 2],
+    'd': [0, 1],
+    'q': [0, 1, 2],
+    'P': [0, 1],
+    'D': [0, 1],
+    'Q': [0, 1],
+}
+
+
+def grid_orders(grid=None):
+    grid = grid or ORDER_GRID
+    for p, d, q, P, D, Q in itertools.product(grid['p'], grid['d'], grid['q'], grid['P'], grid['D'], grid['Q']):
+        yield (p, d, q), (P, D, Q, SEASONAL_PERIOD)
+
+
+def order_key(order, seasonal_order):
+    return f"{tuple(order)}x{tuple(seasonal_order)}"
+
+
+def series_hash(series):
+    digest = hashlib.sha1()
+    digest.update(np.asarray(series.index.astype('int64')).tobytes())
+    digest.update(np.asarray(series.to_numpy(dtype=float)).tobytes())
+    return digest.hexdigest()[:16]
+
+
+# --- 1. 단일 (시계열, 차수) 평가 (프로세스 풀 워커) ---
+def _fit(series, order, seasonal_order):
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    model = SARIMAX(series,
+                    order=order,
+                    seasonal_order=seasonal_order,
+                    enforce_stationarity=False,
+                    enforce_invertibility=False)
+    return model.fit(disp=False)
+
+
+def evaluate_order(series, order, seasonal_order, holdout=HOLDOUT_MONTHS):
+    """전체 구간 AIC와, 마지막 holdout개월을 뺀 구간으로 적합한 뒤의 예측 오차(MAE/MAPE)를 계산합니다."""
+    result = {'order': list(order), 'seasonal_order': list(seasonal_order), 'ok': False}
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            fit = _fit(series, order, seasonal_order)
+            train_fit = _fit(series.iloc[:-holdout], order, seasonal_order)
+        predicted = np.asarray(train_fit.forecast(steps=holdout), dtype=float)
+        actual = series.iloc[-holdout:].to_numpy(dtype=float)
+
+        nonzero = actual != 0
+        result['aic'] = float(fit.aic)
+        result['params'] = [float(v) for v in fit.params]
+        result['mae'] = float(np.mean(np.abs(predicted - actual)))
+        result['mape'] = (float(np.mean(np.abs((predicted[nonzero] - actual[nonzero]) / actual[nonzero])) * 100)
+                          if nonzero.any() else math.nan)
+        result['ok'] = bool(np.isfinite(result['aic']) and np.isfinite(result['mae']))
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def _evaluate_task(task):
+    name, series, order, seasonal_order, holdout = task
+    return name, evaluate_order(series, order, seasonal_order, holdout)
+
+
+# --- 2. 선택 기준 ---
+def select_best(results, criterion='holdout'):
+    """criterion='aic'면 AIC 최소, 'holdout'이면 홀드아웃 MAE 최소(동률은 AIC)."""
+    candidates = [r for r in results if r.get('ok')]
+    if not candidates:
+        return None
+    if criterion == 'aic':
+        return min(candidates, key=lambda r: r['aic'])
+    return min(candidates, key=lambda r: (r['mae'], r['aic']))
+
+
+# --- 3. 병렬 탐색 + 캐시 ---
+def _cache_file(cache_dir, digest):
+    return os.path.join(cache_dir, 'sarima', f"{digest}.json")
+
+
+def _read_cache(path, holdout):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        cached = json.load(f)
+    return cached['results'] if cached.get('holdout') == holdout else {}
+
+
+def search_orders(series_dict, cache_dir, grid=None, criterion='holdout', holdout=HOLDOUT_MONTHS,
+                  max_workers=None, log=print):
+    """
+    series_dict {이름: pd.Series(월별)} 의 시계열별 최적 SARIMA 차수를 반환합니다.
+    반환값 {이름: {'order', 'seasonal_order', 'aic', 'mae', 'mape', 'params', 'evaluated'}}
+    """
+    os.makedirs(os.path.join(cache_dir, 'sarima'), exist_ok=True)
+    orders = list(grid_orders(grid))
+
+    digests, cached_results, tasks = {}, {}, []
+    for name, series in series_dict.items():
+        series = series.asfreq('MS')
+        digests[name] = series_hash(series)
+        cached_results[name] = _read_cache(_cache_file(cache_dir, digests[name]), holdout)
+        for order, seasonal_order in orders:
+            if order_key(order, seasonal_order) not in cached_results[name]:
+                tasks.append((name, series, order, seasonal_order, holdout))
+
+    if tasks:
+        log(f"SARIMA 차수 탐색: {len(tasks)}개 적합 (캐시 {len(orders) * len(series_dict) - len(tasks)}개 재사용)")
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for name, result in pool.map(_evaluate_task, tasks, chunksize=4):
+                cached_results[name][order_key(result['order'], result['seasonal_order'])] = result
+
+    selected = {}
+    for name in series_dict:
+        with open(_cache_file(cache_dir, digests[name]), 'w', encoding='utf-8') as f:
+            json.dump({'holdout': holdout, 'results': cached_results[name]}, f, ensure_ascii=False)
+
+        evaluated = [cached_results[name][order_key(o, so)] for o, so in orders]
+        best = select_best(evaluated, criterion)
+        if best is None:
+            raise RuntimeError(f"'{name}' 시계열에 적합 가능한 SARIMA 차수가 없습니다.")
+        selected[name] = dict(best, evaluated=len(evaluated))
+        log(f"'{name}': {order_key(best['order'], best['seasonal_order'])} "
+            f"AIC={best['aic']:.1f} MAE={best['mae']:.3g} MAPE={best['mape']:.2f}%")
+    return selected
+
@@ -0,0 +1,341 @@
+"""
+노트북(캘린더_전처리 / 캘린더_시각화 / 숙소)을 옮긴 파이프라인 스테이지
+
+    visitors ─> base_index ─┬──────────────> forecast ─────────┐
+    series_hallasan ────────┼─> sarima_orders ─> forecast_hallasan ─┼─> final_themes
+    series_golf ────────────┘                 └> forecast_golf ─────┘
+    search_cube ─┬> foodie_ranking
+                 ├> wellness_ranking
+                 └> activity_ranking
+    accommodation
+
+원본 파일은 RAW_DIR('데이터' 폴더, GOLDEN_JEJU_RAW_DIR 환경변수로 변경 가능)에서 읽고,
+게시 대상 결과는 data/ 에 씁니다. SARIMAX 스테이지에는 statsmodels가 필요합니다. (pip install -r requirements-pipeline.txt)
+
+예측 스테이지는 저장된 SARIMAX 파라미터로 칼만 필터만 다시 돌립니다(pipeline/forecasting.py).
+차수 탐색/파라미터 재적합은 --refit-models 또는 마지막 적합 후 12개월이 지났을 때만 합니다.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import accommodation_features
+import data_loader
+import geocode_accommodation
+import search_trend
+import theme_index
+from pipeline import forecasting, order_search
+from pipeline.dag import stage
+
+VISITOR_PATTERN = '제주내국인_입도통계_*.csv'
+RENTCAR_FILE = '렌터카 가동률_2023_202508.csv'
+CHARTER_BUS_FILE = '전세버스 가동률_2023_202508.csv'
+HALLASAN_FILE = '한라산 탐방객_2021_202508.csv'
+GOLF_FILE = '골프장 내장객_2023_202506.csv'
+SEARCH_TREND_FILE = '제주관광공사_제주관광정보시스템(VISIT JEJU)_검색어트랜드내역.CSV'
+ACCOM_RAW_FILE = '제주관광공사_제주관광정보시스템(VISIT JEJU)_숙박콘텐츠_20250307.CSV'
+
+BASE_METRICS = ['총 입도객', '렌터카 가동률', '전세버스 가동률']
+
+# 입도통계 CSV는 필요한 세 컬럼만, 고정 dtype으로 청크 단위 스트리밍합니다.
+VISITOR_COLUMNS = {'구분': 'str', '년월': 'int32', '입도객 수': 'float64'}
+VISITOR_CHUNK_ROWS = 200_000
+
+FORECAST_END = pd.Timestamp(2026, 12, 1)
+
+FOODIE_KEYWORDS = [
+    # 제주 대표메뉴
+    '흑돼지', '고기국수', '갈치', '갈치조림', '갈치구이', '고등어', '고등어회',
+    # 해산물
+    '방어', '한치', '물회', '해물탕', '전복', '딱새우', '성게', '보말', '해물라면', '보말칼국수',
+    # 일반 검색
+    '맛집', '카페', '서귀포 맛집', '애월 맛집', '제주 맛집', '횟집',
+    # 특산물/디저트
+    '오메기떡', '감귤', '우도 땅콩'
+]
+WELLNESS_KEYWORDS = ['수국', '힐링', '매화', '동백', '청보리', '유채꽃']
+ACTIVITY_KEYWORDS = ['올레길', '오름', '한라산', '등산', '트레킹', '골프', '낚시', '요트', '승마', '자전거', '카약', '스쿠버다이빙']
+
+
+# --- 1. 공통 보조 함수 ---
+def min_max(df, cols):
+    """MinMaxScaler와 같은 정규화 (열별 (x - min) / (max - min))."""
+    span = df[cols].max() - df[cols].min()
+    return (df[cols] - df[cols].min()) / span.replace(0, 1)
+
+
+def month_index(years, months):
+    return pd.to_datetime(years.astype(str) + '-' + months.astype(str) + '-01')
+
+
+def forecast_steps(series, end=FORECAST_END):
+    last = series.index.max()
+    return (end.year - last.year) * 12 + (end.month - last.month)
+
+
+# --- 2. 관광 포화 지수 (캘린더_전처리) ---
+def sum_by_month(partials):
+    """년월별 부분합들을 합칩니다. 부분합이 없으면(빈 파일/입력) 빈 시리즈를 돌려줍니다."""
+    partials = [partial for partial in partials if not partial.empty]
+    if not partials:
+        return pd.Series([], index=pd.Index([], dtype='int64', name='년월'), dtype='int64', name='입도객 수')
+    return pd.concat(partials).groupby(level=0).sum()
+
+
+def visitor_partial_sums(path, chunk_rows=VISITOR_CHUNK_ROWS):
+    """
+    입도통계 파일 하나를 청크로 읽으며 '구분' == '형태' 행만 남겨(이중 집계 방지)
+    년월별 입도객 수 부분합을 만듭니다. 메모리는 청크 하나 크기로 제한됩니다.
+    """
+    sums = []
+    reader = pd.read_csv(path, usecols=list(VISITOR_COLUMNS), dtype=VISITOR_COLUMNS, chunksize=chunk_rows)
+    for chunk in reader:
+        chunk = chunk[chunk['구분'] == '형태']
+        sums.append(chunk.groupby('년월')['입도객 수'].sum())
+    return sum_by_month(sums)
+
+
+@stage('visitors', inputs=[VISITOR_PATTERN], uses=[visitor_partial_sums, sum_by_month, VISITOR_COLUMNS])
+def visitors(ctx):
+    files = ctx.files(VISITOR_PATTERN)
+    with ProcessPoolExecutor(max_workers=ctx.options.get('workers')) as pool:
+        partials = list(pool.map(visitor_partial_sums, files))
+
+    # 파일별 부분합 병합 (같은 년월이 여러 파일에 걸쳐 있어도 합산)
+    totals = sum_by_month(partials).sort_index()
+    df_total = totals.astype('int64').rename_axis('년월').rename('총 입도객').reset_index()
+    df_total['년'] = df_total['년월'] // 100
+    df_total['월'] = df_total['년월'] % 100
+    return df_total
+
+
+@stage('base_index', deps=['visitors'], inputs=[RENTCAR_FILE, CHARTER_BUS_FILE],
+       output=data_loader.BASE_INDEX_FILE, uses=[min_max, month_index])
+def base_index(ctx, df_total_visitors):
+    df_rentcar = pd.read_csv(ctx.path(RENTCAR_FILE), encoding='utf-8-sig')
+    df_rentcar = df_rentcar[['년', '월', '가동률']].rename(columns={'가동률': '렌터카 가동률'})
+    df_bus = pd.read_csv(ctx.path(CHARTER_BUS_FILE), encoding='utf-8-sig')
+    df_bus = df_bus[['년', '월', '가동률']].rename(columns={'가동률': '전세버스 가동률'})
+
+    df_merged = pd.merge(df_total_visitors, df_rentcar, on=['년', '월'], how='inner')
+    df_merged = pd.merge(df_merged, df_bus, on=['년', '월'], how='inner')
+
+    normalized_cols = [f'{col}_norm' for col in BASE_METRICS]
+    df_merged[normalized_cols] = min_max(df_merged, BASE_METRICS).to_numpy()
+    df_merged['관광 포화 지수'] = df_merged[normalized_cols].mean(axis=1)
+    df_merged['날짜'] = month_index(df_merged['년'], df_merged['월'])
+
+    final_columns = ['날짜', '년', '월', '년월'] + BASE_METRICS + normalized_cols + ['관광 포화 지수']
+    return df_merged[final_columns].sort_values(by='날짜').reset_index(drop=True)
+
+
+# --- 3. SARIMAX 예측 (캘린더_시각화) ---
+@stage('sarima_orders', deps=['base_index', 'series_hallasan', 'series_golf'],
+       inputs=['?' + forecasting.store_path()],
+       uses=[order_search.search_orders, order_search.grid_orders, order_search._evaluate_task, order_search._fit,
+             order_search.evaluate_order, order_search.select_best, order_search.ORDER_GRID,
+             order_search.HOLDOUT_MONTHS, forecasting.needs_refit, forecasting.REFIT_EVERY_MONTHS],
+       options=['order_criterion', 'refit_models'])
+def sarima_orders(ctx, df_base, hallasan_series, golf_series):
+    """
+    시계열별 (차수, 파라미터)를 반환합니다.
+    저장된 적합 결과가 있고 재적합 조건이 아니면 그대로 쓰고(refit=False),
+    나머지 시계열만 차수 탐색을 돌려 전체 구간 적합 파라미터를 받습니다(refit=True).
+    """
+    df_base = df_base.set_index('날짜').sort_index()
+    series_dict = {metric: df_base[metric] for metric in BASE_METRICS}
+    series_dict['한라산 탐방객'] = hallasan_series
+    series_dict['골프장 내장객(도외)'] = golf_series
+
+    store = forecasting.load_store()
+    refit_all = bool(ctx.options.get('refit_models'))
+    selected, to_search = {}, {}
+    for name, series in series_dict.items():
+        entry = store.get(name)
+        if forecasting.needs_refit(entry, series, refit_all):
+            to_search[name] = series
+        else:
+            selected[name] = dict(entry, refit=False)
+            ctx.log(f"'{name}': 저장된 파라미터 사용 ({entry['fitted_through']} 적합)")
+
+    if to_search:
+        searched = order_search.search_orders(
+            to_search,
+            cache_dir=ctx.pipeline.cache_dir,
+            criterion=ctx.options.get('order_criterion') or 'holdout',
+            max_workers=ctx.options.get('workers'),
+            log=ctx.log,
+        )
+        for name, best in searched.items():
+            selected[name] = dict(best, refit=True)
+    return selected
+
+
+@stage('forecast', deps=['base_index', 'sarima_orders'], output=data_loader.FORECASTED_FILE,
+       uses=[forecasting.forecast_series, forecasting.filter_forecast, forecast_steps, min_max])
+def forecast(ctx, df_base, selected_orders):
+    df_base = df_base.set_index('날짜').sort_index()
+
+    forecast_dict = {}
+    for metric in BASE_METRICS:
+        series = df_base[metric]
+        forecast_dict[metric] = forecasting.forecast_series(metric, series, forecast_steps(series),
+                                                            selected_orders[metric])
+        ctx.log(f"'{metric}' 예측 완료.")
+
+    df_full = pd.concat([df_base[BASE_METRICS], pd.DataFrame(forecast_dict)])
+    normalized_cols = [f'{col}_norm' for col in BASE_METRICS]
+    df_full[normalized_cols] = min_max(df_full, BASE_METRICS).to_numpy()
+    df_full['관광 포화 지수'] = df_full[normalized_cols].mean(axis=1)
+
+    df_full = df_full.rename_axis('날짜').reset_index()
+    df_full['년'] = df_full['날짜'].dt.year
+    df_full['월'] = df_full['날짜'].dt.month
+    df_full['월_str'] = df_full['날짜'].dt.strftime('%m월')
+    return df_full
+
+
+@stage('series_hallasan', inputs=[HALLASAN_FILE], uses=[month_index])
+def series_hallasan(ctx):
+    df_raw = pd.read_csv(ctx.path(HALLASAN_FILE), encoding='utf-8-sig', thousands=',')
+    df_raw['탐방객'] = pd.to_numeric(df_raw['탐방객'], errors='coerce')
+    if df_raw['탐방객'].isnull().any():
+        df_raw['탐방객'] = df_raw['탐방객'].interpolate()
+    df_raw['날짜'] = month_index(df_raw['년'], df_raw['월'])
+    return df_raw.set_index('날짜')['탐방객'].sort_index()
+
+
+@stage('series_golf', inputs=[GOLF_FILE], uses=[month_index])
+def series_golf(ctx):
+    df_raw = pd.read_csv(ctx.path(GOLF_FILE), encoding='utf-8-sig', thousands=',')
+    df_raw = df_raw.dropna(subset=['년', '월'])
+    df_raw['년'] = df_raw['년'].astype(int)
+    df_raw['월'] = df_raw['월'].astype(int)
+    df_raw['날짜'] = month_index(df_raw['년'], df_raw['월'])
+    series = df_raw.set_index('날짜')['도외 및 외국인'].sort_index()
+    if series.isnull().any():
+        series = series.interpolate()
+    return series.fillna(0)
+
+
+@stage('forecast_hallasan', deps=['series_hallasan', 'sarima_orders'],
+       uses=[forecasting.forecast_series, forecasting.filter_forecast, forecast_steps])
+def forecast_hallasan(ctx, series, selected_orders):
+    forecast = forecasting.forecast_series('한라산 탐방객', series, forecast_steps(series),
+                                           selected_orders['한라산 탐방객'])
+    return pd.concat([series, forecast]).rename('한라산 탐방객')
+
+
+@stage('forecast_golf', deps=['series_golf', 'sarima_orders'],
+       uses=[forecasting.forecast_series, forecasting.filter_forecast, forecast_steps])
+def forecast_golf(ctx, series, selected_orders):
+    forecast = forecasting.forecast_series('골프장 내장객(도외)', series, forecast_steps(series),
+                                           selected_orders['골프장 내장객(도외)'])
+    return pd.concat([series, forecast]).rename('골프장 내장객(도외)')
+
+
+# --- 4. 웰니스/골프 병합 + 고정 스케일러 적용 ---
+@stage('final_themes', deps=['forecast', 'forecast_hallasan', 'forecast_golf'],
+       inputs=['?' + data_loader.data_file(data_loader.THEME_PARAMS_FILE)],
+       output=data_loader.FINAL_THEMES_FILE,
+       uses=[theme_index.fit_params, theme_index.compute_scores, theme_index.SCALED_COLUMNS,
+             theme_index.LABEL_COLUMNS, theme_index.QUANTILES])
+def final_themes(ctx, df_forecast, hallasan_full, golf_full):
+    df = df_forecast.set_index('날짜')
+    df = df.merge(hallasan_full, left_index=True, right_index=True, how='left')
+    df = df.merge(golf_full, left_index=True, right_index=True, how='left')
+    df = df.rename_axis('날짜').reset_index()
+
+    # 전체 재적합은 명시적으로(--refit-scalers) 또는 고정 파라미터가 없을 때만 합니다.
+    params = theme_index.load_params()
+    if params is None or ctx.options.get('refit_scalers'):
+        params = theme_index.fit_params(df)
+        theme_index.save_params(params)
+        ctx.log(f"스케일러/분위 경계 재적합 (기준: {params['fitted_through']})")
+
+    # 라벨은 data_loader가 고정 경계값으로 매기므로 저장하지 않습니다. (theme_index.write_themes 참고)
+    df = theme_index.compute_scores(df, params)
+    columns = [
+        '날짜', '총 입도객', '렌터카 가동률', '전세버스 가동률',
+        '총 입도객_norm', '렌터카 가동률_norm', '전세버스 가동률_norm', '관광 포화 지수',
+        '년', '월', '월_str', '한라산 탐방객', '한라산_norm', '웰니스 쾌적도',
+        '골프장 내장객(도외)', '골프_norm', '골프 쾌적도',
+    ]
+    return df[[c for c in columns if c in df.columns]]
+
+
+# --- 5. 검색어 큐브 + 시니어 미식/웰니스/액티비티 랭킹 ---
+# 큐브는 랭킹 스테이지의 중간 산출물로 캐시에만 둡니다. (data/ 에 게시하지 않음)
+@stage('search_cube', inputs=[SEARCH_TREND_FILE],
+       uses=[search_trend.build_cube, search_trend.as_cube, search_trend._partial_sums])
+def search_cube(ctx):
+    cube = search_trend.build_cube(ctx.path(SEARCH_TREND_FILE))
+    ctx.log(f"큐브 {len(cube)}행 (키워드 {cube['키워드'].nunique()}개, 연령대 {cube['연령대'].nunique()}개)")
+    return cube
+
+
+@stage('foodie_ranking', deps=['search_cube'], output=data_loader.FOODIE_FILE,
+       uses=[search_trend.rank, search_trend.SENIOR_AGES, FOODIE_KEYWORDS])
+def foodie_ranking(ctx, cube):
+    return search_trend.rank(cube, FOODIE_KEYWORDS, by_month=True)
+
+
+@stage('wellness_ranking', deps=['search_cube'], output=data_loader.WELLNESS_FILE,
+       uses=[search_trend.rank, search_trend.SENIOR_AGES, WELLNESS_KEYWORDS])
+def wellness_ranking(ctx, cube):
+    return search_trend.rank(cube, WELLNESS_KEYWORDS, by_month=False)
+
+
+@stage('activity_ranking', deps=['search_cube'], output=data_loader.ACTIVITY_FILE,
+       uses=[search_trend.rank, search_trend.SENIOR_AGES, ACTIVITY_KEYWORDS])
+def activity_ranking(ctx, cube):
+    return search_trend.rank(cube, ACTIVITY_KEYWORDS, by_month=False)
+
+
+# --- 6. 숙소 정제 (숙소.ipynb) ---
+def clean_yes_no_to_ox(column):
+    filled_col = column.fillna('n')
+    str_col = filled_col.astype(str).str.lower()
+    std_col = np.where(str_col.isin(['y', 'true', '1', '1.0']), 'y', 'n')
+    return np.where(std_col == 'y', 'O', 'X')
+
+
+@stage('accommodation', inputs=[ACCOM_RAW_FILE, '?' + geocode_accommodation.checkpoint_path()],
+       output=data_loader.ACCOM_FILE,
+       uses=[clean_yes_no_to_ox, geocode_accommodation.geocode_columns, accommodation_features.annotate_frame, accommodation_features.features,
+             accommodation_features.classify_types, accommodation_features.classify_region,
+             accommodation_features.region_from_address, accommodation_features.region_from_name,
+             accommodation_features.ADMIN_DISTRICTS,
+             accommodation_features.region_from_coordinates, accommodation_features.REGION_BOUNDARY,
+             accommodation_features.extract_facilities, accommodation_features.TYPE_RULES,
+             accommodation_features.REGION_RULES, accommodation_features.FACILITY_SYNONYMS])
+def accommodation(ctx):
+    df_raw = pd.read_csv(ctx.path(ACCOM_RAW_FILE), encoding='cp949')
+    filter_cols = [
+        '콘텐츠명', '등급', '장애인전용객실여부', '애완동물동반허용여부',
+        '조식제공여부', '부대시설기타', 'LATE체크인여부', '셔틀버스운행여부'
+    ]
+    df_clean = df_raw[[col for col in filter_cols if col in df_raw.columns]].copy()
+
+    df_clean = df_clean.dropna(subset=['콘텐츠명'])
+    is_numeric_mask = df_clean['콘텐츠명'].str.isnumeric().fillna(False)
+    df_clean = df_clean[~is_numeric_mask]
+    df_clean = df_clean.drop_duplicates(subset=['콘텐츠명'], keep='first')
+
+    if '등급' in df_clean.columns:
+        df_clean['등급'] = pd.to_numeric(df_clean['등급'], errors='coerce').fillna(0).astype(int)
+    for col in data_loader.OX_COLUMNS:
+        if col in df_clean.columns:
+            df_clean[col] = clean_yes_no_to_ox(df_clean[col])
+    if '부대시설기타' in df_clean.columns:
+        df_clean['부대시설기타'] = df_clean['부대시설기타'].fillna('정보 없음')
+
+    # 일괄 지오코딩 결과(체크포인트)가 있으면 주소/좌표 컬럼으로 붙입니다.
+    geocodes = geocode_accommodation.load_checkpoint()
+    columns = [geocode_accommodation.geocode_columns(geocodes.get(name)) for name in df_clean['콘텐츠명']]
+    for col in geocode_accommodation.GEOCODE_COLUMNS:
+        df_clean[col] = [row[col] for row in columns]
+
+    # 유형/지역/시설 태그 추출 (페이지 필터의 역색인 재료)
+    return accommodation_features.annotate_frame(df_clean)
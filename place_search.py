@@ -0,0 +1,231 @@
+"""
+맛집 검색용 글자 n-gram 역색인 (pages/9_smart_food.py)
+
+place_name / original_keywords / category_name 을 소문자로 바꾼 뒤 글자 1-gram, 2-gram 마다
+장소 번호 목록(posting list)을 한 번만 만들어 둡니다. 검색어는 정규식이 아니라 글자 그대로 다루고,
+공백으로 나눈 낱말에 대해
+
+1. 각 낱말의 2-gram (한 글자 낱말은 1-gram) 목록과 낱말끼리의 후보를 모두 교집합으로 줄이고
+2. 남은 후보만 실제 부분 문자열인지 확인해 (2-gram 이 떨어져 있는 경우 제거)
+3. 낱말마다 가장 잘 맞은 필드로 점수를 매깁니다. 이름(3) > 키워드(2) > 분류(1), 이름 일치/접두사면 가산점
+
+글자 그대로는 맞는 곳이 없는 낱말(2-gram 후보는 있어도 실제로 포함하는 곳이 없는 경우 포함)과
+초성만 친 낱말("ㅎㄷㅈ")은 jamo_index 의 초성/자모 접두사, 편집 거리 1 검색으로 찾고 점수를
+MATCH_FACTORS 만큼 낮춥니다. (이름과 키워드만 대상) 초성 검색도 이름 전체/이름 첫머리·낱말 하나와
+맞으면 같은 비율로 가산점을 줍니다.
+
+모든 낱말이 맞은 장소만 점수 내림차순(같으면 이름순)으로 돌려주며, 같은 검색어는 메모이즈합니다.
+
+    index = place_search.load_place_search_index()
+    ids = index.search("흑돼지 애월")
+    index.frame(ids)
+"""
+import numpy as np
+
+import data_loader
+import jamo_index
+
+# 필드 -> 가중치 (높을수록 먼저)
+FIELD_WEIGHTS = {
+    'place_name': 3.0,
+    'original_keywords': 2.0,
+    'category_name': 1.0,
+}
+NAME_EXACT_BONUS = 2.0
+NAME_PREFIX_BONUS = 1.0
+# 초성/자모 검색 대상 필드와 방식별 점수 배율
+TOLERANT_FIELDS = ['place_name', 'original_keywords']
+MATCH_FACTORS = {
+    'choseong': 0.8,
+    'prefix': 0.8,
+    'edit1': 0.5,
+}
+MAX_CACHED_QUERIES = 512
+
+
+def normalize(text):
+    return str(text).strip().lower()
+
+
+def tokenize(query):
+    """검색어를 공백 기준 낱말로 나눕니다. (정규식 특수문자도 글자 그대로)"""
+    return [token for token in normalize(query).split() if token]
+
+
+def grams(text):
+    """1-gram 과 2-gram 집합. (공백이 낀 2-gram 은 만들지 않습니다)"""
+    result = {ch for ch in text if not ch.isspace()}
+    result.update(text[i:i + 2] for i in range(len(text) - 1)
+                  if not text[i].isspace() and not text[i + 1].isspace())
+    return result
+
+
+class PlaceSearchIndex:
+    def __init__(self, df):
+        self.df = df.reset_index(drop=True)
+        n = len(self.df)
+        self.fields = {
+            field: [normalize(value) for value in self.df[field]] if field in self.df.columns else [''] * n
+            for field in FIELD_WEIGHTS
+        }
+        names = self.df['place_name'].astype(str).to_numpy() if 'place_name' in self.df.columns else np.array([''] * n)
+        self._name_rank = np.empty(n, dtype=np.int64)
+        self._name_rank[np.argsort(names, kind='stable')] = np.arange(n)
+        # 이름 전체와 낱말별 초성 (초성 검색 가산점용)
+        self._name_choseong = [
+            (jamo_index.choseong(name), {jamo_index.choseong(word) for word in name.split()})
+            for name in self.fields['place_name']
+        ]
+
+        lists = {}
+        for field_values in self.fields.values():
+            for row_id, text in enumerate(field_values):
+                for gram in grams(text):
+                    ids = lists.setdefault(gram, [])
+                    if not ids or ids[-1] != row_id:
+                        ids.append(row_id)
+        # 필드를 순서대로 훑으므로 같은 gram 에 row_id 가 뒤섞일 수 있어 정렬/중복 제거
+        self.postings = {gram: np.unique(np.array(ids, dtype=np.int64)) for gram, ids in lists.items()}
+        self.jamo = jamo_index.JamoIndex({field: self.fields[field] for field in TOLERANT_FIELDS})
+        self._cache = {}
+
+    def __len__(self):
+        return len(self.df)
+
+    def _candidates(self, token):
+        keys = [token[i:i + 2] for i in range(len(token) - 1)] if len(token) > 1 else [token]
+        lists = []
+        for key in set(keys):
+            posting = self.postings.get(key)
+            if posting is None:
+                return np.empty(0, dtype=np.int64)
+            lists.append(posting)
+        lists.sort(key=len)
+        result = lists[0]
+        for posting in lists[1:]:
+            result = np.intersect1d(result, posting, assume_unique=True)
+            if not len(result):
+                break
+        return result
+
+    def _token_scores(self, token, candidates):
+        """{장소 번호: 이 낱말의 최고 필드 점수} (실제로 포함하는 후보만)"""
+        scores = {}
+        for row_id in candidates.tolist():
+            best = 0.0
+            for field, weight in FIELD_WEIGHTS.items():
+                if weight > best and token in self.fields[field][row_id]:
+                    best = weight
+            if best:
+                name = self.fields['place_name'][row_id]
+                if name == token:
+                    best += NAME_EXACT_BONUS
+                elif name.startswith(token):
+                    best += NAME_PREFIX_BONUS
+                scores[row_id] = best
+        return scores
+
+    def _choseong_bonus(self, query, row_id):
+        """초성 검색어가 이름 전체면 NAME_EXACT_BONUS, 이름 첫머리이거나 이름의 낱말 하나면 NAME_PREFIX_BONUS."""
+        name, words = self._name_choseong[row_id]
+        if name == query:
+            return NAME_EXACT_BONUS
+        if name.startswith(query) or query in words:
+            return NAME_PREFIX_BONUS
+        return 0.0
+
+    def _tolerant_scores(self, token):
+        """초성/자모 검색으로 찾은 {장소 번호: 최고 필드 점수 x 방식 배율}"""
+        kind, matches = self.jamo.match(token)
+        query = ''.join(token.split())
+        scores = {}
+        for field, row_ids in matches.items():
+            weight = FIELD_WEIGHTS[field]
+            for row_id in row_ids.tolist():
+                score = weight
+                if kind == 'choseong' and field == 'place_name':
+                    score += self._choseong_bonus(query, row_id)
+                score *= MATCH_FACTORS[kind]
+                if score > scores.get(row_id, 0.0):
+                    scores[row_id] = score
+        return scores
+
+    def _score(self, words, tolerant):
+        """
+        {장소 번호: 낱말 점수 합}. 낱말별 후보를 먼저 모두 교집합한 뒤, 남은 장소만 부분 문자열 확인/점수 계산.
+        (글자 그대로 후보가 없거나 초성만 친 낱말은 tolerant 에 초성/자모 검색 결과를 채워 후보이자 점수로 씁니다)
+        """
+        candidates = None
+        for token in words:
+            if token not in tolerant:
+                token_candidates = None if jamo_index.is_choseong_query(token) else self._candidates(token)
+                if token_candidates is None or not len(token_candidates):
+                    tolerant[token] = self._tolerant_scores(token)
+            if token in tolerant:
+                token_candidates = np.array(sorted(tolerant[token]), dtype=np.int64)
+            candidates = token_candidates if candidates is None else np.intersect1d(candidates, token_candidates, assume_unique=True)
+            if not len(candidates):
+                return {}
+
+        total = None
+        for token in words:
+            if token in tolerant:
+                scores = {row_id: tolerant[token][row_id] for row_id in candidates.tolist()}
+            else:
+                scores = self._token_scores(token, candidates)
+            if total is None:
+                total = scores
+            else:
+                total = {row_id: total[row_id] + score for row_id, score in scores.items() if row_id in total}
+            if not total:
+                return {}
+        return total or {}
+
+    def search(self, query):
+        """모든 낱말이 맞은 장소 번호 배열 (점수 내림차순, 같으면 이름순). 읽기 전용."""
+        tokens = tuple(tokenize(query))
+        if tokens in self._cache:
+            return self._cache[tokens]
+
+        words = sorted(set(tokens))
+        tolerant = {}
+        total = self._score(words, tolerant)
+        # 결과가 없으면, 2-gram 후보는 있었지만 실제로 포함하는 장소가 하나도 없는 낱말을
+        # 초성/자모 검색으로 바꿔 다시 계산합니다. (낱말마다 한 번)
+        while not total and words:
+            missed = next((token for token in words if token not in tolerant
+                           and not self._token_scores(token, self._candidates(token))), None)
+            if missed is None:
+                break
+            tolerant[missed] = self._tolerant_scores(missed)
+            total = self._score(words, tolerant)
+
+        if total:
+            ids = np.fromiter(total.keys(), dtype=np.int64, count=len(total))
+            score_values = np.fromiter(total.values(), dtype=float, count=len(total))
+            ids = ids[np.lexsort((self._name_rank[ids], -score_values))]
+        else:
+            ids = np.empty(0, dtype=np.int64)
+        ids.setflags(write=False)
+
+        if len(self._cache) >= MAX_CACHED_QUERIES:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[tokens] = ids
+        return ids
+
+    def frame(self, ids):
+        return self.df.iloc[ids]
+
+
+_index_cache = {'source': None, 'index': None}
+
+
+def load_place_search_index():
+    """data_loader의 맛집 프레임이 바뀔 때만 다시 만드는 프로세스 공용 인덱스. 데이터가 없으면 None."""
+    df = data_loader.load_places_keywords()
+    if df.empty:
+        return None
+    if _index_cache['source'] is not df:
+        _index_cache['index'] = PlaceSearchIndex(df)
+        _index_cache['source'] = df
+    return _index_cache['index']
@@ -0,0 +1,212 @@
+"""
+지역별 추천 (pages/10_region_recommend.py) 장소 조회
+
+지역 6곳 × {관광지, 맛집} = 12개 검색을 한 번에 스레드 풀로 보내고 한 번만 기다립니다.
+(첫 화면 = 왕복 한 번) 'active' 모드에서는 보고 있는 지역 2개만 기다리고
+나머지 지역은 백그라운드로 미리 받아 공용 캐시(kakao_cache)에 넣어 둡니다.
+
+큐레이션 목록은 모든 방문자에게 같으므로, 스냅샷 작업이 12개 검색 결과를
+data/region_snapshots/ 에 버전별 JSON으로 저장해 두면 페이지는 API 없이 그 파일만 읽습니다.
+일부 검색이 실패하면 그 검색어만 마지막 정상 스냅샷 값을 이어 씁니다.
+
+    python region_recommend.py snapshot              # 한 번 갱신 (cron 등 주기 실행용)
+    python region_recommend.py snapshot --every 21600  # 6시간마다 계속 갱신
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import kakao_api
+import kakao_client
+
+# 탭 이름 -> 검색 키워드
+REGIONS = {
+    "제주시(도심)": "제주시",
+    "애월읍": "애월",
+    "한림읍": "한림",
+    "서귀포시(도심)": "서귀포시",
+    "성산읍": "성산",
+    "중문": "중문"
+}
+# source_type -> 검색어 접미사
+CATEGORIES = {
+    "map": "관광지",
+    "food": "맛집",
+}
+PLACES_PER_QUERY = 5
+MAX_WORKERS = 12
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_DIR = os.path.join(BASE_DIR, 'data', 'region_snapshots')
+LATEST_FILE = os.path.join(SNAPSHOT_DIR, 'latest.json')
+SNAPSHOT_SCHEMA = 1
+KEEP_SNAPSHOTS = 10
+
+_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='region-prefetch')
+_prefetching = set()
+_prefetch_lock = threading.Lock()
+
+
+def query_for(region_keyword, source_type):
+    return f"{region_keyword} {CATEGORIES[source_type]}"
+
+
+def all_queries(region_keywords=None):
+    keywords = region_keywords if region_keywords is not None else list(REGIONS.values())
+    return [query_for(keyword, source_type) for keyword in keywords for source_type in CATEGORIES]
+
+
+def _search(query):
+    try:
+        return kakao_api.search_keyword(query, size=PLACES_PER_QUERY)
+    except kakao_api.KakaoError as e:
+        return e
+
+
+def fetch_many(queries, max_workers=MAX_WORKERS):
+    """{검색어: documents 목록 또는 KakaoError}. 모든 검색을 동시에 보내고 한 번에 모읍니다."""
+    queries = list(dict.fromkeys(queries))
+    if not queries:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(queries))) as pool:
+        return dict(zip(queries, pool.map(_search, queries)))
+
+
+def prefetch(queries):
+    """결과를 기다리지 않고 백그라운드에서 받아 캐시에 넣습니다. (이미 진행 중인 검색어는 건너뜀)"""
+    for query in queries:
+        with _prefetch_lock:
+            if query in _prefetching:
+                continue
+            _prefetching.add(query)
+        _prefetch_pool.submit(_prefetch_one, query)
+
+
+def _prefetch_one(query):
+    try:
+        _search(query)
+    finally:
+        with _prefetch_lock:
+            _prefetching.discard(query)
+
+
+# --- 스냅샷 (API 없이 페이지 제공) ---
+def _search_live(query):
+    """캐시를 거치지 않고 Kakao에서 바로 받아옵니다. (스냅샷은 항상 최신 값으로)"""
+    try:
+        result = kakao_client.get_client().get_json(
+            kakao_api.KEYWORD_URL, {"query": query, "size": PLACES_PER_QUERY}
+        )
+        return result.get('documents', [])
+    except Exception as e:
+        return kakao_api.KakaoError(str(e))
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, path)
+
+
+def read_latest():
+    """마지막 정상 스냅샷 dict. 없거나 읽을 수 없으면 None."""
+    try:
+        snapshot = _read_json(LATEST_FILE)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get('schema') != SNAPSHOT_SCHEMA:
+        return None
+    return snapshot
+
+
+def build_snapshot(log=print):
+    """
+    12개 검색을 새로 받아 스냅샷을 씁니다. 실패한 검색어는 마지막 정상 스냅샷 값으로 채우고,
+    채울 값도 없으면 latest.json 을 바꾸지 않습니다. 새로 쓴 스냅샷 경로(또는 None)를 반환.
+    """
+    queries = all_queries()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        fetched = dict(zip(queries, pool.map(_search_live, queries)))
+
+    previous = read_latest()
+    results, stale = {}, []
+    for query, result in fetched.items():
+        if not isinstance(result, Exception):
+            results[query] = result
+        elif previous is not None and query in previous['queries']:
+            results[query] = previous['queries'][query]
+            stale.append(query)
+            log(f"'{query}' 조회 실패 -> 이전 스냅샷 값 사용 ({result})")
+        else:
+            log(f"'{query}' 조회 실패, 이전 값 없음 -> 스냅샷을 갱신하지 않습니다. ({result})")
+            return None
+
+    if len(stale) == len(queries):
+        log("모든 조회 실패 -> 마지막 정상 스냅샷 유지")
+        return None
+
+    now = datetime.datetime.now()
+    snapshot = {
+        'schema': SNAPSHOT_SCHEMA,
+        'version': now.strftime('%Y%m%d%H%M%S'),
+        'created_at': now.isoformat(timespec='seconds'),
+        'stale_queries': stale,
+        'queries': results,
+    }
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    path = os.path.join(SNAPSHOT_DIR, f"region_places_{snapshot['version']}.json")
+    _write_json_atomic(path, snapshot)
+    _write_json_atomic(LATEST_FILE, snapshot)
+    _prune_snapshots()
+    log(f"스냅샷 {snapshot['version']} 저장 ({len(results)}개 검색어, 이전 값 사용 {len(stale)}개)")
+    return path
+
+
+def _prune_snapshots():
+    versions = sorted(name for name in os.listdir(SNAPSHOT_DIR) if name.startswith('region_places_'))
+    for name in versions[:-KEEP_SNAPSHOTS]:
+        os.remove(os.path.join(SNAPSHOT_DIR, name))
+
+
+_snapshot_cache = {'mtime': None, 'snapshot': None}
+
+
+def load_snapshot():
+    """페이지용: latest.json 이 바뀌었을 때만 다시 읽는 프로세스 공용 스냅샷. 없으면 None."""
+    try:
+        mtime = os.stat(LATEST_FILE).st_mtime_ns
+    except OSError:
+        return None
+    if _snapshot_cache['mtime'] != mtime:
+        _snapshot_cache['snapshot'] = read_latest()
+        _snapshot_cache['mtime'] = mtime
+    return _snapshot_cache['snapshot']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="지역별 추천 스냅샷 갱신")
+    sub = parser.add_subparsers(dest='command', required=True)
+    snapshot_parser = sub.add_parser('snapshot')
+    snapshot_parser.add_argument('--every', type=int, default=None, metavar='SECONDS', help="주기적으로 계속 갱신")
+    args = parser.parse_args(argv)
+
+    while True:
+        path = build_snapshot()
+        if args.every is None:
+            return 0 if path else 1
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
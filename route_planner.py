@@ -0,0 +1,157 @@
+"""
+하루 일정 방문 순서 정하기 + 이동 시간 기반 방문 시각 배정
+
+이동 시간 행렬(travel_matrix, 분 단위, 비대칭 허용)에서 출발지/도착지를 정하지 않은 열린 경로로
+총 이동 시간이 짧은 순서를 찾습니다.
+
+1. 모든 시작점에서 최근접 이웃(nearest neighbor)으로 경로를 만들어 가장 짧은 것을 고르고
+2. 2-opt (구간 뒤집기) 와 Or-opt (1~3개 구간 옮기기) 로 더 줄어들지 않을 때까지 개선합니다.
+
+2-opt 는 경로의 앞/뒤 방향 누적 비용으로 뒤집힌 구간의 비용을 O(1)에 계산하므로
+비대칭 행렬에서도 정확하며, 20곳 안팎은 수 밀리초 안에 끝납니다.
+
+    route = route_planner.order_route(matrix.duration_min)
+    times = route_planner.visit_times([matrix.duration_min[a, b] for a, b in zip(route, route[1:])])
+"""
+import datetime
+import math
+from itertools import permutations
+
+DAY_START = datetime.time(9, 0)
+DWELL_MINUTES = 60
+ROUND_MINUTES = 10
+LATEST_TIME = datetime.time(23, 50)
+EPS = 1e-9
+
+
+def _as_lists(cost):
+    """NumPy 배열도 받되, 원소 접근이 빠른 파이썬 리스트로 바꿔 씁니다."""
+    return cost.tolist() if hasattr(cost, 'tolist') else [list(row) for row in cost]
+
+
+def route_cost(route, cost):
+    return sum(cost[a][b] for a, b in zip(route, route[1:]))
+
+
+# --- 1. 초기 경로 ---
+def nearest_neighbor(cost, start):
+    n = len(cost)
+    route = [start]
+    remaining = set(range(n)) - {start}
+    while remaining:
+        last = cost[route[-1]]
+        nearest = min(remaining, key=lambda j: (last[j], j))
+        route.append(nearest)
+        remaining.remove(nearest)
+    return route
+
+
+# --- 2. 개선 ---
+def two_opt(route, cost):
+    """route[i..k] 를 뒤집어 줄어드는 첫 이동을 반복 적용합니다. (제자리 수정)"""
+    n = len(route)
+    improved = True
+    while improved:
+        improved = False
+        forward = [0.0] * n
+        backward = [0.0] * n
+        for p in range(1, n):
+            forward[p] = forward[p - 1] + cost[route[p - 1]][route[p]]
+            backward[p] = backward[p - 1] + cost[route[p]][route[p - 1]]
+        for i in range(n - 1):
+            for k in range(i + 1, n):
+                old = forward[k] - forward[i]
+                new = backward[k] - backward[i]
+                if i > 0:
+                    a = route[i - 1]
+                    old += cost[a][route[i]]
+                    new += cost[a][route[k]]
+                if k < n - 1:
+                    b = route[k + 1]
+                    old += cost[route[k]][b]
+                    new += cost[route[i]][b]
+                if new < old - EPS:
+                    route[i:k + 1] = route[i:k + 1][::-1]
+                    improved = True
+                    break
+            if improved:
+                break
+    return route
+
+
+def _link(cost, a, b):
+    """열린 경로의 끝(None)과 잇는 비용은 0."""
+    return 0.0 if a is None or b is None else cost[a][b]
+
+
+def or_opt(route, cost, max_segment=3):
+    """길이 1~max_segment 구간을 다른 위치로 옮겨 줄어드는 첫 이동을 반복 적용합니다. (제자리 수정)"""
+    n = len(route)
+    improved = True
+    while improved:
+        improved = False
+        for length in range(1, min(max_segment, n - 1) + 1):
+            for s in range(n - length + 1):
+                e = s + length
+                segment = route[s:e]
+                prev = route[s - 1] if s > 0 else None
+                nxt = route[e] if e < n else None
+                removed = _link(cost, prev, segment[0]) + _link(cost, segment[-1], nxt) - _link(cost, prev, nxt)
+                rest = route[:s] + route[e:]
+                for j in range(len(rest) + 1):
+                    if j == s:
+                        continue
+                    a = rest[j - 1] if j > 0 else None
+                    b = rest[j] if j < len(rest) else None
+                    added = _link(cost, a, segment[0]) + _link(cost, segment[-1], b) - _link(cost, a, b)
+                    if added < removed - EPS:
+                        route[:] = rest[:j] + segment + rest[j:]
+                        improved = True
+                        break
+                if improved:
+                    break
+            if improved:
+                break
+    return route
+
+
+def order_route(cost):
+    """총 이동 비용이 짧은 방문 순서 (인덱스 목록)."""
+    cost = _as_lists(cost)
+    n = len(cost)
+    if n <= 2:
+        return list(range(n)) if n < 2 or cost[0][1] <= cost[1][0] else [1, 0]
+
+    route = min((nearest_neighbor(cost, start) for start in range(n)), key=lambda r: route_cost(r, cost))
+    best = route_cost(route, cost)
+    while True:
+        two_opt(route, cost)
+        or_opt(route, cost)
+        total = route_cost(route, cost)
+        if total >= best - EPS:
+            return route
+        best = total
+
+
+def brute_force(cost):
+    """모든 순열을 비교한 최적 순서 (벤치마크 기준용, 10곳 이하)."""
+    cost = _as_lists(cost)
+    return list(min(permutations(range(len(cost))), key=lambda r: route_cost(r, cost)))
+
+
+# --- 3. 방문 시각 ---
+def _round_up(minutes, step=ROUND_MINUTES):
+    return int(math.ceil(minutes / step - EPS) * step)
+
+
+def visit_times(leg_minutes, start=DAY_START, dwell=DWELL_MINUTES):
+    """
+    구간 이동 시간(분) 목록으로 각 장소 도착 시각을 정합니다.
+    장소마다 dwell 분 머문 뒤 이동하며, 시각은 ROUND_MINUTES 단위로 올림하고 LATEST_TIME 을 넘지 않습니다.
+    """
+    start_minutes = start.hour * 60 + start.minute
+    latest = LATEST_TIME.hour * 60 + LATEST_TIME.minute
+    arrivals = [start_minutes]
+    for leg in leg_minutes:
+        arrivals.append(_round_up(arrivals[-1] + dwell + leg))
+    return [datetime.time(*divmod(min(m, latest), 60)) for m in arrivals]
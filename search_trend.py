@@ -0,0 +1,88 @@
+"""
+VISIT JEJU 검색어 트렌드 큐브 (월 × 키워드 × 연령대)
+
+노트북은 검색어트랜드내역.CSV 전체를 읽어 시니어 연령대/미식 키워드로 거른 뒤 합산했습니다.
+여기서는 원본을 청크 단위로 한 번만 읽어 (월, 키워드, 연령대)별 점수 합계 큐브를 만들고,
+미식/웰니스/액티비티 등 어떤 키워드 목록의 랭킹이든 큐브를 잘라서(rank) 계산합니다.
+큐브는 파이프라인 캐시(search_cube 스테이지)에만 두고, 페이지는 게시된 랭킹 CSV를 읽습니다.
+
+    cube = Pipeline().result('search_cube')
+    search_trend.rank(cube, ['수국', '힐링'], by_month=False)
+"""
+import pandas as pd
+
+SENIOR_AGES = ['50대', '60대이상']
+CUBE_COLUMNS = ['월', '키워드', '연령대', '점수']
+CHUNK_ROWS = 500_000
+ENCODINGS = ('utf-8', 'cp949')
+
+
+# --- 1. 큐브 생성 (원본 1회 스캔) ---
+def _partial_sums(path, encoding, chunk_rows):
+    reader = pd.read_csv(
+        path,
+        usecols=['통계일', '연령대', '키워드', '점수'],
+        dtype={'연령대': 'category', '키워드': 'category', '점수': 'float64'},
+        parse_dates=['통계일'],
+        encoding=encoding,
+        chunksize=chunk_rows,
+    )
+    partials = []
+    for chunk in reader:
+        chunk['월'] = chunk['통계일'].dt.month.astype('int8')
+        partials.append(chunk.groupby(['월', '키워드', '연령대'], observed=True)['점수'].sum())
+    return partials
+
+
+def build_cube(path, chunk_rows=CHUNK_ROWS, encodings=ENCODINGS):
+    """
+    (월, 키워드, 연령대)별 점수 합계. 키워드/연령대는 category, 월은 int8.
+    청크를 읽으면서 디코딩하고, 도중에 UnicodeDecodeError 가 나면 다음 인코딩(cp949)으로 처음부터 다시 읽습니다.
+    (UTF-8 원본은 한 번만 읽습니다)
+    """
+    for encoding in encodings[:-1]:
+        try:
+            partials = _partial_sums(path, encoding, chunk_rows)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        partials = _partial_sums(path, encodings[-1], chunk_rows)
+
+    if not partials:
+        return empty_cube()
+    # 청크마다 category 목록이 달라 concat 시 문자열로 합쳐지므로 마지막에 다시 category로 맞춥니다.
+    merged = pd.concat(partials).reset_index()
+    cube = merged.groupby(['월', '키워드', '연령대'], as_index=False)['점수'].sum()
+    return as_cube(cube)
+
+
+def as_cube(df):
+    df = df[CUBE_COLUMNS].copy()
+    df['월'] = df['월'].astype('int8')
+    df['키워드'] = df['키워드'].astype(str).astype('category')
+    df['연령대'] = df['연령대'].astype(str).astype('category')
+    df['점수'] = df['점수'].astype(float)
+    return df.sort_values(['월', '키워드', '연령대']).reset_index(drop=True)
+
+
+def empty_cube():
+    return as_cube(pd.DataFrame(columns=CUBE_COLUMNS))
+
+
+# --- 2. 랭킹 (큐브 슬라이스) ---
+def rank(cube, keywords, ages=SENIOR_AGES, by_month=True):
+    """
+    keywords/ages 에 해당하는 점수 합계.
+    by_month=True  -> [월, 키워드, 점수] (월, 키워드 순)     : 미식 랭킹 형식
+    by_month=False -> [키워드, 점수]   (점수 내림차순)       : 웰니스/액티비티 랭킹 형식
+    """
+    mask = cube['키워드'].isin(keywords)
+    if ages is not None:
+        mask &= cube['연령대'].isin(ages)
+    sliced = cube.loc[mask, ['월', '키워드', '점수']].astype({'키워드': str})
+
+    if by_month:
+        return sliced.groupby(['월', '키워드'], as_index=False)['점수'].sum()
+    ranking = sliced.groupby('키워드', as_index=False)['점수'].sum()
+    return ranking.sort_values('점수', ascending=False, kind='stable').reset_index(drop=True)
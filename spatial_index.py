@@ -0,0 +1,157 @@
+"""
+장소 카탈로그 공간 인덱스 (격자, 반경/최근접 k 검색)
+
+위경도를 제주 기준 평면 좌표(km)로 투영하고 CELL_KM 격자 칸마다 장소 번호 배열을 둡니다.
+- radius(lat, lon, km): 반경을 덮는 칸들의 후보만 거리를 계산
+- nearest(lat, lon, k): 가까운 칸부터 고리(ring) 모양으로 넓혀 가다가 k번째 거리가
+  아직 보지 않은 칸까지의 최소 거리보다 가까우면 멈춤
+
+칸 하나에 든 장소 수만큼만 계산하므로 카탈로그가 100배로 늘어도 (칸 크기만 맞으면) 조회 비용은
+반경 안 장소 수에 비례합니다. 인덱스는 data_loader 프레임이 바뀔 때만 다시 만듭니다.
+
+    index = spatial_index.load_restaurant_index()      # jeju_places_with_auto_keywords.csv
+    ids, distances = index.radius(33.25, 126.56, 3.0)
+    index.frame(ids, distances)                          # '거리_km' 컬럼 포함, 가까운 순
+    index.nearby(33.25, 126.56, 3.0, limit=5)            # 위 두 줄을 한 번에
+"""
+import math
+
+import numpy as np
+
+import data_loader
+
+CELL_KM = 1.0
+NEARBY_RADIUS_KM = 3.0
+NEARBY_LIMIT = 5
+KM_PER_DEG_LAT = 110.574
+KM_PER_DEG_LON_EQUATOR = 111.320
+DISTANCE_COLUMN = '거리_km'
+
+
+class SpatialIndex:
+    def __init__(self, df, name_column=None, cell_km=CELL_KM):
+        self.df = df.reset_index(drop=True)
+        self.name_column = name_column
+        self.cell_km = cell_km
+        lat = self.df['lat'].to_numpy(dtype=float)
+        lon = self.df['lon'].to_numpy(dtype=float)
+        valid = np.flatnonzero(~(np.isnan(lat) | np.isnan(lon)))
+        self.ref_lat = float(lat[valid].mean()) if len(valid) else 33.4
+        self.xy = self.project(lat, lon)
+
+        cells = np.floor(self.xy[valid] / cell_km).astype(np.int64)
+        order = np.lexsort((cells[:, 1], cells[:, 0]))
+        cells, ids = cells[order], valid[order]
+        self.cells = {}
+        if len(ids):
+            breaks = np.flatnonzero((np.diff(cells, axis=0) != 0).any(axis=1)) + 1
+            for start, end in zip(np.r_[0, breaks], np.r_[breaks, len(ids)]):
+                self.cells[(int(cells[start, 0]), int(cells[start, 1]))] = ids[start:end]
+            self._min_cell = cells.min(axis=0)
+            self._max_cell = cells.max(axis=0)
+
+    def __len__(self):
+        return len(self.df)
+
+    def project(self, lat, lon):
+        """위경도 -> 평면 좌표 (km). 제주 범위에서는 거리 오차가 무시할 만합니다."""
+        lat = np.asarray(lat, dtype=float)
+        lon = np.asarray(lon, dtype=float)
+        km_per_deg_lon = KM_PER_DEG_LON_EQUATOR * math.cos(math.radians(self.ref_lat))
+        return np.column_stack([lon * km_per_deg_lon, lat * KM_PER_DEG_LAT])
+
+    def _candidates(self, cx0, cx1, cy0, cy1):
+        blocks = [self.cells[(cx, cy)] for cx in range(cx0, cx1 + 1) for cy in range(cy0, cy1 + 1)
+                  if (cx, cy) in self.cells]
+        return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+
+    def _distances(self, point, ids):
+        return np.hypot(*(self.xy[ids] - point).T) if len(ids) else np.empty(0)
+
+    def _sorted(self, ids, distances, limit=None):
+        order = np.lexsort((ids, distances))[:limit]
+        return ids[order], distances[order]
+
+    def radius(self, lat, lon, radius_km, limit=None):
+        """반경 radius_km 안의 (장소 번호, 거리 km) 배열, 가까운 순."""
+        if not self.cells:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        point = self.project([lat], [lon])[0]
+        lo = np.floor((point - radius_km) / self.cell_km).astype(np.int64)
+        hi = np.floor((point + radius_km) / self.cell_km).astype(np.int64)
+        lo = np.maximum(lo, self._min_cell)
+        hi = np.minimum(hi, self._max_cell)
+        ids = self._candidates(lo[0], hi[0], lo[1], hi[1])
+        distances = self._distances(point, ids)
+        inside = distances <= radius_km
+        return self._sorted(ids[inside], distances[inside], limit)
+
+    def nearest(self, lat, lon, k, max_km=None):
+        """가까운 k곳의 (장소 번호, 거리 km) 배열 (max_km 가 있으면 그 안에서만)."""
+        if not self.cells or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        point = self.project([lat], [lon])[0]
+        cx, cy = (int(c) for c in np.floor(point / self.cell_km))
+        # 격자 전체를 덮는 데 필요한 최대 고리 번호
+        max_ring = int(max(abs(cx - self._min_cell[0]), abs(self._max_cell[0] - cx),
+                           abs(cy - self._min_cell[1]), abs(self._max_cell[1] - cy)))
+        if max_km is not None:
+            max_ring = min(max_ring, int(math.ceil(max_km / self.cell_km)) + 1)
+
+        ids = np.empty(0, dtype=np.int64)
+        distances = np.empty(0)
+        for ring in range(max_ring + 1):
+            if ring == 0:
+                new_ids = self._candidates(cx, cx, cy, cy)
+            else:
+                new_ids = np.concatenate([
+                    self._candidates(cx - ring, cx + ring, cy - ring, cy - ring),
+                    self._candidates(cx - ring, cx + ring, cy + ring, cy + ring),
+                    self._candidates(cx - ring, cx - ring, cy - ring + 1, cy + ring - 1),
+                    self._candidates(cx + ring, cx + ring, cy - ring + 1, cy + ring - 1),
+                ])
+            ids = np.concatenate([ids, new_ids])
+            distances = np.concatenate([distances, self._distances(point, new_ids)])
+            # 아직 보지 않은 칸은 모두 ring * CELL_KM 보다 멉니다.
+            if len(ids) >= k and np.partition(distances, k - 1)[k - 1] <= ring * self.cell_km:
+                break
+
+        if max_km is not None:
+            inside = distances <= max_km
+            ids, distances = ids[inside], distances[inside]
+        return self._sorted(ids, distances, k)
+
+    def frame(self, ids, distances):
+        return self.df.iloc[ids].assign(**{DISTANCE_COLUMN: distances})
+
+    def nearby(self, lat, lon, radius_km=NEARBY_RADIUS_KM, limit=NEARBY_LIMIT, exclude_name=None):
+        """반경 안 장소 DataFrame ('거리_km' 포함, 가까운 순). exclude_name 과 이름이 같은 장소는 뺍니다."""
+        extra = 1 if exclude_name is not None and limit is not None else 0
+        result = self.frame(*self.radius(lat, lon, radius_km, None if limit is None else limit + extra))
+        if exclude_name is not None and self.name_column is not None:
+            result = result[result[self.name_column] != exclude_name]
+        return result.head(limit) if limit is not None else result
+
+
+_index_cache = {}
+
+
+def _load_index(name, df, name_column):
+    """data_loader 프레임이 바뀔 때만 다시 만드는 프로세스 공용 인덱스. 데이터가 없으면 None."""
+    if df.empty or 'lat' not in df.columns or 'lon' not in df.columns:
+        return None
+    entry = _index_cache.get(name)
+    if entry is None or entry['source'] is not df:
+        entry = {'source': df, 'index': SpatialIndex(df, name_column)}
+        _index_cache[name] = entry
+    return entry['index']
+
+
+def load_restaurant_index():
+    """맛집 카탈로그 (jeju_places_with_auto_keywords.csv, 이름 컬럼 place_name)."""
+    return _load_index('restaurants', data_loader.load_places_keywords(), 'place_name')
+
+
+def load_attraction_index():
+    """관광지 카탈로그 (jeju_places_mean.xlsx, 이름 컬럼 장소명)."""
+    return _load_index('attractions', data_loader.load_places_mean(), '장소명')
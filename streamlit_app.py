@@ -1,9 +1,10 @@
 import streamlit as st
 import pandas as pd
-import os
 import datetime
 import numpy as np
 import navigation
+import data_loader
+import theme_calendar
 
 st.set_page_config(
     page_title="GOLDEN JEJU | 메인",
@@ -85,59 +86,12 @@ st.markdown('</div>', unsafe_allow_html=True)
 # --- [수정 완료] ---
 
 
-# --- 데이터 경로 설정 ---
-base_path = os.path.dirname(os.path.abspath(__file__))
-data_folder_name = 'data'
-data_path = os.path.join(base_path, data_folder_name)
-
-final_themes_file = os.path.join(data_path, 'golden_compass_final_themes.csv')
-foodie_file = os.path.join(data_path, 'golden_compass_foodie_ranking.csv')
-
-@st.cache_data
-def load_data(file_path):
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
-        if '날짜' in df.columns:
-            df['날짜'] = pd.to_datetime(df['날짜'])
-            df['월_라벨'] = df['날짜'].dt.strftime('%Y년 %m월')
-            df['월'] = df['날짜'].dt.month
-            labels_5 = ["매우\n쾌적", "쾌적", "보통", "혼잡", "매우\n혼잡"]
-            if '관광 포화 지수' in df.columns:
-                df['쾌적도 라벨'] = pd.qcut(df['관광 포화 지수'], 5, labels=labels_5, duplicates='drop')
-            else:
-                df['쾌적도 라벨'] = "N/A"
-            if '웰니스 쾌적도' in df.columns:
-                df['웰니스 쾌적도'] = df['웰니스 쾌적도'].astype(float)
-            if '골프 쾌적도' in df.columns:
-                df['골프 쾌적도'] = df['골프 쾌적도'].astype(float)
-            if '전세버스 가동률' in df.columns:
-                df['전세버스 가동률'] = df['전세버스 가동률'].astype(float)
-        return df
-    except Exception as e:
-        st.error(f"데이터 로드 중 오류 발생: {e}")
-        return pd.DataFrame()
-
-@st.cache_data
-def load_foodie_data(file_path):
-    if not os.path.exists(file_path):
-        return pd.DataFrame()
-    try:
-        df = pd.read_csv(file_path, encoding='utf-8-sig')
-        return df
-    except Exception as e:
-        st.error(f"미식 데이터 로드 중 오류 발생: {e}")
-        return pd.DataFrame()
-# --- ---
-
-
 def main_dashboard():
     
-    df_full = load_data(final_themes_file)
-    df_foodie = load_data(foodie_file)
+    calendar = theme_calendar.load_theme_calendar()
+    df_foodie = data_loader.load_foodie_ranking()
 
-    if df_full.empty:
+    if calendar is None:
         st.error("데이터 파일을 찾을 수 없습니다. 'data' 폴더를 확인해주세요.")
         return
         
@@ -149,7 +103,7 @@ def main_dashboard():
         current_date_for_display = datetime.datetime(2025, 11, 1) 
         current_month_label = current_date_for_display.strftime('%Y년 %m월')
         
-        current_data = df_full[df_full['월_라벨'] == current_month_label].iloc[0]
+        current_data = calendar[(current_date_for_display.year, current_date_for_display.month)]
 
         st.subheader(f"🍊 지금, 제주는? ({current_month_label} 기준)")
         
@@ -234,10 +188,12 @@ def main_dashboard():
     cols_selector, cols_detail = st.columns([1, 2]) 
     
     with cols_selector:
-        month_options = df_full['월_라벨'].unique()[::-1]
-        selected_month_label = st.selectbox("분석할 월을 선택하세요:", month_options, label_visibility="collapsed")
+        month_options = calendar.months()[::-1]
+        selected_year_month = st.selectbox("분석할 월을 선택하세요:", month_options, label_visibility="collapsed",
+                                           format_func=lambda ym: f"{ym[0]}년 {ym[1]:02d}월")
 
-        selected_data = df_full[df_full['월_라벨'] == selected_month_label].iloc[0]
+        selected_data = calendar[selected_year_month]
+        selected_month_label = selected_data['월_라벨']
         selected_month_int = selected_data['월']
 
         st.markdown(f"#### **{selected_month_label}** 상세 정보")
@@ -264,4 +220,4 @@ def main_dashboard():
 
 
 if __name__ == "__main__":
-    main_dashboard()
\ No newline at end of file
+    main_dashboard()
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+accommodation_index 비트마스크/등급/태그 필터를 행마다 조건을 확인하는 방식(브루트포스)과 비교
+
+    python -m pytest tests/test_accommodation_index.py
+"""
+import itertools
+import os
+import random
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import accommodation_features  # noqa: E402
+import accommodation_index  # noqa: E402
+import data_loader  # noqa: E402
+
+TYPES = ['호텔', '펜션', '모텔', '기타']
+REGIONS = ['제주시', '서귀포시', '']
+FACILITIES = ['주차', '스파', 'OTT', '반려동물']
+
+
+def random_frame(n, rng):
+    rows = []
+    for i in range(n):
+        row = {'콘텐츠명': f"숙소{rng.randrange(1000):03d}-{i}", '등급': rng.randint(0, 5)}
+        for col in data_loader.OX_COLUMNS:
+            row[col] = rng.choice('OX')
+        row['숙소유형'] = accommodation_features.join_tags(rng.sample(TYPES, rng.randint(1, 2)))
+        row['지역'] = rng.choice(REGIONS)
+        row['시설태그'] = accommodation_features.join_tags(rng.sample(FACILITIES, rng.randint(0, 3)))
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def brute_force(df, grade_range, required, types, facilities, regions):
+    ids = []
+    for row_id, row in enumerate(df.to_dict('records')):
+        row_types = accommodation_features.split_tags(row['숙소유형'])
+        row_facilities = accommodation_features.split_tags(row['시설태그'])
+        region = row['지역'] or accommodation_features.UNKNOWN_REGION
+        if not grade_range[0] <= row['등급'] <= grade_range[1]:
+            continue
+        if any(row[col] != 'O' for col in required):
+            continue
+        if types and not set(types) & set(row_types):
+            continue
+        if not set(facilities) <= set(row_facilities):
+            continue
+        if regions and region not in regions:
+            continue
+        ids.append(row_id)
+    return ids
+
+
+def subsets(values, max_size):
+    return [list(combo) for size in range(max_size + 1) for combo in itertools.combinations(values, size)]
+
+
+class AccommodationFilterTest(unittest.TestCase):
+    def setUp(self):
+        self.df = random_frame(300, random.Random(0))
+        self.index = accommodation_index.AccommodationIndex(self.df)
+
+    def test_grade_and_required_options(self):
+        for low, high in [(0, 5), (3, 5), (2, 2), (4, 1)]:
+            for required in subsets(data_loader.OX_COLUMNS, 2):
+                self.assertEqual(self.index.filter((low, high), required).tolist(),
+                                 brute_force(self.df, (low, high), required, [], [], []), (low, high, required))
+
+    def test_tag_filters(self):
+        rng = random.Random(1)
+        regions = REGIONS[:2] + [accommodation_features.UNKNOWN_REGION]
+        for _ in range(200):
+            query = ((rng.randint(0, 3), rng.randint(3, 5)), rng.sample(data_loader.OX_COLUMNS, rng.randint(0, 2)),
+                     rng.sample(TYPES, rng.randint(0, 2)), rng.sample(FACILITIES, rng.randint(0, 2)),
+                     rng.sample(regions, rng.randint(0, 2)))
+            self.assertEqual(self.index.filter(*query).tolist(), brute_force(self.df, *query), query)
+
+    def test_sort_orders_match_pandas(self):
+        ids = self.index.filter((0, 5))
+        by_grade = self.df.assign(row=range(len(self.df))).sort_values(['등급', 'row'], ascending=[False, True])
+        self.assertEqual(self.index.sort(ids, 'grade_desc').tolist(), by_grade['row'].tolist())
+        by_name = self.df.assign(row=range(len(self.df))).sort_values(['콘텐츠명', 'row'], kind='stable')
+        self.assertEqual(self.index.sort(ids, 'name').tolist(), by_name['row'].tolist())
+
+    def test_results_are_memoized_and_read_only(self):
+        first = self.index.filter((1, 4), ['조식제공여부'], types=['펜션', '호텔'])
+        self.assertIs(self.index.filter((1, 4), ['조식제공여부'], types=['호텔', '펜션']), first)
+        with self.assertRaises(ValueError):
+            first[0] = 0
+
+
+if __name__ == "__main__":
+    unittest.main()
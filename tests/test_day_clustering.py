@@ -0,0 +1,79 @@
+"""
+day_clustering 용량 제약 k-means 를 모든 균형 분할 비교(brute force)와 비교
+
+    python -m pytest tests/test_day_clustering.py
+"""
+import itertools
+import math
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import day_clustering  # noqa: E402
+
+
+def balanced(labels, k):
+    counts = np.bincount(labels, minlength=k)
+    return counts.max() - counts.min() <= 1 and counts.min() > 0
+
+
+def brute_force_inertia(points, k):
+    """묶음 크기가 floor(n/k)/ceil(n/k) 인 모든 분할 중 가장 작은 거리 제곱합."""
+    best = math.inf
+    for labels in itertools.product(range(k), repeat=len(points) - 1):
+        labels = np.array((0,) + labels)   # 첫 장소는 0번 날로 고정 (라벨 이름만 다른 분할 제외)
+        if balanced(labels, k):
+            best = min(best, day_clustering._inertia(points, labels, k))
+    return best
+
+
+class BalancedKMeansTest(unittest.TestCase):
+    def test_close_to_brute_force(self):
+        rng = np.random.default_rng(0)
+        optimal = 0
+        trials = 60
+        for _ in range(trials):
+            n, k = int(rng.integers(4, 9)), int(rng.integers(2, 4))
+            points = rng.random((n, 2))
+            labels = day_clustering.balanced_kmeans(points, k)
+            self.assertTrue(balanced(labels, k))
+            inertia = day_clustering._inertia(points, labels, k)
+            best = brute_force_inertia(points, k)
+            self.assertLessEqual(inertia, best * 1.2 + 1e-12)
+            optimal += inertia <= best + 1e-12
+        self.assertGreaterEqual(optimal / trials, 0.9)
+
+    def test_separated_groups_are_recovered(self):
+        rng = np.random.default_rng(1)
+        centers = np.array([[0.0, 0.0], [5.0, 0.0], [0.0, 5.0]])
+        points = np.vstack([center + rng.normal(scale=0.1, size=(4, 2)) for center in centers])
+        labels = day_clustering.balanced_kmeans(points, 3)
+        groups = {frozenset(np.flatnonzero(labels == day).tolist()) for day in range(3)}
+        self.assertEqual(groups, {frozenset(range(0, 4)), frozenset(range(4, 8)), frozenset(range(8, 12))})
+
+    def test_balances_uneven_groups(self):
+        # 한쪽에 7곳, 다른 쪽에 1곳이 몰려 있어도 하루 4곳씩
+        points = np.array([[0.0, i * 0.01] for i in range(7)] + [[10.0, 0.0]])
+        self.assertTrue(balanced(day_clustering.balanced_kmeans(points, 2), 2))
+
+
+class ClusterDaysTest(unittest.TestCase):
+    def test_places_without_coordinates_fill_smallest_days(self):
+        coords = [(33.25, 126.56), (33.26, 126.57), (33.50, 126.53), (33.51, 126.52), (33.45, 126.90),
+                  (float('nan'), float('nan')), (float('nan'), float('nan'))]
+        labels = day_clustering.cluster_days(coords, 3)
+        self.assertEqual(len(labels), len(coords))
+        self.assertTrue(balanced(np.array(labels), 3))
+        self.assertEqual(day_clustering.cluster_days(coords, 3), labels)
+
+    def test_more_days_than_places(self):
+        labels = day_clustering.cluster_days([(33.25, 126.56), (33.50, 126.53)], 4)
+        self.assertEqual(sorted(labels), [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
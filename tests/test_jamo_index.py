@@ -0,0 +1,89 @@
+"""
+jamo_index 초성/자모 접두사/편집 거리 1 검색을 모든 부분 문자열 확인(브루트포스)과 비교
+
+    python -m pytest tests/test_jamo_index.py
+"""
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jamo_index  # noqa: E402
+
+NAMES = ['흑돼지집', '애월 흑돼지', '돼지국밥', '제주 해장국', '함덕 고기국수', '우도 땅콩아이스크림',
+         '고기국수 본점', '애월 카페', '돈사돈', '갈치조림 전문점', '옥돔구이', '한라산 소주']
+KEYWORDS = ['흑돼지,근고기', '오션뷰', '국밥', '해장국,아침', '함덕해변', '아이스크림',
+            '국수', '커피', '근고기', '갈치', '생선구이', '']
+
+
+def expected(fields, contains):
+    """{필드: 조건을 만족하는 장소 번호 목록}"""
+    result = {}
+    for field, values in fields.items():
+        rows = [row_id for row_id, value in enumerate(values) if value and contains(value)]
+        if rows:
+            result[field] = rows
+    return result
+
+
+def one_edit_anywhere(pattern, text):
+    m = len(pattern)
+    return any(jamo_index.within_one_edit(pattern, text[start:start + length])
+               for start in range(len(text) + 1) for length in (m - 1, m, m + 1))
+
+
+def as_lists(matches):
+    return {field: ids.tolist() for field, ids in matches.items()}
+
+
+class JamoIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.fields = {'place_name': NAMES, 'original_keywords': KEYWORDS}
+        self.index = jamo_index.JamoIndex(self.fields)
+
+    def test_choseong_matches_brute_force(self):
+        for query in ['ㅎㄷㅈ', 'ㄱㄱㄱㅅ', 'ㅇㅇ', 'ㄱ', 'ㅎㄹㅅ ㅅㅈ', 'ㅋㅍ', 'ㅂㅂ']:
+            compact = ''.join(query.split())
+            kind, matches = self.index.match(query)
+            want = expected(self.fields, lambda value: compact in jamo_index.choseong(value))
+            self.assertEqual(as_lists(matches), want, query)
+            self.assertEqual(kind, 'choseong' if want else None)
+
+    def test_partial_syllable_prefix_matches_brute_force(self):
+        for query in ['흑돼ㅈ', '흑됒', '고기국ㅅ', '해자', '아이스크', '갈치조', '한라산소']:
+            pattern = jamo_index.decompose(query)
+            kind, matches = self.index.match(query)
+            self.assertEqual(kind, 'prefix', query)
+            self.assertEqual(as_lists(matches), expected(self.fields, lambda value: pattern in jamo_index.decompose(value)))
+
+    def test_typo_matches_brute_force(self):
+        rng = random.Random(7)
+        # 키보드 입력 단위 자모만 (겹모음은 decompose 가 둘로 나눕니다)
+        alphabet = [ch for ch in jamo_index.CHOSEONG + jamo_index.JUNGSEONG if ch not in jamo_index.COMPOUND_JAMO]
+        for _ in range(200):
+            source = jamo_index.decompose(rng.choice(NAMES + KEYWORDS[:-1]))
+            start = rng.randrange(max(len(source) - 6, 1))
+            pattern = list(source[start:start + rng.randint(4, 8)])
+            position = rng.randrange(len(pattern))
+            edit = rng.choice(['replace', 'delete', 'insert'])
+            if edit == 'replace':
+                pattern[position] = rng.choice(alphabet)
+            elif edit == 'delete':
+                del pattern[position]
+            else:
+                pattern.insert(position, rng.choice(alphabet))
+            pattern = ''.join(pattern)
+            if (len(pattern) < jamo_index.MIN_FUZZY_LEN or jamo_index.is_choseong_query(pattern)
+                    or any(pattern in jamo_index.decompose(value) for value in NAMES + KEYWORDS)):
+                continue
+            kind, matches = self.index.match(pattern)
+            self.assertEqual(kind, 'edit1', pattern)
+            self.assertEqual(as_lists(matches),
+                             expected(self.fields, lambda value: one_edit_anywhere(pattern, jamo_index.decompose(value))),
+                             pattern)
+
+
+if __name__ == "__main__":
+    unittest.main()
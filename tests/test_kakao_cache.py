@@ -0,0 +1,95 @@
+"""
+kakao_cache stale-while-revalidate 실패 경로
+
+    python -m pytest tests/test_kakao_cache.py
+"""
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import kakao_cache  # noqa: E402
+
+PARAMS = {'query': '제주 흑돼지'}
+
+
+def failing_fetch():
+    raise RuntimeError("503 Service Unavailable")
+
+
+class StaleWhileRevalidateTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.sqlite')
+        self.calls = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def make_cache(self, ttl, grace):
+        return kakao_cache.ResponseCache(self.path, ttls={'keyword': ttl}, stale_grace={'keyword': grace})
+
+    def counting_fetch(self, value):
+        def fetch():
+            self.calls += 1
+            return value
+        return fetch
+
+    def wait_for_failure(self, cache):
+        key = cache.key('keyword', PARAMS)
+        deadline = time.time() + 5
+        while time.time() < deadline:
+            if cache._read(key)[4] is not None and not cache._inflight:
+                return
+            time.sleep(0.01)
+        self.fail("백그라운드 재검증이 끝나지 않았습니다.")
+
+    def test_failed_refresh_keeps_stale_value(self):
+        cache = self.make_cache(ttl=-1, grace=60)   # 쓰자마자 만료, 60초 동안 이전 값 사용
+        self.assertEqual(cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['old'])), ['old'])
+
+        # 만료된 값을 돌려주고 백그라운드 재검증은 실패
+        self.assertEqual(cache.get_or_fetch('keyword', PARAMS, failing_fetch), ['old'])
+        self.wait_for_failure(cache)
+
+        # 실패 후에도 이전 값을 돌려주며, NEGATIVE_TTL 동안은 다시 받아오지 않습니다.
+        self.assertEqual(cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['new'])), ['old'])
+        time.sleep(0.2)
+        self.assertEqual(self.calls, 1)
+
+    def test_retry_after_backoff_replaces_value(self):
+        cache = self.make_cache(ttl=-1, grace=60)
+        cache.negative_ttl = 0
+        cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['old']))
+        cache.get_or_fetch('keyword', PARAMS, failing_fetch)
+        self.wait_for_failure(cache)
+
+        cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['new']))
+        key = cache.key('keyword', PARAMS)
+        deadline = time.time() + 5
+        while cache._read(key)[4] is not None and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(cache._unpack(cache._read(key)), ['new'])
+
+    def test_failure_without_good_value_is_negative(self):
+        cache = self.make_cache(ttl=60, grace=60)
+        with self.assertRaises(RuntimeError):
+            cache.get_or_fetch('keyword', PARAMS, failing_fetch)
+        with self.assertRaises(kakao_cache.CachedFailure):
+            cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['new']))
+        self.assertEqual(self.calls, 0)
+
+    def test_failure_after_grace_is_negative(self):
+        cache = self.make_cache(ttl=-1, grace=0)    # 만료 즉시 이전 값도 쓸 수 없음
+        cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['old']))
+        with self.assertRaises(RuntimeError):
+            cache.get_or_fetch('keyword', PARAMS, failing_fetch)
+        with self.assertRaises(kakao_cache.CachedFailure):
+            cache.get_or_fetch('keyword', PARAMS, self.counting_fetch(['new']))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+place_search n-gram 역색인 검색을 전체 행 부분 문자열 확인(브루트포스)과 비교
+
+    python -m pytest tests/test_place_search.py
+"""
+import os
+import random
+import sys
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import place_search  # noqa: E402
+
+PLACES = pd.DataFrame({
+    'place_name': ['흑돼지집', '애월 흑돼지', '흑돼지 김치지짐', '돼지국밥', '제주 해장국', '함덕 고기국수',
+                   '우도 땅콩아이스크림', '고기국수 본점', '애월 카페', '돈사돈', '가마솥고기국수', '제주흑돼지'],
+    'original_keywords': ['흑돼지,근고기', '흑돼지,오션뷰', '전,막걸리', '국밥,해장', '해장국,아침식사',
+                          '고기국수,함덕해변', '아이스크림,우도', '국수', '커피,오션뷰', '흑돼지,근고기', '국수', '구이'],
+    'category_name': ['음식점>한식>육류', '음식점>한식>육류', '음식점>한식', '음식점>한식>국밥', '음식점>한식>해장국',
+                      '음식점>한식>국수', '음식점>간식', '음식점>한식>국수', '음식점>카페', '음식점>한식>육류',
+                      '음식점>한식>국수', '음식점>한식>육류'],
+})
+
+
+def brute_force(index, query):
+    """모든 낱말이 어느 필드에든 들어 있는 장소를 점수 내림차순, 이름순으로."""
+    tokens = set(place_search.tokenize(query))
+    scores = {}
+    for row_id in range(len(index)):
+        total = 0.0
+        for token in tokens:
+            best = max((weight for field, weight in place_search.FIELD_WEIGHTS.items()
+                        if token in index.fields[field][row_id]), default=0.0)
+            if not best:
+                break
+            name = index.fields['place_name'][row_id]
+            if name == token:
+                best += place_search.NAME_EXACT_BONUS
+            elif name.startswith(token):
+                best += place_search.NAME_PREFIX_BONUS
+            total += best
+        else:
+            scores[row_id] = total
+    names = PLACES['place_name'].tolist()
+    return sorted(scores, key=lambda row_id: (-scores[row_id], names[row_id]))
+
+
+class LiteralSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.index = place_search.PlaceSearchIndex(PLACES)
+
+    def test_matches_brute_force(self):
+        words = ['흑돼지', '애월', '국수', '고기', '오션뷰', '해장', '돼지', '우도', '한식', '국', '>', '카페']
+        rng = random.Random(0)
+        queries = words + [' '.join(rng.sample(words, 2)) for _ in range(30)]
+        for query in queries:
+            if all(brute_force(self.index, token) for token in place_search.tokenize(query)):
+                self.assertEqual(self.index.search(query).tolist(), brute_force(self.index, query), query)
+
+    def test_scattered_bigrams_fall_back_to_typo_match(self):
+        # '흑돼지짐'의 2-gram(흑돼/돼지/지짐)은 모두 '흑돼지 김치지짐'에 있지만 이어지지 않습니다.
+        # 글자 그대로는 0건이므로 편집 거리 1 검색으로 '흑돼지집'(과 '흑돼지김치')을 찾아야 합니다.
+        self.assertTrue(len(self.index._candidates('흑돼지짐')))
+        ids = self.index.search('흑돼지짐')
+        self.assertIn('흑돼지집', self.index.frame(ids)['place_name'].tolist())
+
+    def test_no_fallback_when_words_just_do_not_co_occur(self):
+        # 두 낱말 모두 글자 그대로 맞는 곳이 있으면 함께 맞는 곳이 없어도 오타 검색으로 넓히지 않습니다.
+        self.assertEqual(len(self.index.search('우도 해장국')), 0)
+
+
+class ChoseongRankingTest(unittest.TestCase):
+    def setUp(self):
+        self.index = place_search.PlaceSearchIndex(PLACES)
+
+    def names(self, query):
+        return self.index.frame(self.index.search(query))['place_name'].tolist()
+
+    def test_whole_name_then_prefix_or_word_then_infix(self):
+        # ㄷㅅㄷ: 이름 전체가 맞는 곳이 먼저
+        self.assertEqual(self.names('ㄷㅅㄷ')[0], '돈사돈')
+        # ㅎㄷㅈ: 이름 첫머리(흑돼지집, 흑돼지 김치지짐) / 낱말 하나(애월 흑돼지)
+        #         > 이름 중간(제주흑돼지) > 키워드로만 맞는 곳(돈사돈)
+        names = self.names('ㅎㄷㅈ')
+        self.assertEqual(set(names[:3]), {'흑돼지집', '애월 흑돼지', '흑돼지 김치지짐'})
+        self.assertEqual(names[3:], ['제주흑돼지', '돈사돈'])
+        # ㄱㄱㄱㅅ: 이름 첫머리/낱말 하나(같은 점수, 이름순) > 이름 중간 (가산점이 없으면 이름순으로 가마솥고기국수가 먼저)
+        self.assertEqual(self.names('ㄱㄱㄱㅅ'), ['고기국수 본점', '함덕 고기국수', '가마솥고기국수'])
+
+    def test_choseong_bonus_keeps_literal_order(self):
+        # 같은 장소라면 초성 점수는 글자 그대로 검색 점수에 MATCH_FACTORS 를 곱한 값입니다.
+        literal = self.index._token_scores('돈사돈', self.index._candidates('돈사돈'))
+        choseong = self.index._tolerant_scores('ㄷㅅㄷ')
+        row_id = PLACES.index[PLACES['place_name'] == '돈사돈'][0]
+        self.assertAlmostEqual(choseong[row_id], literal[row_id] * place_search.MATCH_FACTORS['choseong'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+route_planner 방문 순서를 모든 순열 비교(brute force) / 모든 2-opt, Or-opt 이동 확인과 비교
+
+    python -m pytest tests/test_route_planner.py
+"""
+import datetime
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import route_planner  # noqa: E402
+from travel_matrix import estimate  # noqa: E402
+
+JEJU_LAT = (33.20, 33.56)
+JEJU_LON = (126.16, 126.94)
+
+
+def road_like_costs(n, rng):
+    """제주 범위 무작위 좌표의 추정 이동 시간에 방향별 0~20% 잡음 (benchmarks/bench_route.py 와 같은 방식)."""
+    points = [(rng.uniform(*JEJU_LAT), rng.uniform(*JEJU_LON)) for _ in range(n)]
+    return [[0.0 if i == j else estimate(a, b)[1] * rng.uniform(1.0, 1.2)
+             for j, b in enumerate(points)] for i, a in enumerate(points)]
+
+
+def random_costs(n, rng):
+    """삼각 부등식도 대칭도 없는 임의 행렬."""
+    return [[0.0 if i == j else rng.uniform(1, 60) for j in range(n)] for i in range(n)]
+
+
+def reversal_moves(route):
+    n = len(route)
+    for i in range(n - 1):
+        for k in range(i + 1, n):
+            yield route[:i] + route[i:k + 1][::-1] + route[k + 1:]
+
+
+def segment_moves(route, max_segment=3):
+    n = len(route)
+    for length in range(1, min(max_segment, n - 1) + 1):
+        for s in range(n - length + 1):
+            segment, rest = route[s:s + length], route[:s] + route[s + length:]
+            for j in range(len(rest) + 1):
+                yield rest[:j] + segment + rest[j:]
+
+
+class OrderRouteTest(unittest.TestCase):
+    def test_small_routes_are_optimal(self):
+        rng = random.Random(0)
+        for n in range(4):
+            for _ in range(20):
+                cost = random_costs(n, rng)
+                route = route_planner.order_route(cost)
+                self.assertAlmostEqual(route_planner.route_cost(route, cost),
+                                       route_planner.route_cost(route_planner.brute_force(cost), cost))
+
+    def test_close_to_brute_force_on_road_like_costs(self):
+        rng = random.Random(1)
+        optimal = 0
+        trials = 0
+        for n in range(4, 9):
+            for _ in range(15):
+                cost = road_like_costs(n, rng)
+                route = route_planner.order_route(cost)
+                self.assertEqual(sorted(route), list(range(n)))
+                best = route_planner.route_cost(route_planner.brute_force(cost), cost)
+                found = route_planner.route_cost(route, cost)
+                self.assertLessEqual(found, best * 1.05)
+                optimal += found <= best + route_planner.EPS
+                trials += 1
+        self.assertGreaterEqual(optimal / trials, 0.9)
+
+    def test_no_single_move_improves_result(self):
+        # 임의 행렬에서는 최적을 보장하지 않지만, 돌려준 경로는 2-opt / Or-opt 어느 이동으로도 줄지 않아야 합니다.
+        rng = random.Random(2)
+        for n in range(4, 10):
+            for _ in range(10):
+                cost = random_costs(n, rng)
+                route = route_planner.order_route(cost)
+                total = route_planner.route_cost(route, cost)
+                nn_best = min(route_planner.route_cost(route_planner.nearest_neighbor(cost, s), cost) for s in range(n))
+                self.assertLessEqual(total, nn_best + route_planner.EPS)
+                for move in list(reversal_moves(route)) + list(segment_moves(route)):
+                    self.assertGreaterEqual(route_planner.route_cost(move, cost), total - route_planner.EPS)
+
+
+class VisitTimesTest(unittest.TestCase):
+    def test_rounds_up_and_caps(self):
+        times = route_planner.visit_times([14, 0.5, 600], start=datetime.time(9, 0), dwell=60)
+        self.assertEqual(times, [datetime.time(9, 0), datetime.time(10, 20), datetime.time(11, 30),
+                                 datetime.time(22, 30)])
+        self.assertEqual(route_planner.visit_times([600, 600])[-1], route_planner.LATEST_TIME)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+spatial_index 격자 반경/최근접 k 검색을 전체 거리 계산(브루트포스)과 비교
+
+    python -m pytest tests/test_spatial_index.py
+"""
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import spatial_index  # noqa: E402
+
+JEJU_LAT = (33.20, 33.56)
+JEJU_LON = (126.16, 126.94)
+
+
+def random_places(n, rng):
+    lat = rng.uniform(*JEJU_LAT, size=n)
+    lon = rng.uniform(*JEJU_LON, size=n)
+    lat[rng.random(n) < 0.05] = np.nan   # 좌표가 없는 장소
+    return pd.DataFrame({'place_name': [f"장소{i}" for i in range(n)], 'lat': lat, 'lon': lon})
+
+
+def brute_force(index, lat, lon):
+    """모든 장소의 거리를 계산해 (장소 번호, 거리) 를 가까운 순(같으면 번호순)으로."""
+    point = index.project([lat], [lon])[0]
+    distances = np.hypot(*(index.xy - point).T)
+    ids = np.flatnonzero(~np.isnan(distances))
+    order = np.lexsort((ids, distances[ids]))
+    return ids[order], distances[ids][order]
+
+
+class SpatialIndexTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.df = random_places(2000, rng)
+        self.index = spatial_index.SpatialIndex(self.df, 'place_name')
+        self.queries = list(zip(rng.uniform(33.1, 33.6, size=40), rng.uniform(126.1, 127.0, size=40)))
+
+    def test_radius_matches_brute_force(self):
+        for lat, lon in self.queries:
+            all_ids, all_distances = brute_force(self.index, lat, lon)
+            for radius_km in (0.5, 2.0, 7.5):
+                ids, distances = self.index.radius(lat, lon, radius_km)
+                inside = all_distances <= radius_km
+                self.assertEqual(ids.tolist(), all_ids[inside].tolist())
+                np.testing.assert_allclose(distances, all_distances[inside])
+
+    def test_nearest_matches_brute_force(self):
+        for lat, lon in self.queries:
+            all_ids, all_distances = brute_force(self.index, lat, lon)
+            for k in (1, 5, 30):
+                ids, distances = self.index.nearest(lat, lon, k)
+                self.assertEqual(ids.tolist(), all_ids[:k].tolist())
+                np.testing.assert_allclose(distances, all_distances[:k])
+            ids, _ = self.index.nearest(lat, lon, 10, max_km=3.0)
+            self.assertEqual(ids.tolist(), all_ids[all_distances <= 3.0][:10].tolist())
+
+    def test_query_outside_catalogue(self):
+        # 격자 밖(제주 바깥) 지점에서도 전체를 다 보고 가장 가까운 곳을 찾습니다.
+        all_ids, _ = brute_force(self.index, 34.5, 128.0)
+        self.assertEqual(self.index.nearest(34.5, 128.0, 3)[0].tolist(), all_ids[:3].tolist())
+        self.assertEqual(len(self.index.radius(34.5, 128.0, 5.0)[0]), 0)
+
+    def test_nearby_excludes_the_place_itself(self):
+        place = self.df.dropna(subset=['lat', 'lon']).iloc[0]
+        result = self.index.nearby(place['lat'], place['lon'], radius_km=5.0, limit=5, exclude_name=place['place_name'])
+        self.assertNotIn(place['place_name'], result['place_name'].tolist())
+        self.assertEqual(len(result), 5)
+        self.assertTrue(result[spatial_index.DISTANCE_COLUMN].is_monotonic_increasing)
+
+
+if __name__ == "__main__":
+    unittest.main()
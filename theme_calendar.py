@@ -0,0 +1,138 @@
+"""
+월 단위 테마 지표 조회용 ThemeCalendar
+
+final_themes 프레임을 (년, 월) -> 배열 슬롯으로 펼쳐 둡니다.
+슬롯 번호는 (년 - 시작년) * 12 + (월 - 1) 이므로 한 달 조회는 문자열 비교 없이 O(1)이고,
+연도별 정렬 같은 범위 조회는 NumPy 배열 연산 한 번으로 끝납니다.
+
+    calendar = theme_calendar.load_theme_calendar()
+    row = calendar[(2025, 11)]                      # dict, 없으면 KeyError
+    calendar.months(2026, order_by='관광 포화 지수')  # 2026년을 쾌적한 순으로
+"""
+import datetime
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+
+METRIC_COLUMNS = [
+    '총 입도객', '렌터카 가동률', '전세버스 가동률', '관광 포화 지수',
+    '한라산 탐방객', '웰니스 쾌적도', '골프장 내장객(도외)', '골프 쾌적도',
+]
+LABEL_COLUMNS = ['쾌적도 라벨', '웰니스 라벨', '골프 라벨']
+
+
+class ThemeCalendar:
+    def __init__(self, df):
+        dates = pd.to_datetime(df['날짜'])
+        years = dates.dt.year.to_numpy()
+        months = dates.dt.month.to_numpy()
+
+        self.start_year = int(years.min()) if len(years) else 0
+        slots = (years - self.start_year) * 12 + (months - 1)
+        size = int(slots.max()) + 1 if len(slots) else 0
+
+        self._present = np.zeros(size, dtype=bool)
+        self._present[slots] = True
+
+        self.metrics = [c for c in METRIC_COLUMNS if c in df.columns]
+        self._metric_pos = {name: i for i, name in enumerate(self.metrics)}
+        self._values = np.full((len(self.metrics), size), np.nan)
+        if self.metrics:
+            self._values[:, slots] = df[self.metrics].to_numpy(dtype=float).T
+
+        self.labels = [c for c in LABEL_COLUMNS if c in df.columns]
+        self._label_pos = {name: i for i, name in enumerate(self.labels)}
+        self._label_names = []
+        self._label_codes = np.full((len(self.labels), size), -1, dtype=np.int8)
+        for i, col in enumerate(self.labels):
+            categorical = pd.Categorical(df[col])
+            self._label_names.append(list(categorical.categories))
+            self._label_codes[i, slots] = categorical.codes
+
+    # --- 1. 단건 조회 ---
+    def _slot(self, year, month):
+        slot = (year - self.start_year) * 12 + (month - 1)
+        if 0 <= slot < len(self._present) and self._present[slot]:
+            return slot
+        return None
+
+    def _key(self, key):
+        if isinstance(key, (datetime.date, pd.Timestamp)):
+            return key.year, key.month
+        return key
+
+    def __contains__(self, key):
+        return self._slot(*self._key(key)) is not None
+
+    def __len__(self):
+        return int(self._present.sum())
+
+    def get(self, year, month):
+        """(년, 월)의 지표/라벨을 dict로 반환합니다. 데이터가 없으면 None."""
+        slot = self._slot(year, month)
+        if slot is None:
+            return None
+        row = {'년': year, '월': month, '월_라벨': f"{year}년 {month:02d}월"}
+        for name, i in self._metric_pos.items():
+            row[name] = float(self._values[i, slot])
+        for name, i in self._label_pos.items():
+            code = self._label_codes[i, slot]
+            row[name] = self._label_names[i][code] if code >= 0 else "N/A"
+        return row
+
+    def __getitem__(self, key):
+        row = self.get(*self._key(key))
+        if row is None:
+            raise KeyError(key)
+        return row
+
+    def metric(self, name, year, month, default=None):
+        slot = self._slot(year, month)
+        if slot is None:
+            return default
+        return float(self._values[self._metric_pos[name], slot])
+
+    def label(self, name, year, month, default=None):
+        slot = self._slot(year, month)
+        if slot is None or name not in self._label_pos:
+            return default
+        i = self._label_pos[name]
+        code = self._label_codes[i, slot]
+        return self._label_names[i][code] if code >= 0 else default
+
+    # --- 2. 범위 조회 (벡터화) ---
+    def _slots(self, year=None):
+        if year is None:
+            return np.flatnonzero(self._present)
+        start = (year - self.start_year) * 12
+        window = self._present[max(start, 0):max(start + 12, 0)]
+        return np.flatnonzero(window) + max(start, 0)
+
+    def months(self, year=None, order_by=None, ascending=True):
+        """(년, 월) 목록. order_by 지표가 주어지면 그 값 순서(기본: 낮을수록 쾌적 = 오름차순)로 정렬합니다."""
+        slots = self._slots(year)
+        if order_by is not None:
+            values = self._values[self._metric_pos[order_by], slots]
+            order = np.argsort(values if ascending else -values, kind='stable')
+            slots = slots[order]
+        return [(self.start_year + int(s) // 12, int(s) % 12 + 1) for s in slots]
+
+    def values(self, name, year=None):
+        """year의 월별 지표 배열 (월 순서)."""
+        return self._values[self._metric_pos[name], self._slots(year)]
+
+
+_calendar_cache = {'source': None, 'calendar': None}
+
+
+def load_theme_calendar():
+    """data_loader의 final_themes가 바뀔 때만 다시 만드는 프로세스 공용 ThemeCalendar."""
+    df = data_loader.load_final_themes()
+    if df.empty:
+        return None
+    if _calendar_cache['source'] is not df:
+        _calendar_cache['calendar'] = ThemeCalendar(df)
+        _calendar_cache['source'] = df
+    return _calendar_cache['calendar']
@@ -0,0 +1,176 @@
+"""
+관광 포화/웰니스/골프 쾌적도 지수의 고정(frozen) 파라미터와 증분 갱신
+
+노트북(캘린더_전처리/캘린더_시각화)은 전체 기간(실측 + 예측)에 MinMaxScaler를 새로 맞추고,
+페이지는 pd.qcut으로 5분위 라벨을 매번 다시 계산했습니다. 그래서 한 달이 추가되면
+과거 모든 달의 지수와 라벨이 조용히 바뀌었습니다.
+
+이 모듈은 스케일러(min/max)와 5분위 경계값을 data/golden_compass_theme_params.json에
+고정해 두고, 새 달은 그 파라미터로만 계산합니다. 라벨은 저장된 경계값에 대한
+np.searchsorted로 매기므로 월별 갱신은 새 행 수에만 비례하고 결과가 재현됩니다.
+라벨은 읽을 때 data_loader가 매기므로 CSV에는 지수까지만 저장하고 라벨 컬럼은 쓰지 않습니다.
+
+사용법:
+    python theme_index.py freeze                 # 현재 final_themes로 파라미터 재적합 (명시적, 주기적)
+    python theme_index.py refresh new_months.csv # 새 달(또는 예측을 대체할 실측) 반영
+"""
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+import data_loader
+
+# 원본 지표 -> 정규화 컬럼 (MinMaxScaler 대상)
+SCALED_COLUMNS = {
+    '총 입도객': '총 입도객_norm',
+    '렌터카 가동률': '렌터카 가동률_norm',
+    '전세버스 가동률': '전세버스 가동률_norm',
+    '한라산 탐방객': '한라산_norm',
+    '골프장 내장객(도외)': '골프_norm',
+}
+
+# 지수 컬럼 -> 라벨 컬럼 (5분위)
+LABEL_COLUMNS = {
+    '관광 포화 지수': '쾌적도 라벨',
+    '웰니스 쾌적도': '웰니스 라벨',
+    '골프 쾌적도': '골프 라벨',
+}
+
+QUANTILES = [0.2, 0.4, 0.6, 0.8]
+
+
+# --- 1. 파라미터 저장/로드 ---
+def params_path():
+    return data_loader.data_file(data_loader.THEME_PARAMS_FILE)
+
+
+def load_params():
+    """저장된 파라미터를 반환합니다. 파일이 없으면 None."""
+    path = params_path()
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_params(params):
+    with open(params_path(), 'w', encoding='utf-8') as f:
+        json.dump(params, f, ensure_ascii=False, indent=2)
+
+
+def fit_params(df):
+    """df 전체로 스케일러 min/max와 5분위 경계값을 적합합니다. (qcut과 같은 선형 보간 분위수)"""
+    scalers = {}
+    for col in SCALED_COLUMNS:
+        if col in df.columns:
+            scalers[col] = {'min': float(df[col].min()), 'max': float(df[col].max())}
+
+    scored = compute_scores(df, {'scalers': scalers})
+    edges = {}
+    for col in LABEL_COLUMNS:
+        if col in scored.columns:
+            edges[col] = [float(v) for v in np.quantile(scored[col].to_numpy(dtype=float), QUANTILES)]
+
+    return {
+        'fitted_through': df['날짜'].max().strftime('%Y-%m-%d'),
+        'scalers': scalers,
+        'label_edges': edges,
+        'labels': data_loader.LABELS_5,
+    }
+
+
+# --- 2. 지수/라벨 계산 ---
+def compute_scores(df, params):
+    """고정된 스케일러로 정규화 컬럼과 관광 포화/웰니스/골프 지수를 계산합니다."""
+    df = df.copy()
+    for col, norm_col in SCALED_COLUMNS.items():
+        scaler = params['scalers'].get(col)
+        if scaler is None or col not in df.columns:
+            continue
+        span = scaler['max'] - scaler['min']
+        df[norm_col] = (df[col] - scaler['min']) / span if span else 0.0
+
+    base_norms = ['총 입도객_norm', '렌터카 가동률_norm', '전세버스 가동률_norm']
+    if all(c in df.columns for c in base_norms):
+        df['관광 포화 지수'] = df[base_norms].mean(axis=1)
+    if '한라산_norm' in df.columns:
+        df['웰니스 쾌적도'] = (df['관광 포화 지수'] + df['한라산_norm']) / 2
+    if '골프_norm' in df.columns:
+        df['골프 쾌적도'] = df['관광 포화 지수'] - df['골프_norm']
+    return df
+
+
+def assign_labels(values, edges, labels=None):
+    """경계값 기준 5분위 라벨. qcut처럼 오른쪽 닫힌 구간 (e[i-1], e[i]]."""
+    labels = labels or data_loader.LABELS_5
+    values = np.asarray(values, dtype=float)
+    codes = np.searchsorted(np.asarray(edges, dtype=float), values, side='left')
+    codes[np.isnan(values)] = -1
+    return pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+
+
+def apply_labels(df, params):
+    df = df.copy()
+    for col, label_col in LABEL_COLUMNS.items():
+        edges = params['label_edges'].get(col)
+        if edges is not None and col in df.columns:
+            df[label_col] = assign_labels(df[col], edges, params.get('labels'))
+    return df
+
+
+# --- 3. 증분 갱신 ---
+def write_themes(df, path):
+    """라벨 컬럼을 빼고 저장합니다. (예전 노트북 라벨과 LABELS_5가 한 파일에 섞이지 않도록)"""
+    df = df.drop(columns=list(LABEL_COLUMNS.values()), errors='ignore')
+    df['날짜'] = df['날짜'].dt.strftime('%Y-%m-%d')
+    df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+def refresh(new_rows, params=None):
+    """
+    new_rows(날짜 + 원본 지표 컬럼)를 final_themes에 반영합니다.
+    이미 있는 달(예: 예측값)은 교체하고, 없는 달은 추가합니다. 기존 행은 다시 계산하지 않습니다.
+    """
+    params = params or load_params()
+    if params is None:
+        raise RuntimeError("고정 파라미터가 없습니다. 먼저 'python theme_index.py freeze'를 실행하세요.")
+
+    path = data_loader.data_file(data_loader.FINAL_THEMES_FILE)
+    df = pd.read_csv(path, encoding='utf-8-sig', parse_dates=['날짜'])
+
+    new_rows = new_rows.copy()
+    new_rows['날짜'] = pd.to_datetime(new_rows['날짜'])
+    new_rows['년'] = new_rows['날짜'].dt.year
+    new_rows['월'] = new_rows['날짜'].dt.month
+    new_rows['월_str'] = new_rows['날짜'].dt.strftime('%m월')
+    new_rows = compute_scores(new_rows, params)
+
+    df = df[~df['날짜'].isin(new_rows['날짜'])]
+    df = pd.concat([df, new_rows[[c for c in df.columns if c in new_rows.columns]]], ignore_index=True)
+    write_themes(df.sort_values(by='날짜'), path)
+    return len(new_rows)
+
+
+def freeze():
+    """현재 final_themes 전체로 파라미터를 다시 적합하고 모든 행의 지수를 재계산합니다."""
+    path = data_loader.data_file(data_loader.FINAL_THEMES_FILE)
+    df = pd.read_csv(path, encoding='utf-8-sig', parse_dates=['날짜'])
+    params = fit_params(df)
+    write_themes(compute_scores(df, params), path)
+    save_params(params)
+    return params
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ['freeze']:
+        params = freeze()
+        print(f"파라미터 고정 완료 (기준: {params['fitted_through']}) -> {params_path()}")
+    elif sys.argv[1:2] == ['refresh'] and len(sys.argv) == 3:
+        count = refresh(pd.read_csv(sys.argv[2], encoding='utf-8-sig'))
+        print(f"{count}개 월 반영 완료 -> {data_loader.FINAL_THEMES_FILE}")
+    else:
+        print("usage: python theme_index.py freeze | refresh <new_months.csv>")
+        sys.exit(2)
@@ -0,0 +1,152 @@
+"""
+일정 장소 간 자동차 이동 거리/시간 행렬
+
+하루 일정의 장소 목록에 대해 필요한 (출발, 도착) 쌍만 골라, 아직 모르는 쌍을 동시에 Kakao 길찾기로
+조회합니다. 결과는 반올림 좌표(ROUND_DIGITS 자리, 약 10m) 키로 프로세스 메모리에 최근 MAX_CACHE_ENTRIES 쌍만
+LRU로 두고 (디스크 공용 캐시는 kakao_api/kakao_cache), API가 실패하면 직선거리(haversine) 기반 추정치를 씁니다.
+추정치는 캐시하지 않으므로 API가 회복되면 다음 계산에서 실제 값으로 바뀝니다.
+
+    matrix = travel_matrix.build([(lat, lon), ...])           # 모든 쌍
+    matrix = travel_matrix.build(points, travel_matrix.consecutive_pairs(len(points)))
+    matrix = travel_matrix.cached_matrix(points)             # API 없이 캐시된 쌍 + 나머지는 추정치 (방문 순서 정하기용)
+    matrix.duration_min[i, j], matrix.estimated[i, j]
+"""
+import math
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import kakao_api
+
+ROUND_DIGITS = 4
+MAX_WORKERS = 8
+EARTH_RADIUS_KM = 6371.0
+# 직선거리 -> 도로거리 보정 계수와 제주 평균 주행 속도 (추정치용)
+ROAD_FACTOR = 1.3
+FALLBACK_SPEED_KMH = 40.0
+MAX_CACHE_ENTRIES = 4096
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _key(point):
+    return round(float(point[0]), ROUND_DIGITS), round(float(point[1]), ROUND_DIGITS)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def estimate(origin, destination):
+    """(거리 km, 소요 분) 직선거리 기반 추정."""
+    km = haversine_km(origin[0], origin[1], destination[0], destination[1]) * ROAD_FACTOR
+    return km, km / FALLBACK_SPEED_KMH * 60
+
+
+def consecutive_pairs(n):
+    return [(i, i + 1) for i in range(n - 1)]
+
+
+def all_pairs(n):
+    return [(i, j) for i in range(n) for j in range(n) if i != j]
+
+
+class TravelMatrix:
+    def __init__(self, points):
+        n = len(points)
+        self.points = [_key(p) for p in points]
+        self.distance_km = np.zeros((n, n))
+        self.duration_min = np.zeros((n, n))
+        self.estimated = np.zeros((n, n), dtype=bool)
+        self.known = np.eye(n, dtype=bool)
+
+    def leg(self, i, j):
+        """(거리 km, 소요 분, 추정 여부)."""
+        return float(self.distance_km[i, j]), float(self.duration_min[i, j]), bool(self.estimated[i, j])
+
+
+def _cache_get(key):
+    """캐시된 (거리 km, 소요 분) 또는 None. 찾은 항목은 가장 최근 사용으로 옮깁니다."""
+    with _cache_lock:
+        value = _cache.get(key)
+        if value is not None:
+            _cache.move_to_end(key)
+        return value
+
+
+def _cache_put(key, value):
+    with _cache_lock:
+        _cache[key] = value
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def _fetch(pair_key):
+    (o_lat, o_lon), (d_lat, d_lon) = pair_key
+    try:
+        return kakao_api.driving_summary(o_lon, o_lat, d_lon, d_lat)
+    except kakao_api.KakaoError:
+        return None
+
+
+def cached_matrix(points):
+    """
+    모든 쌍의 행렬을 API 호출 없이 채웁니다. 이미 길찾기로 조회해 캐시에 있는 쌍은 실제 값,
+    나머지 쌍만 쌍별로 직선거리 기반 추정치를 씁니다.
+    """
+    matrix = TravelMatrix(points)
+    n = len(points)
+    for i in range(n):
+        for j in range(n):
+            origin, destination = matrix.points[i], matrix.points[j]
+            if i == j or origin == destination:
+                continue
+            value = _cache_get((origin, destination))
+            estimated = value is None
+            distance, duration = estimate(origin, destination) if estimated else value
+            matrix.distance_km[i, j] = distance
+            matrix.duration_min[i, j] = duration
+            matrix.estimated[i, j] = estimated
+    matrix.known[:] = True
+    return matrix
+
+
+def build(points, pairs=None, max_workers=MAX_WORKERS):
+    """points [(lat, lon)] 의 pairs(기본: 모든 순서쌍) 이동 거리/시간 행렬."""
+    matrix = TravelMatrix(points)
+    pairs = all_pairs(len(points)) if pairs is None else pairs
+
+    pair_keys = {}
+    for i, j in pairs:
+        origin, destination = matrix.points[i], matrix.points[j]
+        if origin != destination:
+            pair_keys.setdefault((origin, destination), []).append((i, j))
+        else:
+            matrix.known[i, j] = True
+
+    with _cache_lock:
+        missing = [key for key in pair_keys if key not in _cache]
+    fetched = {}
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as pool:
+            fetched = dict(zip(missing, pool.map(_fetch, missing)))
+        for key, value in fetched.items():
+            if value is not None:
+                _cache_put(key, value)
+
+    for key, cells in pair_keys.items():
+        value = fetched[key] if key in fetched else _cache_get(key)
+        estimated = value is None
+        distance, duration = estimate(*key) if estimated else value
+        for i, j in cells:
+            matrix.distance_km[i, j] = distance
+            matrix.duration_min[i, j] = duration
+            matrix.estimated[i, j] = estimated
+            matrix.known[i, j] = True
+    return matrix